@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark for tweet extraction from the DOM.
+
+Compares the harvest extractor the repository uses (HARVEST_ARTICLES_JS,
+one evaluate per round, plus build_tweets) against the original
+per-element extractor, kept here as a reference copy, on a synthetic
+timeline rendered with page.set_content(), so no X account or network
+access is needed.
+
+Usage:
+    python benchmark_extraction.py [rounds]
+"""
+
+import asyncio
+import re
+import statistics
+import sys
+import time
+from typing import List
+from playwright.async_api import Page, async_playwright
+from src.domain.models import Tweet
+from src.infrastructure.tweet_extraction import HARVEST_ARTICLES_JS, TWEET_ARTICLE_SELECTOR, build_tweets
+
+TIMELINE_SIZES = [10, 50, 100]
+
+
+def build_timeline_html(size: int) -> str:
+    """Render `size` articles with the same data-testid structure X uses."""
+    articles = []
+    for i in range(size):
+        tweet_id = 1800000000000000000 + i
+        articles.append(f"""
+        <article data-testid="tweet">
+          <div data-testid="User-Name">
+            <a href="/bench_user">Bench User</a>
+            <a href="/bench_user/status/{tweet_id}"><time datetime="2024-01-01T12:{i % 60:02d}:00.000Z">Jan 1</time></a>
+          </div>
+          <div data-testid="tweetText" lang="en" dir="auto">Synthetic tweet number {i} with some text @someone</div>
+          <div role="group">
+            <button data-testid="reply" aria-label="{i} Replies. Reply"></button>
+            <button data-testid="retweet" aria-label="{i * 2} reposts. Repost"></button>
+            <button data-testid="like" aria-label="{i * 3} Likes. Like"></button>
+          </div>
+          <a href="/bench_user/status/{tweet_id}/analytics">Views</a>
+        </article>""")
+    return f"<html><body><main>{''.join(articles)}</main></body></html>"
+
+
+async def harvest(page: Page, count: int) -> List[Tweet]:
+    """One harvest round, as PlaywrightTwitterRepository._harvest_timeline runs it."""
+    raw_articles = await page.evaluate(HARVEST_ARTICLES_JS, TWEET_ARTICLE_SELECTOR)
+    return build_tweets(raw_articles, count)
+
+
+async def extract_per_element(page: Page, count: int) -> List[Tweet]:
+    """The original extractor: several Playwright round trips per article."""
+    tweets = []
+    for element in (await page.locator(TWEET_ARTICLE_SELECTOR).all())[:count]:
+        text = ""
+        for selector in ('[data-testid="tweetText"]', 'div[lang]', 'div[dir="auto"][lang]'):
+            text_element = element.locator(selector).first
+            if await text_element.count() > 0:
+                text = await text_element.inner_text()
+                if text:
+                    break
+
+        tweet_id = username = ""
+        for link in await element.locator('a[href*="/status/"]').all():
+            match = re.search(r'/([^/]+)/status/(\d+)', await link.get_attribute("href") or "")
+            if match:
+                username, tweet_id = match.group(1), match.group(2)
+                break
+
+        if text and tweet_id:
+            tweets.append(Tweet(
+                id=tweet_id,
+                text=text.strip(),
+                author_username=username,
+                url=f"https://x.com/{username}/status/{tweet_id}"
+            ))
+    return tweets
+
+
+async def reset_harvest(page: Page) -> None:
+    """Clear the tags the harvest script leaves, so the next round re-reads every article."""
+    await page.evaluate("() => document.querySelectorAll('[data-harvested]').forEach(a => a.removeAttribute('data-harvested'))")
+
+
+async def time_call(func, rounds: int, page: Page) -> float:
+    """Return the median wall time of `func` in milliseconds."""
+    samples = []
+    for _ in range(rounds):
+        await reset_harvest(page)
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def run_benchmark(rounds: int) -> None:
+    """Run both extractors against each timeline size and print a table."""
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+
+        print(f"{'tweets':>8} {'harvest (ms)':>13} {'per-element (ms)':>18} {'speedup':>9}")
+        print("-" * 51)
+
+        for size in TIMELINE_SIZES:
+            await page.set_content(build_timeline_html(size))
+
+            harvested = await harvest(page, size)
+            legacy = await extract_per_element(page, size)
+            assert [t.id for t in harvested] == [t.id for t in legacy], "extractors disagree"
+
+            harvest_ms = await time_call(lambda: harvest(page, size), rounds, page)
+            legacy_ms = await time_call(lambda: extract_per_element(page, size), rounds, page)
+
+            print(f"{size:>8} {harvest_ms:>13.1f} {legacy_ms:>18.1f} {legacy_ms / harvest_ms:>8.1f}x")
+
+        await browser.close()
+
+
+def main():
+    """Main entry point."""
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"Extraction benchmark ({rounds} rounds per size, median reported)")
+    print()
+    asyncio.run(run_benchmark(rounds))
+
+
+if __name__ == "__main__":
+    main()
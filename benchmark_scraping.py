@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+End-to-end scraping benchmark against the offline fake X site.
+
+Starts fake_x_server.py in a subprocess, points TWITTER_BASE_URL at it and
+drives PlaywrightTwitterRepository through its real flows: profile and
+mentions reads in both capture modes (network and dom) for several
+timeline sizes, then the reply, quote, repost and post flows. Reports per
+scenario:
+
+- Median and p95 latency per call
+- Tweets/sec (tweets returned over the wall time of the reads)
+- Chromium RSS (all browser processes) and this process's peak RSS
+
+Everything runs locally with a fixed seed, so extractor or readiness
+changes can be compared run to run on a plain Linux box. Memory figures
+come from /proc and are Linux-only.
+
+Usage:
+    python benchmark_scraping.py [--rounds 3] [--counts 20,100,400]
+    python benchmark_scraping.py --modes dom --latency-ms 150 --jitter-ms 100
+    python benchmark_scraping.py --virtualize 0 --skip-writes
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+# The browser checks these when it starts; set them before src is imported
+# so a real session, profile or CDP browser is never used
+AUTH_STATE_FILE = Path(tempfile.gettempdir()) / "fake_x_auth.json"
+os.environ.update({
+    "AUTH_STATE_PATH": str(AUTH_STATE_FILE),
+    "TWITTER_ACCOUNTS": "",
+    "BROWSER_USER_DATA_DIR": "",
+    "BROWSER_CDP_URL": "",
+    "BROWSER_HEADLESS": "true"
+})
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import resource  # noqa: E402
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+import urllib.request  # noqa: E402
+from dataclasses import dataclass, field  # noqa: E402
+from typing import Awaitable, Callable, Dict, List  # noqa: E402
+from fake_x_server import FakeXSettings  # noqa: E402
+from src.config import config  # noqa: E402
+from src.infrastructure.browser_manager import BrowserManager  # noqa: E402
+from src.infrastructure.twitter_repository import PlaywrightTwitterRepository  # noqa: E402
+
+PROFILE = "bench_user"
+SERVER_START_TIMEOUT = 15
+
+
+@dataclass
+class ScenarioResult:
+    """Timings of one scenario (one flow, mode and size)."""
+
+    name: str
+    latencies_ms: List[float] = field(default_factory=list)
+    tweets: int = 0
+    expected_tweets: int = 0
+    chromium_mb: float = 0.0
+
+    @property
+    def tweets_per_second(self) -> float:
+        seconds = sum(self.latencies_ms) / 1000
+        return self.tweets / seconds if seconds else 0.0
+
+
+def percentile(samples: List[float], pct: int) -> float:
+    """Nearest-rank percentile (the only sample for a single call)."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def descendant_rss_mb(pid: int) -> float:
+    """Resident memory of every descendant of `pid` (the Playwright driver and Chromium)."""
+    children: Dict[int, List[int]] = {}
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            # The command name is parenthesized and may contain spaces
+            parent = int(stat.rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry.name))
+
+    total_kb = 0
+    pending = list(children.get(pid, []))
+    while pending:
+        child = pending.pop()
+        pending.extend(children.get(child, []))
+        try:
+            for line in Path(f"/proc/{child}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+def peak_python_rss_mb() -> float:
+    """Peak resident memory of this process (ru_maxrss is in KB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def start_fake_x(port: int, settings: FakeXSettings) -> subprocess.Popen:
+    """Run fake_x_server.py in a subprocess and wait until it answers."""
+    command = [
+        sys.executable, str(Path(__file__).parent / "fake_x_server.py"),
+        "--port", str(port),
+        "--timeline-length", str(settings.timeline_length),
+        "--page-size", str(settings.page_size),
+        "--virtualize", str(settings.virtualize),
+        "--latency-ms", str(settings.latency_ms),
+        "--jitter-ms", str(settings.jitter_ms),
+        "--seed", str(settings.seed)
+    ]
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            fetch_server_stats(port)
+            return server
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError(f"fake_x_server.py did not start on port {port}")
+
+
+def fetch_server_stats(port: int) -> Dict[str, int]:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/fake_x/stats", timeout=2) as response:
+        return json.loads(response.read())
+
+
+async def run_scenario(
+    name: str,
+    call: Callable[[], Awaitable],
+    rounds: int,
+    expected_tweets: int = 0
+) -> ScenarioResult:
+    """Call `call` `rounds` times, timing each call and counting returned tweets."""
+    result = ScenarioResult(name=name)
+    for _ in range(rounds):
+        start = time.perf_counter()
+        outcome = await call()
+        result.latencies_ms.append((time.perf_counter() - start) * 1000)
+        if isinstance(outcome, list):
+            result.tweets += len(outcome)
+            result.expected_tweets += expected_tweets
+    result.chromium_mb = descendant_rss_mb(os.getpid())
+    return result
+
+
+def print_result(result: ScenarioResult) -> None:
+    short = ""
+    if result.tweets < result.expected_tweets:
+        short = f"  (short: {result.tweets}/{result.expected_tweets})"
+    tweets_per_second = f"{result.tweets_per_second:>9.0f}" if result.expected_tweets else f"{'-':>9}"
+    print(
+        f"{result.name:<30} {statistics.median(result.latencies_ms):>10.0f} "
+        f"{percentile(result.latencies_ms, 95):>9.0f} {tweets_per_second} "
+        f"{result.chromium_mb:>12.0f}{short}"
+    )
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    """Run every scenario against the fake site and print a table."""
+    manager = BrowserManager()
+    await manager.start()
+    repo = PlaywrightTwitterRepository(manager)
+
+    print(f"{'scenario':<30} {'median ms':>10} {'p95 ms':>9} {'tweets/s':>9} {'chromium MB':>12}")
+    print("-" * 74)
+
+    try:
+        for mode in args.modes:
+            config.TWITTER_CAPTURE_MODE = mode
+            for count in args.counts:
+                expected = min(count, args.timeline_length)
+                print_result(await run_scenario(
+                    f"read_last_tweets {mode} {count}",
+                    lambda: repo.read_last_tweets(PROFILE, count),
+                    args.rounds,
+                    expected
+                ))
+                print_result(await run_scenario(
+                    f"read_last_mentions {mode} {count}",
+                    lambda: repo.read_last_mentions(count),
+                    args.rounds,
+                    expected
+                ))
+
+        if not args.skip_writes:
+            target = (await repo.read_last_tweets(PROFILE, 1))[0].id
+            print_result(await run_scenario("post_tweet", lambda: repo.post_tweet("benchmark post"), args.rounds))
+            print_result(await run_scenario("reply_to_tweet", lambda: repo.reply_to_tweet(target, "benchmark reply"), args.rounds))
+            print_result(await run_scenario("quote_tweet", lambda: repo.quote_tweet(target, "benchmark quote"), args.rounds))
+            print_result(await run_scenario("retweet", lambda: repo.retweet(target), args.rounds))
+    finally:
+        await manager.stop()
+
+    print()
+    print(f"Peak Python RSS: {peak_python_rss_mb():.0f} MB")
+
+
+def main():
+    """Main entry point."""
+    defaults = FakeXSettings()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--counts", default="20,100,400", help="comma-separated tweets per read")
+    parser.add_argument("--modes", default="network,dom", help="comma-separated TWITTER_CAPTURE_MODE values")
+    parser.add_argument("--port", type=int, default=8780)
+    parser.add_argument("--timeline-length", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=defaults.page_size)
+    parser.add_argument("--virtualize", type=int, default=defaults.virtualize)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--skip-writes", action="store_true")
+    args = parser.parse_args()
+    args.counts = [int(count) for count in args.counts.split(",")]
+    args.modes = [mode.strip() for mode in args.modes.split(",")]
+
+    settings = FakeXSettings(
+        timeline_length=args.timeline_length,
+        page_size=args.page_size,
+        virtualize=args.virtualize,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms
+    )
+    AUTH_STATE_FILE.write_text(json.dumps({"cookies": [], "origins": []}))
+    config.TWITTER_BASE_URL = f"http://127.0.0.1:{args.port}"
+
+    print(f"Scraping benchmark ({args.rounds} rounds per scenario, {settings})")
+    print()
+    server = start_fake_x(args.port, settings)
+    try:
+        asyncio.run(run_benchmark(args))
+        print(f"Fake X counters: {fetch_server_stats(args.port)}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
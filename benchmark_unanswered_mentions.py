@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the unanswered-mentions query.
+
+Seeds a synthetic mentions collection (1M documents by default) into a
+separate database and compares the old "over-fetch limit*3 and dedup in
+Python" query with the per-author aggregation used by
+MongoRepository.get_unanswered_mentions. Read-only after seeding: nothing
+is marked ignored.
+
+A few "flooding" authors own the newest mentions, which is exactly the
+case where the old query returned fewer than `limit` distinct authors.
+
+Usage:
+    python benchmark_unanswered_mentions.py [--docs 1000000] [--limit 20] [--rounds 5]
+    python benchmark_unanswered_mentions.py --skip-seed     # reuse the seeded data
+    python benchmark_unanswered_mentions.py --drop          # remove the benchmark database
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from src.config import config
+from src.infrastructure.mongo_repository import MongoRepository
+
+BATCH_SIZE = 10_000
+FLOODERS = 10
+FLOOD_SHARE = 0.2  # Share of the newest mentions written by flooders
+ACCOUNT = "default"  # Bot account every seeded mention belongs to
+
+
+def build_mention(index: int, author: str, seen_at: datetime) -> dict:
+    """Build a mention document shaped like Mention.to_dict()."""
+    tweet_id = str(1_900_000_000_000_000_000 + index)
+    return {
+        "idTweet": str(uuid.uuid4()),
+        "tweetId": tweet_id,
+        "text": f"@bot synthetic mention {index}",
+        "authorUsername": author,
+        "createdAt": seen_at,
+        "url": f"https://x.com/{author}/status/{tweet_id}",
+        "type": "mention",
+        "repliedTo": random.random() < 0.3,
+        "repostedByUs": False,
+        "ignored": random.random() < 0.2,
+        "firstSeenAt": seen_at,
+        "lastUpdatedAt": seen_at,
+        "mentionedUsers": ["@bot"],
+        "account": ACCOUNT
+    }
+
+
+async def seed(db, docs: int, authors: int) -> None:
+    """Insert `docs` mentions, newest last, with flooders dominating the newest slice."""
+    await db.mentions.drop()
+    start = datetime.utcnow() - timedelta(days=365)
+    step = timedelta(days=365) / docs
+    flood_from = int(docs * (1 - FLOOD_SHARE))
+
+    print(f"Seeding {docs:,} mentions from {authors:,} authors into {db.name}.mentions ...")
+    began = time.perf_counter()
+    for batch_start in range(0, docs, BATCH_SIZE):
+        batch = []
+        for i in range(batch_start, min(batch_start + BATCH_SIZE, docs)):
+            if i >= flood_from and random.random() < 0.9:
+                author = f"flooder_{random.randrange(FLOODERS)}"
+            else:
+                author = f"user_{random.randrange(authors)}"
+            batch.append(build_mention(i, author, start + step * i))
+        await db.mentions.insert_many(batch, ordered=False)
+    print(f"Seeded in {time.perf_counter() - began:.1f}s")
+
+
+async def create_indexes(db) -> None:
+    """Create the same mentions indexes as MongoRepository.initialize()."""
+    await db.mentions.create_index([("tweetId", 1), ("account", 1)], unique=True)
+    await db.mentions.create_index("idTweet", unique=True)
+    await db.mentions.create_index([("account", 1), ("repliedTo", 1), ("ignored", 1), ("firstSeenAt", -1)])
+    await db.mentions.create_index([("authorUsername", 1), ("ignored", 1)])
+    await db.mentions.create_index(
+        [("authorUsername", 1), ("account", 1), ("repliedTo", 1), ("ignored", 1), ("firstSeenAt", -1)]
+    )
+
+
+async def legacy_query(db, limit: int) -> int:
+    """Old approach: fetch limit*3 newest, keep the first per author in Python."""
+    query = {"account": ACCOUNT, "repliedTo": False, "ignored": False}
+    cursor = db.mentions.find(query).sort("firstSeenAt", -1).limit(limit * 3)
+    seen = set()
+    async for doc in cursor:
+        if len(seen) >= limit:
+            break
+        seen.add(doc["authorUsername"])
+    return len(seen)
+
+
+async def aggregation_query(db, limit: int) -> int:
+    """New approach: the per-author aggregation pipeline."""
+    pipeline = MongoRepository.unanswered_mentions_pipeline(limit, ACCOUNT)
+    groups = [g async for g in db.mentions.aggregate(pipeline, allowDiskUse=True)]
+    return len(groups)
+
+
+async def measure(func, db, limit: int, rounds: int):
+    """Return (median ms, p95 ms, distinct authors) over `rounds` runs."""
+    samples = []
+    authors = 0
+    for _ in range(rounds):
+        began = time.perf_counter()
+        authors = await func(db, limit)
+        samples.append((time.perf_counter() - began) * 1000)
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return statistics.median(samples), p95, authors
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--authors", type=int, default=50_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--db", default=f"{config.MONGO_DB}_bench")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--drop", action="store_true")
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(config.get_mongo_uri())
+    db = client[args.db]
+
+    try:
+        if args.drop:
+            await client.drop_database(args.db)
+            print(f"Dropped {args.db}")
+            return
+
+        if not args.skip_seed:
+            await seed(db, args.docs, args.authors)
+        await create_indexes(db)
+
+        print(f"\nlimit={args.limit}, rounds={args.rounds}")
+        print(f"{'Query':<28}{'median ms':>12}{'p95 ms':>12}{'authors':>10}")
+        print("-" * 62)
+        for name, func in (("find limit*3 + Python dedup", legacy_query),
+                           ("aggregation per author", aggregation_query)):
+            median, p95, authors = await measure(func, db, args.limit, args.rounds)
+            print(f"{name:<28}{median:>12.1f}{p95:>12.1f}{authors:>10}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -86,6 +86,13 @@ try {
     print('✗ Error creating compound index: ' + e.message);
 }
 
+try {
+    db.mentions.createIndex({ "authorUsername": 1, "repliedTo": 1, "ignored": 1, "firstSeenAt": -1 });
+    print('✓ Created compound index on mentions.authorUsername + repliedTo + ignored + firstSeenAt');
+} catch (e) {
+    print('✗ Error creating compound index: ' + e.message);
+}
+
 // ============================================
 // BLOCKED_USERS COLLECTION INDEXES
 // ============================================
@@ -105,6 +112,49 @@ try {
     print('✗ Error creating index: ' + e.message);
 }
 
+// ============================================
+// AUTHOR_STATS COLLECTION INDEXES
+// ============================================
+print('\nCreating indexes for author_stats collection...');
+
+try {
+    db.author_stats.createIndex({ "username": 1 }, { unique: true });
+    print('✓ Created unique index on author_stats.username');
+} catch (e) {
+    print('✗ Error creating index on author_stats.username: ' + e.message);
+}
+
+// ============================================
+// SYNC_STATE COLLECTION INDEXES
+// ============================================
+print('\nCreating indexes for sync_state collection...');
+
+try {
+    db.sync_state.createIndex({ "source": 1 }, { unique: true });
+    print('✓ Created unique index on sync_state.source');
+} catch (e) {
+    print('✗ Error creating index on sync_state.source: ' + e.message);
+}
+
+// ============================================
+// JOBS COLLECTION INDEXES
+// ============================================
+print('\nCreating indexes for jobs collection...');
+
+try {
+    db.jobs.createIndex({ "jobId": 1 }, { unique: true });
+    print('✓ Created unique index on jobs.jobId');
+} catch (e) {
+    print('✗ Error creating index on jobs.jobId: ' + e.message);
+}
+
+try {
+    db.jobs.createIndex({ "status": 1, "createdAt": -1 });
+    print('✓ Created compound index on jobs.status + createdAt');
+} catch (e) {
+    print('✗ Error creating compound index: ' + e.message);
+}
+
 // ============================================
 // ACTIONS COLLECTION INDEXES
 // ============================================
@@ -142,6 +192,15 @@ printjson(db.mentions.getIndexes());
 print('\nblocked_users collection indexes:');
 printjson(db.blocked_users.getIndexes());
 
+print('\nauthor_stats collection indexes:');
+printjson(db.author_stats.getIndexes());
+
+print('\nsync_state collection indexes:');
+printjson(db.sync_state.getIndexes());
+
+print('\njobs collection indexes:');
+printjson(db.jobs.getIndexes());
+
 print('\nactions collection indexes:');
 printjson(db.actions.getIndexes());
 
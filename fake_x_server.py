@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Offline fake X site for end-to-end scraping benchmarks.
+
+Serves profile, notifications/mentions, status and home pages built from
+fixtures/fake_x (an HTML template plus the client script) with the same
+data-testid structure as x.com. Timelines are loaded page by page from
+GraphQL endpoints shaped like X's (UserTweets, NotificationsTimeline,
+HomeTimeline), so both TWITTER_CAPTURE_MODE=network and =dom work against
+it, and the CreateTweet/CreateRetweet mutations answer the reply, quote,
+repost and post flows.
+
+Timelines are generated deterministically: the same settings give the
+same tweets on every run, which keeps extractor comparisons reproducible.
+
+Point TWITTER_BASE_URL at it (benchmark_scraping.py does this for you):
+    python fake_x_server.py --port 8780 --timeline-length 500 --latency-ms 50
+    TWITTER_BASE_URL=http://127.0.0.1:8780 python run_rest_api.py
+"""
+
+import argparse
+import asyncio
+import html
+import json
+import random
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, List, Optional
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "fake_x"
+
+# Fixed query IDs; the repository only looks at the operation name
+QUERY_IDS = {
+    "UserTweets": "fakeUserTweets0001",
+    "NotificationsTimeline": "fakeNotifications01",
+    "HomeTimeline": "fakeHomeTimeline001",
+    "CreateTweet": "fakeCreateTweet0001",
+    "CreateRetweet": "fakeCreateRetweet01"
+}
+
+TWITTER_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+# Timeline statuses count down from here (per-timeline offset added);
+# tweets created through the mutations count up from NEW_TWEET_ID_BASE
+TIMELINE_ID_BASE = 1_800_000_000_000_000_000
+NEW_TWEET_ID_BASE = 1_950_000_000_000_000_000
+
+# 1x1 transparent PNG used as every avatar (an image request for the resource blocker)
+AVATAR_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6300010000000500010d0a2db40000000049454e44ae426082"
+)
+
+
+@dataclass
+class FakeXSettings:
+    """Shape of the generated timelines and how slowly the site answers."""
+
+    timeline_length: int = 500  # Statuses per timeline before it ends
+    page_size: int = 20  # Statuses per GraphQL page
+    virtualize: int = 30  # Articles kept in the DOM (0 keeps every article)
+    latency_ms: float = 50  # Added to every page load and GraphQL call
+    jitter_ms: float = 0  # Random extra latency, uniform in [0, jitter_ms]
+    bot_username: str = "bench_bot"  # Account the mentions timeline mentions
+    seed: int = 1
+
+
+@dataclass
+class FakeXState:
+    """Counters and the writes received, exposed at /fake_x/stats."""
+
+    page_loads: int = 0
+    graphql_queries: int = 0
+    created_tweets: List[Dict[str, Any]] = field(default_factory=list)
+    retweets: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page_loads": self.page_loads,
+            "graphql_queries": self.graphql_queries,
+            "created_tweets": len(self.created_tweets),
+            "retweets": len(self.retweets)
+        }
+
+
+class FakeTimelines:
+    """Deterministic timelines in X's GraphQL result format."""
+
+    def __init__(self, settings: FakeXSettings):
+        self.settings = settings
+        self._now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def page(self, timeline: str, author: Optional[str], cursor: Optional[str], count: int) -> Dict[str, Any]:
+        """
+        One page of a timeline as timeline instructions.
+
+        Args:
+            timeline: "profile", "mentions" or "home"
+            author: Profile owner (profile timelines only)
+            cursor: Offset returned as the previous page's bottom cursor
+            count: Statuses requested
+        """
+        start = int(cursor) if cursor and cursor.isdigit() else 0
+        end = min(start + min(count, self.settings.page_size), self.settings.timeline_length)
+        entries = [
+            self._entry(self.result(timeline, author, index))
+            for index in range(start, end)
+        ]
+        if end < self.settings.timeline_length:
+            entries.append({
+                "entryId": f"cursor-bottom-{end}",
+                "content": {
+                    "entryType": "TimelineTimelineCursor",
+                    "__typename": "TimelineTimelineCursor",
+                    "value": str(end),
+                    "cursorType": "Bottom"
+                }
+            })
+        return {"instructions": [{"type": "TimelineAddEntries", "entries": entries}]}
+
+    def result(self, timeline: str, author: Optional[str], index: int) -> Dict[str, Any]:
+        """The `index`-th newest status of a timeline."""
+        rng = random.Random(f"{self.settings.seed}:{timeline}:{author}:{index}")
+        if timeline == "profile":
+            username = author
+            text = f"Synthetic post {index} from @{author} about topic {rng.randint(1, 50)}"
+        else:
+            username = f"fan_{rng.randint(1, 400)}"
+            text = f"@{self.settings.bot_username} synthetic {timeline} {index}: question {rng.randint(1, 1000)}?"
+        offset = (zlib.crc32(f"{timeline}:{author}".encode()) % 1000) * 10 ** 9
+        tweet_id = str(TIMELINE_ID_BASE + offset + self.settings.timeline_length - index)
+        created_at = self._now - timedelta(minutes=7 * index)
+        return tweet_result(tweet_id, username, text, created_at, rng)
+
+    def _entry(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "entryId": f"tweet-{result['rest_id']}",
+            "sortIndex": result["rest_id"],
+            "content": {
+                "entryType": "TimelineTimelineItem",
+                "__typename": "TimelineTimelineItem",
+                "itemContent": {
+                    "itemType": "TimelineTweet",
+                    "__typename": "TimelineTweet",
+                    "tweet_results": {"result": result}
+                }
+            }
+        }
+
+
+def tweet_result(
+    tweet_id: str,
+    username: str,
+    text: str,
+    created_at: datetime,
+    rng: Optional[random.Random] = None
+) -> Dict[str, Any]:
+    """A `tweet_results.result` object with the fields the GraphQL parser reads."""
+    rng = rng or random.Random(tweet_id)
+    return {
+        "__typename": "Tweet",
+        "rest_id": tweet_id,
+        "core": {
+            "user_results": {
+                "result": {
+                    "__typename": "User",
+                    "rest_id": str(zlib.crc32(username.encode())),
+                    "legacy": {"screen_name": username, "name": username.replace("_", " ").title()}
+                }
+            }
+        },
+        "legacy": {
+            "id_str": tweet_id,
+            "full_text": text,
+            "created_at": created_at.strftime(TWITTER_DATE_FORMAT),
+            "reply_count": rng.randint(0, 20),
+            "retweet_count": rng.randint(0, 50),
+            "favorite_count": rng.randint(0, 200)
+        }
+    }
+
+
+def create_fake_x_app(settings: Optional[FakeXSettings] = None) -> FastAPI:
+    """
+    Create the fake X app.
+
+    Args:
+        settings: Timeline shape and latency (defaults to FakeXSettings())
+
+    Returns:
+        Configured FastAPI app instance; its FakeXState is `app.state.fake_x`
+    """
+    settings = settings or FakeXSettings()
+    timelines = FakeTimelines(settings)
+    state = FakeXState()
+    template = Template((FIXTURES_DIR / "page.html").read_text())
+    client_script = (FIXTURES_DIR / "app.js").read_text()
+
+    app = FastAPI(title="Fake X", docs_url=None, redoc_url=None, openapi_url=None)
+    app.state.fake_x = state
+
+    async def delay() -> None:
+        latency = settings.latency_ms + random.uniform(0, settings.jitter_ms)
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+    async def render_page(title: str, page_config: Dict[str, Any]) -> HTMLResponse:
+        await delay()
+        state.page_loads += 1
+        page_config = {
+            "queryIds": QUERY_IDS,
+            "pageSize": settings.page_size,
+            "virtualize": settings.virtualize,
+            **page_config
+        }
+        # Keep "</script>" in tweet text from closing the config block
+        config_json = json.dumps(page_config).replace("</", "<\\/")
+        return HTMLResponse(template.substitute(title=html.escape(title), config=config_json))
+
+    def status_result(tweet_id: str, username: Optional[str] = None) -> Dict[str, Any]:
+        for created in state.created_tweets:
+            if created["rest_id"] == tweet_id:
+                return created
+        return tweet_result(tweet_id, username or "fake_author", f"Status {tweet_id} on the fake X site", timelines._now)
+
+    # Fake-site helpers (registered before /{username} so they are not profiles)
+
+    @app.get("/fake_x/app.js")
+    async def app_js() -> Response:
+        return Response(client_script, media_type="application/javascript")
+
+    @app.get("/fake_x/avatar.png")
+    async def avatar() -> Response:
+        return Response(AVATAR_PNG, media_type="image/png")
+
+    @app.get("/fake_x/stats")
+    async def stats() -> Dict[str, Any]:
+        return state.to_dict()
+
+    # GraphQL
+
+    @app.get("/i/api/graphql/{query_id}/{operation}")
+    async def graphql_query(operation: str, variables: str = "{}") -> Dict[str, Any]:
+        await delay()
+        state.graphql_queries += 1
+        params = json.loads(variables)
+        cursor, count = params.get("cursor"), int(params.get("count", settings.page_size))
+
+        if operation == "UserTweets":
+            page = timelines.page("profile", params.get("screen_name"), cursor, count)
+            return {"data": {"user": {"result": {"__typename": "User", "timeline_v2": {"timeline": page}}}}}
+        if operation == "NotificationsTimeline":
+            page = timelines.page("mentions", None, cursor, count)
+            return {"data": {"viewer_v2": {"user_results": {"result": {"notification_timeline": {"timeline": page}}}}}}
+        if operation == "HomeTimeline":
+            page = timelines.page("home", None, cursor, count)
+            return {"data": {"home": {"home_timeline_urt": page}}}
+        raise HTTPException(status_code=404, detail=f"Unknown operation {operation}")
+
+    @app.post("/i/api/graphql/{query_id}/{operation}")
+    async def graphql_mutation(operation: str, request: Request) -> JSONResponse:
+        await delay()
+        variables = (await request.json()).get("variables") or {}
+
+        if operation == "CreateTweet":
+            tweet_id = str(NEW_TWEET_ID_BASE + len(state.created_tweets) + 1)
+            result = tweet_result(tweet_id, settings.bot_username, variables.get("tweet_text", ""), datetime.now(timezone.utc))
+            state.created_tweets.append(result)
+            return JSONResponse({"data": {"create_tweet": {"tweet_results": {"result": result}}}})
+        if operation == "CreateRetweet":
+            state.retweets.append(str(variables.get("tweet_id")))
+            retweet_id = str(NEW_TWEET_ID_BASE + 10 ** 9 + len(state.retweets))
+            return JSONResponse({"data": {"create_retweet": {"retweet_results": {"result": {"rest_id": retweet_id}}}}})
+        raise HTTPException(status_code=404, detail=f"Unknown operation {operation}")
+
+    # Pages
+
+    @app.get("/", response_class=HTMLResponse)
+    @app.get("/home", response_class=HTMLResponse)
+    async def home() -> HTMLResponse:
+        return await render_page("Home", {"operation": "HomeTimeline", "variables": {}, "composer": True})
+
+    @app.get("/notifications/mentions", response_class=HTMLResponse)
+    async def mentions() -> HTMLResponse:
+        return await render_page("Mentions", {"operation": "NotificationsTimeline", "variables": {}})
+
+    @app.get("/i/status/{tweet_id}", response_class=HTMLResponse)
+    async def status(tweet_id: str) -> HTMLResponse:
+        return await render_page("Post", {"operation": None, "tweets": [status_result(tweet_id)]})
+
+    @app.get("/{username}/status/{tweet_id}", response_class=HTMLResponse)
+    async def user_status(username: str, tweet_id: str) -> HTMLResponse:
+        return await render_page("Post", {"operation": None, "tweets": [status_result(tweet_id, username)]})
+
+    @app.get("/{username}", response_class=HTMLResponse)
+    async def profile(username: str) -> HTMLResponse:
+        return await render_page(f"@{username}", {"operation": "UserTweets", "variables": {"screen_name": username}})
+
+    return app
+
+
+def main():
+    """Main entry point."""
+    defaults = FakeXSettings()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8780)
+    parser.add_argument("--timeline-length", type=int, default=defaults.timeline_length)
+    parser.add_argument("--page-size", type=int, default=defaults.page_size)
+    parser.add_argument("--virtualize", type=int, default=defaults.virtualize,
+                        help="articles kept in the DOM, 0 to keep all")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--bot-username", default=defaults.bot_username)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    settings = FakeXSettings(
+        timeline_length=args.timeline_length,
+        page_size=args.page_size,
+        virtualize=args.virtualize,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        bot_username=args.bot_username,
+        seed=args.seed
+    )
+    print(f"Fake X on http://{args.host}:{args.port} ({settings})")
+    uvicorn.run(create_fake_x_app(settings), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+// Client side of the fake X site (see fake_x_server.py).
+//
+// Renders timelines from the same GraphQL payloads the real web app
+// fetches, with the article/button data-testid structure the repository's
+// selectors expect: pages are fetched on load and whenever the reader
+// scrolls near the bottom, articles above the window are dropped when
+// virtualization is on, and the reply/repost/quote/post flows call the
+// CreateTweet/CreateRetweet mutations and show a toast.
+(() => {
+  const CONFIG = JSON.parse(document.getElementById('fake-x-config').textContent);
+  const timeline = document.getElementById('fake-x-timeline');
+  const spacer = document.getElementById('fake-x-spacer');
+  const layers = document.getElementById('layers');
+
+  let cursor = null;
+  let loading = false;
+  let exhausted = !CONFIG.operation;
+
+  const escapeHtml = (value) => String(value).replace(/[&<>"']/g, (c) => ({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+  }[c]));
+
+  const graphqlUrl = (operation) => `/i/api/graphql/${CONFIG.queryIds[operation]}/${operation}`;
+
+  // Timeline rendering
+
+  function renderTweet(result) {
+    const legacy = result.legacy || {};
+    const user = result.core.user_results.result.legacy;
+    const created = new Date(legacy.created_at);
+    const datetime = isNaN(created) ? '' : created.toISOString();
+    const permalink = `/${user.screen_name}/status/${result.rest_id}`;
+
+    const article = document.createElement('article');
+    article.setAttribute('data-testid', 'tweet');
+    article.setAttribute('role', 'article');
+    article.tabIndex = 0;
+    article.innerHTML = `
+      <img alt="" src="/fake_x/avatar.png">
+      <div data-testid="User-Name">
+        <a href="/${user.screen_name}" role="link"><span>${escapeHtml(user.name)}</span></a>
+        <a href="/${user.screen_name}" role="link" tabindex="-1"><span>@${user.screen_name}</span></a>
+        <a href="${permalink}" role="link"><time datetime="${datetime}">${escapeHtml(legacy.created_at || '')}</time></a>
+      </div>
+      <div data-testid="tweetText" lang="en" dir="auto">${escapeHtml(legacy.full_text)}</div>
+      <div role="group" aria-label="${legacy.reply_count} replies, ${legacy.retweet_count} reposts, ${legacy.favorite_count} likes">
+        <button data-testid="reply" aria-label="${legacy.reply_count} Replies. Reply" role="button"></button>
+        <button data-testid="retweet" aria-label="${legacy.retweet_count} reposts. Repost" role="button"></button>
+        <button data-testid="like" aria-label="${legacy.favorite_count} Likes. Like" role="button"></button>
+      </div>
+      <a href="${permalink}/analytics" role="link">Views</a>`;
+
+    article.querySelector('[data-testid="reply"]').addEventListener('click', () => openReply(result.rest_id));
+    article.querySelector('[data-testid="retweet"]').addEventListener('click', (event) => openRepostMenu(event.currentTarget, result.rest_id, permalink));
+    return article;
+  }
+
+  function appendTweets(results) {
+    for (const result of results) {
+      timeline.appendChild(renderTweet(result));
+    }
+    // Like X's virtualized list: keep a bounded window of articles and
+    // hold the scroll position with a spacer for the ones dropped above
+    if (CONFIG.virtualize > 0) {
+      let dropped = 0;
+      while (timeline.children.length > CONFIG.virtualize) {
+        dropped += timeline.firstElementChild.offsetHeight;
+        timeline.firstElementChild.remove();
+      }
+      spacer.style.height = `${spacer.offsetHeight + dropped}px`;
+    }
+  }
+
+  function tweetResults(node, found = []) {
+    if (Array.isArray(node)) {
+      node.forEach((item) => tweetResults(item, found));
+    } else if (node && typeof node === 'object') {
+      for (const [key, value] of Object.entries(node)) {
+        if (key === 'tweet_results' && value && value.result) {
+          found.push(value.result);
+        } else {
+          tweetResults(value, found);
+        }
+      }
+    }
+    return found;
+  }
+
+  function bottomCursor(node) {
+    if (Array.isArray(node)) {
+      for (const item of node) {
+        const value = bottomCursor(item);
+        if (value) return value;
+      }
+    } else if (node && typeof node === 'object') {
+      if (node.cursorType === 'Bottom') return node.value;
+      for (const value of Object.values(node)) {
+        const found = bottomCursor(value);
+        if (found) return found;
+      }
+    }
+    return null;
+  }
+
+  async function loadNextPage() {
+    if (loading || exhausted) return;
+    loading = true;
+    try {
+      const variables = Object.assign({}, CONFIG.variables, { count: CONFIG.pageSize });
+      if (cursor) variables.cursor = cursor;
+      const url = `${graphqlUrl(CONFIG.operation)}?variables=${encodeURIComponent(JSON.stringify(variables))}`;
+      const payload = await (await fetch(url, { credentials: 'include' })).json();
+      const results = tweetResults(payload);
+      cursor = bottomCursor(payload);
+      exhausted = results.length === 0 || !cursor;
+      appendTweets(results);
+    } finally {
+      loading = false;
+    }
+    maybeLoadMore();
+  }
+
+  function maybeLoadMore() {
+    const remaining = document.body.scrollHeight - (window.scrollY + window.innerHeight);
+    if (remaining < window.innerHeight * 2) {
+      loadNextPage();
+    }
+  }
+
+  // Write flows
+
+  function closeLayers() {
+    layers.innerHTML = '';
+  }
+
+  function showToast(text) {
+    const toast = document.createElement('div');
+    toast.setAttribute('data-testid', 'toast');
+    toast.setAttribute('role', 'alert');
+    toast.textContent = text;
+    document.body.appendChild(toast);
+    setTimeout(() => toast.remove(), 3000);
+  }
+
+  async function mutate(operation, variables) {
+    const response = await fetch(graphqlUrl(operation), {
+      method: 'POST',
+      credentials: 'include',
+      headers: { 'content-type': 'application/json' },
+      body: JSON.stringify({ variables, queryId: CONFIG.queryIds[operation] })
+    });
+    return response.json();
+  }
+
+  // Composer with a send button that stays aria-disabled until there is text
+  function buildComposer(container, buttonTestId, buildVariables) {
+    container.innerHTML = `
+      <div data-testid="tweetTextarea_0" role="textbox" contenteditable="true" aria-label="Post text"></div>
+      <div data-testid="${buttonTestId}" role="button" aria-disabled="true" tabindex="0">Post</div>`;
+    const textbox = container.querySelector('[data-testid="tweetTextarea_0"]');
+    const button = container.querySelector(`[data-testid="${buttonTestId}"]`);
+
+    textbox.addEventListener('input', () => {
+      button.setAttribute('aria-disabled', textbox.textContent.trim() ? 'false' : 'true');
+    });
+    button.addEventListener('click', async () => {
+      if (button.getAttribute('aria-disabled') === 'true') return;
+      button.setAttribute('aria-disabled', 'true');
+      await mutate('CreateTweet', buildVariables(textbox.textContent));
+      textbox.textContent = '';
+      if (container.closest('[role="dialog"]')) closeLayers();
+      showToast('Your post was sent.');
+    });
+  }
+
+  function openDialog(buttonTestId, buildVariables) {
+    closeLayers();
+    const dialog = document.createElement('div');
+    dialog.setAttribute('role', 'dialog');
+    dialog.setAttribute('aria-modal', 'true');
+    layers.appendChild(dialog);
+    buildComposer(dialog, buttonTestId, buildVariables);
+  }
+
+  function openReply(tweetId) {
+    openDialog('tweetButton', (text) => ({
+      tweet_text: text,
+      reply: { in_reply_to_tweet_id: tweetId, exclude_reply_user_ids: [] }
+    }));
+  }
+
+  function openRepostMenu(button, tweetId, permalink) {
+    closeLayers();
+    const menu = document.createElement('div');
+    menu.setAttribute('data-testid', 'Dropdown');
+    menu.setAttribute('role', 'menu');
+    menu.innerHTML = `
+      <div data-testid="retweetConfirm" role="menuitem" tabindex="0"><span>Repost</span></div>
+      <a href="/compose/post" role="menuitem" tabindex="0"><span>Quote</span></a>`;
+    layers.appendChild(menu);
+
+    menu.querySelector('[data-testid="retweetConfirm"]').addEventListener('click', async () => {
+      closeLayers();
+      await mutate('CreateRetweet', { tweet_id: tweetId, dark_request: false });
+      button.setAttribute('data-testid', 'unretweet');
+      button.setAttribute('aria-label', 'Undo repost');
+    });
+    menu.querySelector('a[role="menuitem"]').addEventListener('click', (event) => {
+      event.preventDefault();
+      openDialog('tweetButton', (text) => ({
+        tweet_text: text,
+        attachment_url: `${location.origin}${permalink}`
+      }));
+    });
+  }
+
+  // Page setup
+
+  if (CONFIG.composer) {
+    buildComposer(document.getElementById('fake-x-composer'), 'tweetButtonInline', (text) => ({ tweet_text: text }));
+  }
+  if (CONFIG.tweets) {
+    appendTweets(CONFIG.tweets);
+  }
+  window.addEventListener('scroll', maybeLoadMore, { passive: true });
+  loadNextPage();
+})();
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Load test for the REST API and MCP tools.
+
+Sends requests at a fixed arrival rate (open loop: a slow server does not
+slow the senders down) with a weighted mix of operations, then reports
+p50/p95/p99 latency per operation, achieved throughput and errors by code.
+
+Run the services with TWITTER_BACKEND=memory so no browser is involved:
+what is measured is the API, use-case and MongoDB overhead plus the
+in-memory repository's simulated latency (MEMORY_* settings; set
+MEMORY_READ_LATENCY_MS=0 and MEMORY_WRITE_LATENCY_MS=0 to measure the
+overhead alone, or raise MEMORY_FAILURE_RATE/MEMORY_TIMEOUT_RATE to see
+how errors propagate).
+
+Usage:
+    # REST API (start it first)
+    TWITTER_BACKEND=memory python run_rest_api.py
+    python load_test.py rest --rate 200 --duration 30
+
+    # MCP tools, in-process (TWITTER_BACKEND=memory is set for you)
+    python load_test.py mcp --rate 200 --duration 30
+
+    # MCP tools over stdio, through run_mcp_server.py
+    python load_test.py mcp --transport stdio --rate 50
+
+    # Custom operation mix (name=weight)
+    python load_test.py rest --mix read_tweets=8,reply=1,health=1
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+import httpx
+from fastmcp import Client
+from fastmcp.client.transports import PythonStdioTransport
+from src.config import config
+from src.infrastructure.in_memory_twitter_repository import InMemoryTwitterRepository
+from src.mcp import server
+
+# Synthetic profiles the reads spread over (each is its own cache/single-flight key)
+PROFILES = [f"load_user_{i}" for i in range(50)]
+TARGET_TWEET_ID = "1800000000000000001"
+
+DEFAULT_MIXES = {
+    "rest": "read_tweets=5,unanswered_mentions=2,unanswered_tweets=2,reply=1,post_tweet=1,health=1",
+    "mcp": "read_last_tweets=6,reply_to_tweet=2,retweet=1,post_tweet=1"
+}
+
+
+class LoadError(Exception):
+    """A request that failed; `code` groups it in the report."""
+
+    def __init__(self, code: str):
+        self.code = code
+        super().__init__(code)
+
+
+@dataclass
+class OperationStats:
+    """Latencies of successful calls and error codes of failed ones."""
+
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 when there are no samples)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def parse_mix(mix: str, operations: Dict[str, Callable]) -> Dict[str, float]:
+    """Parse "name=weight,..." and check every name is an operation of the target."""
+    weights = {}
+    for entry in mix.split(","):
+        name, _, weight = entry.strip().partition("=")
+        if name not in operations:
+            raise SystemExit(f"Unknown operation '{name}', expected one of {', '.join(operations)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+class RestTarget:
+    """Calls REST API endpoints over HTTP."""
+
+    def __init__(self, base_url: str, max_connections: int):
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/") + "/api/v1",
+            timeout=httpx.Timeout(120),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+        self.operations: Dict[str, Callable[[int], Awaitable[None]]] = {
+            "read_tweets": lambda i: self._send("POST", "/read_tweets", json={"username": PROFILES[i % len(PROFILES)], "count": 20}),
+            "unanswered_mentions": lambda i: self._send("GET", "/mentions/unanswered", params={"count": 10}),
+            "unanswered_tweets": lambda i: self._send("GET", f"/tweets/unanswered/{PROFILES[i % len(PROFILES)]}", params={"count": 10}),
+            "reply": lambda i: self._send("POST", "/reply", json={"tweet_id": TARGET_TWEET_ID, "text": f"load test reply {i}"}),
+            "retweet": lambda i: self._send("POST", "/retweet", json={"tweet_id": TARGET_TWEET_ID}),
+            "post_tweet": lambda i: self._send("POST", "/post_tweet", json={"text": f"load test post {i}"}),
+            "health": lambda i: self._send("GET", "/health")
+        }
+
+    async def start(self) -> None:
+        try:
+            await self._send("GET", "/health")
+        except LoadError as e:
+            raise SystemExit(f"REST API at {self._client.base_url} is not reachable ({e.code})")
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def _send(self, method: str, path: str, **kwargs) -> None:
+        try:
+            response = await self._client.request(method, path, **kwargs)
+        except httpx.TimeoutException:
+            raise LoadError("CLIENT_TIMEOUT")
+        except httpx.HTTPError as e:
+            raise LoadError(type(e).__name__)
+        if response.status_code >= 400:
+            try:
+                detail = response.json().get("detail")
+            except ValueError:
+                detail = None
+            code = detail.get("error_code") if isinstance(detail, dict) else None
+            raise LoadError(f"HTTP {response.status_code} {code}" if code else f"HTTP {response.status_code}")
+
+
+class McpTarget:
+    """Calls MCP tools through a fastmcp client (in-process or over stdio)."""
+
+    def __init__(self, transport: str):
+        self._transport = transport
+        self._client = None
+        self._in_process = False
+        self.operations: Dict[str, Callable[[int], Awaitable[None]]] = {
+            "read_last_tweets": lambda i: self._call("read_last_tweets", {"username": PROFILES[i % len(PROFILES)], "count": 20}),
+            "reply_to_tweet": lambda i: self._call("reply_to_tweet", {"tweet_id": TARGET_TWEET_ID, "text": f"load test reply {i}"}),
+            "retweet": lambda i: self._call("retweet", {"tweet_id": TARGET_TWEET_ID}),
+            "post_tweet": lambda i: self._call("post_tweet", {"text": f"load test post {i}"})
+        }
+
+    async def start(self) -> None:
+        if self._transport == "stdio":
+            script = Path(__file__).parent / "run_mcp_server.py"
+            env = {**os.environ, "TWITTER_BACKEND": "memory"}
+            self._client = Client(PythonStdioTransport(script, env=env, cwd=str(script.parent)))
+        else:
+            # The repository is chosen from config when the server initializes
+            config.TWITTER_BACKEND = "memory"
+            await server.initialize_mcp_server()
+            self._in_process = True
+            self._client = Client(server.mcp)
+        await self._client.__aenter__()
+
+    async def close(self) -> None:
+        if self._client:
+            await self._client.__aexit__(None, None, None)
+        if self._in_process:
+            repo = server.twitter_repo
+            while hasattr(repo, "inner"):  # Scheduler and cache decorators
+                repo = repo.inner
+            if isinstance(repo, InMemoryTwitterRepository):
+                print(f"In-memory repository: {repo.stats()}")
+            await server.cleanup_mcp_server()
+
+    async def _call(self, tool: str, arguments: Dict[str, Any]) -> None:
+        try:
+            await self._client.call_tool(tool, arguments)
+        except Exception as e:
+            # Tool errors carry the repository message ("Twitter error: Timeout in ...")
+            raise LoadError(str(e)[:80] or type(e).__name__)
+
+
+async def run_load(
+    target,
+    weights: Dict[str, float],
+    rate: float,
+    duration: float,
+    max_in_flight: int,
+    seed: int
+) -> None:
+    """Send `rate` requests per second for `duration` seconds and print the report."""
+    loop = asyncio.get_running_loop()
+    rng = random.Random(seed)
+    names, name_weights = list(weights), list(weights.values())
+    stats = {name: OperationStats() for name in names}
+    in_flight: set = set()
+    dropped = 0
+
+    async def timed(name: str, index: int, scheduled: float) -> None:
+        try:
+            await target.operations[name](index)
+        except LoadError as e:
+            stats[name].errors[e.code] += 1
+            return
+        # Measured from the scheduled send time, so a stalled loop shows up as latency
+        stats[name].latencies_ms.append((loop.time() - scheduled) * 1000)
+
+    total = int(rate * duration)
+    print(f"Sending {total} requests at {rate:g}/s for {duration:g}s (max {max_in_flight} in flight)")
+    start = loop.time()
+    for index in range(total):
+        scheduled = start + index / rate
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            dropped += 1
+            continue
+        name = rng.choices(names, name_weights)[0]
+        task = asyncio.create_task(timed(name, index, scheduled))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
+    elapsed = loop.time() - start
+
+    print()
+    print(f"{'operation':<22} {'ok':>7} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+    print("-" * 76)
+    all_latencies: List[float] = []
+    all_errors: Counter = Counter()
+    for name in names:
+        latencies, errors = stats[name].latencies_ms, stats[name].errors
+        all_latencies.extend(latencies)
+        all_errors.update(errors)
+        print(
+            f"{name:<22} {len(latencies):>7} {sum(errors.values()):>7} {percentile(latencies, 50):>9.1f} "
+            f"{percentile(latencies, 95):>9.1f} {percentile(latencies, 99):>9.1f} {len(latencies) / elapsed:>8.1f}"
+        )
+    print("-" * 76)
+    print(
+        f"{'total':<22} {len(all_latencies):>7} {sum(all_errors.values()):>7} {percentile(all_latencies, 50):>9.1f} "
+        f"{percentile(all_latencies, 95):>9.1f} {percentile(all_latencies, 99):>9.1f} {len(all_latencies) / elapsed:>8.1f}"
+    )
+    print()
+    print(f"Elapsed {elapsed:.1f}s, offered {rate:g} req/s, dropped {dropped} (over max in flight)")
+    for code, count in all_errors.most_common():
+        print(f"   {code}: {count}")
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("target", choices=("rest", "mcp"))
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="REST API base URL")
+    parser.add_argument("--transport", choices=("memory", "stdio"), default="memory", help="MCP client transport")
+    parser.add_argument("--rate", type=float, default=100, help="requests per second")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--mix", help="name=weight,... (defaults per target)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.target == "rest":
+        target = RestTarget(args.url, args.max_in_flight)
+    else:
+        target = McpTarget(args.transport)
+    weights = parse_mix(args.mix or DEFAULT_MIXES[args.target], target.operations)
+
+    await target.start()
+    try:
+        await run_load(target, weights, args.rate, args.duration, args.max_in_flight, args.seed)
+    finally:
+        await target.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
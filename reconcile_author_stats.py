@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Rebuild the author_stats counters from the mentions collection.
+
+Run once after upgrading to backfill counters for existing mentions, and
+whenever the counters are suspected to have drifted (e.g. after a crash
+between a mention update and its counter update).
+
+Usage:
+    python reconcile_author_stats.py
+"""
+
+import asyncio
+from src.infrastructure.logging_config import setup_logging
+from src.infrastructure.mongo_repository import MongoRepository
+
+
+async def main() -> None:
+    repo = MongoRepository()
+    try:
+        await repo.initialize()
+        rebuilt = await repo.rebuild_author_stats()
+        print(f"Rebuilt counters for {rebuilt} authors")
+    finally:
+        await repo.close()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Entry point for running the shared browser worker."""
+
+from urllib.parse import urlparse
+import uvicorn
+from src.config import config
+from src.infrastructure.logging_config import setup_logging
+from src.infrastructure.browser_service import create_browser_service_app
+
+if __name__ == "__main__":
+    setup_logging()
+    app = create_browser_service_app()
+
+    if config.BROWSER_SERVICE_UDS:
+        uvicorn.run(app, uds=config.BROWSER_SERVICE_UDS, log_level=config.LOG_LEVEL.lower())
+    else:
+        url = urlparse(config.BROWSER_SERVICE_URL)
+        uvicorn.run(
+            app,
+            host=url.hostname or "127.0.0.1",
+            port=url.port or 8765,
+            log_level=config.LOG_LEVEL.lower()
+        )
@@ -3,13 +3,23 @@
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from src.api import routes
 from src.config import config
 from src.infrastructure.logging_config import setup_logging
 from src.infrastructure.browser_manager import BrowserManager
 from src.infrastructure.twitter_repository import PlaywrightTwitterRepository
+from src.infrastructure.remote_twitter_repository import RemoteTwitterRepository
+from src.infrastructure.in_memory_twitter_repository import InMemoryTwitterRepository
 from src.infrastructure.mongo_repository import MongoRepository
+from src.infrastructure.event_broadcaster import EventBroadcaster
+from src.infrastructure.job_runner import JobRunner
+from src.infrastructure.mention_poller import MentionPoller
+from src.infrastructure.single_flight import SingleFlight
+from src.infrastructure.action_scheduler import ScheduledTwitterRepository, create_action_scheduler
+from src.infrastructure.timeline_cache import CachingTwitterRepository, create_timeline_store
+from src.infrastructure.metrics import CONTENT_TYPE, metrics, runtime_gauges_collector
+from src.domain.interfaces import ITwitterRepository
 from src.domain.use_cases import (
     ReadLastTweetsUseCase,
     ReplyToTweetUseCase,
@@ -17,6 +27,7 @@ from src.domain.use_cases import (
     PostTweetUseCase
 )
 from src.domain.use_cases_extended import (
+    SyncMentionsUseCase,
     GetUnansweredMentionsUseCase,
     GetUnansweredTweetsFromUserUseCase,
     ReplyByIdTweetUseCase
@@ -26,8 +37,10 @@ logger = logging.getLogger(__name__)
 
 # Global instances
 browser_manager: BrowserManager = None
-twitter_repo: PlaywrightTwitterRepository = None
+twitter_repo: ITwitterRepository = None
 mongo_repo: MongoRepository = None
+mention_poller: MentionPoller = None
+job_runner: JobRunner = None
 
 
 @asynccontextmanager
@@ -37,10 +50,11 @@ async def lifespan(app: FastAPI):
 
     Handles startup and shutdown of browser, MongoDB, and other resources.
     """
-    global browser_manager, twitter_repo, mongo_repo
+    global browser_manager, twitter_repo, mongo_repo, mention_poller, job_runner
 
     # Startup
     logger.info("Starting Twitter MCP Agent REST API")
+    gauges_collector = None
 
     try:
         # Initialize MongoDB
@@ -49,24 +63,68 @@ async def lifespan(app: FastAPI):
         await mongo_repo.initialize()
         logger.info(f"MongoDB connected to {config.MONGO_HOST}:{config.MONGO_PORT}/{config.MONGO_DB}")
 
-        # Initialize browser manager
-        browser_manager = BrowserManager()
-        await browser_manager.start()
-        logger.info("Browser manager started")
+        if mongo_repo.monitor:
+            routes.configure_mongo_monitor(mongo_repo.monitor)
 
-        # Initialize Twitter repository
-        twitter_repo = PlaywrightTwitterRepository(browser_manager)
+        # Jobs run in-process; whatever a previous process left unfinished never will be
+        await mongo_repo.fail_interrupted_jobs()
+
+        # Initialize Twitter repository (synthetic data, own browser, or the shared worker)
+        if config.TWITTER_BACKEND == "memory":
+            twitter_repo = InMemoryTwitterRepository()
+            logger.info("Using in-memory Twitter backend (no browser)")
+        elif config.BROWSER_SERVICE_ENABLED:
+            twitter_repo = RemoteTwitterRepository()
+            await twitter_repo.check_health()
+            logger.info("Using shared browser worker")
+        else:
+            browser_manager = BrowserManager()
+            await browser_manager.start()
+            logger.info("Browser manager started")
+            twitter_repo = PlaywrightTwitterRepository(browser_manager)
+
+        # Admit browser calls through priority lanes (before the cache, so cache hits skip the queue)
+        action_scheduler = None
+        if config.SCHEDULER_ENABLED:
+            action_scheduler = create_action_scheduler()
+            twitter_repo = ScheduledTwitterRepository(twitter_repo, action_scheduler)
+            logger.info("Action scheduler enabled")
+
+        # Cache profile timelines in front of whichever repository is in use
+        if config.TIMELINE_CACHE_ENABLED:
+            twitter_repo = CachingTwitterRepository(
+                twitter_repo,
+                create_timeline_store(
+                    config.TIMELINE_CACHE_BACKEND,
+                    config.TIMELINE_CACHE_MAX_BYTES,
+                    config.TIMELINE_CACHE_REDIS_URL
+                ),
+                ttl_seconds=config.TIMELINE_CACHE_TTL_SECONDS,
+                stale_seconds=config.TIMELINE_CACHE_STALE_SECONDS
+            )
+            logger.info(f"Timeline cache enabled ({config.TIMELINE_CACHE_BACKEND})")
         logger.info("Twitter repository initialized")
 
         # Initialize original use cases (now with optional MongoDB support)
-        read_tweets_uc = ReadLastTweetsUseCase(twitter_repo)
+        # One coalescer shared by the read use cases (keys include the operation)
+        single_flight = SingleFlight() if config.SINGLE_FLIGHT_ENABLED else None
+        read_tweets_uc = ReadLastTweetsUseCase(twitter_repo, single_flight)
         reply_uc = ReplyToTweetUseCase(twitter_repo, mongo_repo)  # Now with MongoDB
         retweet_uc = RetweetUseCase(twitter_repo)
         post_tweet_uc = PostTweetUseCase(twitter_repo)
 
         # Initialize MongoDB-backed use cases
-        get_unanswered_mentions_uc = GetUnansweredMentionsUseCase(twitter_repo, mongo_repo)
-        get_unanswered_tweets_uc = GetUnansweredTweetsFromUserUseCase(twitter_repo, mongo_repo)
+        mention_broadcaster = EventBroadcaster()
+        sync_mentions_uc = SyncMentionsUseCase(
+            twitter_repo,
+            mongo_repo,
+            mention_broadcaster,
+            incremental=config.MENTION_SYNC_INCREMENTAL
+        )
+        get_unanswered_mentions_uc = GetUnansweredMentionsUseCase(
+            twitter_repo, mongo_repo, sync_mentions_uc, single_flight=single_flight
+        )
+        get_unanswered_tweets_uc = GetUnansweredTweetsFromUserUseCase(twitter_repo, mongo_repo, single_flight)
         reply_by_id_uc = ReplyByIdTweetUseCase(twitter_repo, mongo_repo)
 
         # Configure route dependencies
@@ -77,10 +135,34 @@ async def lifespan(app: FastAPI):
             post_tweet=post_tweet_uc,
             get_unanswered_mentions=get_unanswered_mentions_uc,
             get_unanswered_tweets_from_user=get_unanswered_tweets_uc,
-            reply_by_id=reply_by_id_uc
+            reply_by_id=reply_by_id_uc,
+            mention_broadcaster=mention_broadcaster
         )
         logger.info("Use cases configured")
 
+        # Keep mentions in MongoDB fresh so GET requests need no scrape
+        if config.MENTION_POLLER_ENABLED:
+            mention_poller = MentionPoller(
+                sync_mentions_uc,
+                accounts=list(config.get_accounts()),
+                interval_seconds=config.MENTION_POLLER_INTERVAL_SECONDS,
+                jitter_seconds=config.MENTION_POLLER_JITTER_SECONDS,
+                count=config.MENTION_POLLER_COUNT
+            )
+            mention_poller.start()
+            routes.configure_mention_poller(mention_poller)
+
+        if action_scheduler:
+            routes.configure_action_scheduler(action_scheduler)
+
+        # Background runner for ?async=true write actions
+        job_runner = JobRunner(mongo_repo, EventBroadcaster(), config.JOBS_MAX_CONCURRENCY)
+        routes.configure_job_runner(job_runner)
+
+        # Pool and queue gauges are read when /metrics is scraped
+        gauges_collector = runtime_gauges_collector(browser_manager, action_scheduler, single_flight)
+        metrics.add_collector(gauges_collector)
+
         logger.info("REST API startup complete")
 
         yield
@@ -93,6 +175,16 @@ async def lifespan(app: FastAPI):
         # Shutdown
         logger.info("Shutting down Twitter MCP Agent REST API")
 
+        if gauges_collector:
+            metrics.remove_collector(gauges_collector)
+
+        if mention_poller:
+            await mention_poller.stop()
+
+        # Let accepted jobs finish while the browser is still up
+        if job_runner:
+            await job_runner.close()
+
         if mongo_repo:
             await mongo_repo.close()
             logger.info("MongoDB connection closed")
@@ -101,6 +193,17 @@ async def lifespan(app: FastAPI):
             await browser_manager.stop()
             logger.info("Browser manager stopped")
 
+        if isinstance(twitter_repo, CachingTwitterRepository):
+            await twitter_repo.close()
+            # Unwrap so the worker proxy below is closed too
+            twitter_repo = twitter_repo.inner
+
+        if isinstance(twitter_repo, ScheduledTwitterRepository):
+            twitter_repo = twitter_repo.inner
+
+        if isinstance(twitter_repo, RemoteTwitterRepository):
+            await twitter_repo.close()
+
         logger.info("REST API shutdown complete")
 
 
@@ -125,6 +228,12 @@ def create_app() -> FastAPI:
     # Include routers
     app.include_router(routes.router)
 
+    # Prometheus scrape endpoint (absent unless METRICS_ENABLED=true)
+    if metrics.enabled:
+        @app.get("/metrics", include_in_schema=False)
+        async def prometheus_metrics():
+            return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
     # Add exception handler for uncaught exceptions
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
@@ -1,7 +1,15 @@
 """REST API routes for Twitter operations."""
 
+import asyncio
+import json
 import logging
-from fastapi import APIRouter, HTTPException, status, Query
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from fastapi import APIRouter, HTTPException, Request, Response, status, Query
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
 from src.api.schemas import (
     ReadTweetsRequest,
     ReadTweetsResponse,
@@ -10,6 +18,7 @@ from src.api.schemas import (
     PostTweetRequest,
     ActionResponse,
     ErrorResponse,
+    JobResponse,
     TweetSchema,
     UnansweredMentionsResponse,
     UnansweredTweetsResponse,
@@ -27,11 +36,54 @@ from src.domain.use_cases_extended import (
     ReplyByIdTweetUseCase
 )
 from src.domain.interfaces import TwitterRepositoryError
+from src.config import config
+from src.infrastructure.event_broadcaster import EventBroadcaster
+from src.infrastructure.mention_poller import MentionPoller
+from src.infrastructure.action_scheduler import ActionScheduler
+from src.infrastructure.job_runner import JobRunner
+from src.infrastructure.metrics import metrics
+from src.infrastructure.mongo_monitoring import MongoCommandMonitor
 
 logger = logging.getLogger(__name__)
 
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    "http_request_duration_seconds",
+    "REST API latency per route template (streams: until the response starts)",
+    ("method", "route", "status")
+)
+
+
+class TimedRoute(APIRoute):
+    """APIRoute that records each request's latency under its route template."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        if not metrics.enabled:
+            return handler
+
+        async def timed_handler(request: Request) -> Response:
+            started = time.perf_counter()
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            try:
+                response = await handler(request)
+                status_code = response.status_code
+                return response
+            except HTTPException as e:
+                status_code = e.status_code
+                raise
+            except RequestValidationError:
+                status_code = 422  # Raised before FastAPI turns it into a response
+                raise
+            finally:
+                HTTP_REQUEST_SECONDS.observe(
+                    time.perf_counter() - started, request.method, self.path_format, str(status_code)
+                )
+
+        return timed_handler
+
+
 # Router will be configured with dependencies in app.py
-router = APIRouter(prefix="/api/v1", tags=["twitter"])
+router = APIRouter(prefix="/api/v1", tags=["twitter"], route_class=TimedRoute)
 
 
 # Dependencies will be injected by app.py
@@ -45,6 +97,17 @@ _get_unanswered_mentions_use_case: GetUnansweredMentionsUseCase = None
 _get_unanswered_tweets_from_user_use_case: GetUnansweredTweetsFromUserUseCase = None
 _reply_by_id_use_case: ReplyByIdTweetUseCase = None
 
+# Push delivery of new mentions
+_mention_broadcaster: EventBroadcaster = None
+_mention_poller: MentionPoller = None
+_action_scheduler: ActionScheduler = None
+
+# Background runner for ?async=true write actions
+_job_runner: JobRunner = None
+
+# pymongo command monitor (MONGO_MONITORING_ENABLED)
+_mongo_monitor: MongoCommandMonitor = None
+
 
 def configure_dependencies(
     read_tweets: ReadLastTweetsUseCase,
@@ -53,11 +116,13 @@ def configure_dependencies(
     post_tweet: PostTweetUseCase,
     get_unanswered_mentions: GetUnansweredMentionsUseCase = None,
     get_unanswered_tweets_from_user: GetUnansweredTweetsFromUserUseCase = None,
-    reply_by_id: ReplyByIdTweetUseCase = None
+    reply_by_id: ReplyByIdTweetUseCase = None,
+    mention_broadcaster: EventBroadcaster = None
 ):
     """Configure use case dependencies for routes."""
     global _read_tweets_use_case, _reply_use_case, _retweet_use_case, _post_tweet_use_case
     global _get_unanswered_mentions_use_case, _get_unanswered_tweets_from_user_use_case, _reply_by_id_use_case
+    global _mention_broadcaster
 
     _read_tweets_use_case = read_tweets
     _reply_use_case = reply
@@ -68,6 +133,65 @@ def configure_dependencies(
     _get_unanswered_mentions_use_case = get_unanswered_mentions
     _get_unanswered_tweets_from_user_use_case = get_unanswered_tweets_from_user
     _reply_by_id_use_case = reply_by_id
+    _mention_broadcaster = mention_broadcaster
+
+
+def configure_mention_poller(poller: MentionPoller):
+    """Register the background mention poller (mentions are then read from MongoDB)."""
+    global _mention_poller
+    _mention_poller = poller
+
+
+def configure_action_scheduler(scheduler: ActionScheduler):
+    """Register the action scheduler (its queue stats are reported by /health)."""
+    global _action_scheduler
+    _action_scheduler = scheduler
+
+
+def configure_mongo_monitor(monitor: MongoCommandMonitor):
+    """Register the MongoDB command monitor reported by /debug/mongo."""
+    global _mongo_monitor
+    _mongo_monitor = monitor
+
+
+def configure_job_runner(runner: JobRunner):
+    """Register the runner for write actions requested with ?async=true."""
+    global _job_runner
+    _job_runner = runner
+
+
+async def _accept_job(
+    action: str,
+    request: BaseModel,
+    run: Callable[[], Awaitable[Any]]
+) -> JSONResponse:
+    """Enqueue a write action and answer 202 with the job to poll."""
+    params: Dict[str, Any] = request.model_dump(exclude={"account"})
+    job = await _job_runner.submit(action, params, run, account=getattr(request, "account", None))
+    response = JobResponse(success=True, job=job.to_api_dict(), status_url=f"{router.prefix}/jobs/{job.job_id}")
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=response.model_dump())
+
+
+def _repository_error_status(error: TwitterRepositoryError) -> int:
+    """HTTP status for a repository error: 429 when the action queue is full, else 503."""
+    if error.error_code == "QUEUE_FULL":
+        return status.HTTP_429_TOO_MANY_REQUESTS
+    return status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def _require_known_account(account: Optional[str]) -> None:
+    """Answer 400 for an account missing from TWITTER_ACCOUNTS (so it never reads as a 404)."""
+    accounts = config.get_accounts()
+    if account and account not in accounts:
+        logger.error(f"Validation error: unknown account '{account}'")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": f"Unknown account '{account}'. Configured accounts: {', '.join(accounts)}",
+                "error_code": "VALIDATION_ERROR"
+            }
+        )
 
 
 @router.post("/read_tweets", response_model=ReadTweetsResponse)
@@ -87,21 +211,23 @@ async def read_tweets(request: ReadTweetsRequest):
     logger.info(f"API request: read_tweets for @{request.username}, count={request.count}")
 
     try:
-        tweets = await _read_tweets_use_case.execute(request.username, request.count)
+        tweets = await _read_tweets_use_case.execute(request.username, request.count, account=request.account)
 
         # Convert domain models to API schemas
         tweet_schemas = [TweetSchema(**tweet.to_dict()) for tweet in tweets]
 
+        cache_age = getattr(tweets, "cache_age_seconds", None)
         return ReadTweetsResponse(
             success=True,
             tweets=tweet_schemas,
-            count=len(tweet_schemas)
+            count=len(tweet_schemas),
+            cache_age_seconds=round(cache_age, 3) if cache_age is not None else None
         )
 
     except TwitterRepositoryError as e:
         logger.error(f"Twitter error reading tweets: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=_repository_error_status(e),
             detail={
                 "success": False,
                 "error": e.message,
@@ -131,12 +257,16 @@ async def read_tweets(request: ReadTweetsRequest):
 
 
 @router.post("/reply", response_model=ActionResponse)
-async def reply_to_tweet(request: ReplyToTweetRequest):
+async def reply_to_tweet(
+    request: ReplyToTweetRequest,
+    run_async: bool = Query(False, alias="async", description="Return 202 with a job ID instead of waiting")
+):
     """
     Reply to a tweet.
 
     Args:
         request: ReplyToTweetRequest with tweet_id and text
+        run_async: If true, enqueue the action and return 202 with a job ID
 
     Returns:
         ActionResponse with success status
@@ -146,8 +276,18 @@ async def reply_to_tweet(request: ReplyToTweetRequest):
     """
     logger.info(f"API request: reply to tweet {request.tweet_id}")
 
+    # Validate before any job is accepted, so async mode answers 400 like sync mode
+    _require_known_account(request.account)
+
     try:
-        result = await _reply_use_case.execute(request.tweet_id, request.text)
+        if run_async:
+            return await _accept_job(
+                "reply",
+                request,
+                lambda: _reply_use_case.execute(request.tweet_id, request.text, account=request.account)
+            )
+
+        result = await _reply_use_case.execute(request.tweet_id, request.text, account=request.account)
 
         return ActionResponse(
             success=result.success,
@@ -158,7 +298,7 @@ async def reply_to_tweet(request: ReplyToTweetRequest):
     except TwitterRepositoryError as e:
         logger.error(f"Twitter error replying to tweet: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=_repository_error_status(e),
             detail={
                 "success": False,
                 "error": e.message,
@@ -188,12 +328,16 @@ async def reply_to_tweet(request: ReplyToTweetRequest):
 
 
 @router.post("/retweet", response_model=ActionResponse)
-async def retweet(request: RetweetRequest):
+async def retweet(
+    request: RetweetRequest,
+    run_async: bool = Query(False, alias="async", description="Return 202 with a job ID instead of waiting")
+):
     """
     Retweet (repost) a tweet.
 
     Args:
         request: RetweetRequest with tweet_id
+        run_async: If true, enqueue the action and return 202 with a job ID
 
     Returns:
         ActionResponse with success status
@@ -203,8 +347,18 @@ async def retweet(request: RetweetRequest):
     """
     logger.info(f"API request: retweet {request.tweet_id}")
 
+    # Validate before any job is accepted, so async mode answers 400 like sync mode
+    _require_known_account(request.account)
+
     try:
-        result = await _retweet_use_case.execute(request.tweet_id)
+        if run_async:
+            return await _accept_job(
+                "retweet",
+                request,
+                lambda: _retweet_use_case.execute(request.tweet_id, account=request.account)
+            )
+
+        result = await _retweet_use_case.execute(request.tweet_id, account=request.account)
 
         return ActionResponse(
             success=result.success,
@@ -215,13 +369,23 @@ async def retweet(request: RetweetRequest):
     except TwitterRepositoryError as e:
         logger.error(f"Twitter error retweeting: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=_repository_error_status(e),
             detail={
                 "success": False,
                 "error": e.message,
                 "error_code": e.error_code
             }
         )
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": str(e),
+                "error_code": "VALIDATION_ERROR"
+            }
+        )
     except Exception as e:
         logger.exception(f"Unexpected error retweeting: {e}")
         raise HTTPException(
@@ -235,12 +399,16 @@ async def retweet(request: RetweetRequest):
 
 
 @router.post("/post_tweet", response_model=ActionResponse)
-async def post_tweet(request: PostTweetRequest):
+async def post_tweet(
+    request: PostTweetRequest,
+    run_async: bool = Query(False, alias="async", description="Return 202 with a job ID instead of waiting")
+):
     """
     Post a new tweet.
 
     Args:
         request: PostTweetRequest with text
+        run_async: If true, enqueue the action and return 202 with a job ID
 
     Returns:
         ActionResponse with success status and tweet metadata
@@ -250,8 +418,18 @@ async def post_tweet(request: PostTweetRequest):
     """
     logger.info("API request: post new tweet")
 
+    # Validate before any job is accepted, so async mode answers 400 like sync mode
+    _require_known_account(request.account)
+
     try:
-        result = await _post_tweet_use_case.execute(request.text)
+        if run_async:
+            return await _accept_job(
+                "post_tweet",
+                request,
+                lambda: _post_tweet_use_case.execute(request.text, account=request.account)
+            )
+
+        result = await _post_tweet_use_case.execute(request.text, account=request.account)
 
         return ActionResponse(
             success=result.success,
@@ -262,7 +440,7 @@ async def post_tweet(request: PostTweetRequest):
     except TwitterRepositoryError as e:
         logger.error(f"Twitter error posting tweet: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=_repository_error_status(e),
             detail={
                 "success": False,
                 "error": e.message,
@@ -294,7 +472,38 @@ async def post_tweet(request: PostTweetRequest):
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "twitter-mcp-agent"}
+    health = {"status": "healthy", "service": "twitter-mcp-agent"}
+    if _mention_poller:
+        health["mention_poller"] = _mention_poller.stats()
+    if _action_scheduler:
+        health["action_queue"] = _action_scheduler.stats()
+    return health
+
+
+@router.get("/debug/mongo")
+async def debug_mongo():
+    """
+    MongoDB command statistics from the command monitor.
+
+    Returns:
+        Per command/collection counts and latencies, and the most recent
+        slow commands with their query shape and, when sampled for
+        explain, whether they used an index (plan: IXSCAN) or scanned
+        the collection (plan: COLLSCAN)
+
+    Raises:
+        HTTPException: If MONGO_MONITORING_ENABLED is off
+    """
+    if not _mongo_monitor:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "error": "MongoDB monitoring is disabled (set MONGO_MONITORING_ENABLED=true)",
+                "error_code": "NOT_FOUND"
+            }
+        )
+    return _mongo_monitor.snapshot()
 
 
 # New MongoDB-backed endpoints
@@ -302,13 +511,15 @@ async def health_check():
 @router.get("/mentions/unanswered", response_model=UnansweredMentionsResponse)
 async def get_unanswered_mentions(
     count: int = Query(5, ge=1, le=50),
-    username: str = Query(None, description="Optional: filter mentions from specific user")
+    username: str = Query(None, description="Optional: filter mentions from specific user"),
+    account: str = Query(None, description="Optional: bot account whose mentions are read"),
+    fresh: bool = Query(False, description="Scrape Twitter now even if the mention poller is running")
 ):
     """
     Get unanswered mentions with abuse prevention.
 
     This endpoint:
-    - Fetches recent mentions from Twitter
+    - Fetches recent mentions from Twitter (skipped while the mention poller runs, unless fresh=true)
     - Stores them in MongoDB
     - Returns unanswered mentions (max 1 per user per batch, unless filtering by username)
     - Auto-blocks users with 10+ ignored mentions
@@ -316,6 +527,8 @@ async def get_unanswered_mentions(
     Args:
         count: Number of unanswered mentions to return (1-50)
         username: Optional filter to get mentions only from this specific user
+        account: Optional bot account (default account if omitted)
+        fresh: Scrape before reading even when the poller keeps MongoDB current
 
     Returns:
         UnansweredMentionsResponse with list of mentions
@@ -330,7 +543,8 @@ async def get_unanswered_mentions(
         logger.info(f"API request: get {count} unanswered mentions")
 
     try:
-        mentions = await _get_unanswered_mentions_use_case.execute(count, username)
+        scrape = fresh or _mention_poller is None or not _mention_poller.is_running()
+        mentions = await _get_unanswered_mentions_use_case.execute(count, username, account=account, fresh=scrape)
 
         # Convert to API format
         mentions_data = [m.to_api_dict() for m in mentions]
@@ -345,13 +559,23 @@ async def get_unanswered_mentions(
     except TwitterRepositoryError as e:
         logger.error(f"Twitter error fetching mentions: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=_repository_error_status(e),
             detail={
                 "success": False,
                 "error": e.message,
                 "error_code": e.error_code
             }
         )
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": str(e),
+                "error_code": "VALIDATION_ERROR"
+            }
+        )
     except Exception as e:
         logger.exception(f"Unexpected error fetching mentions: {e}")
         raise HTTPException(
@@ -364,8 +588,56 @@ async def get_unanswered_mentions(
         )
 
 
+@router.get("/mentions/stream")
+async def stream_mentions(
+    account: str = Query(None, description="Optional: only mentions of this bot account")
+):
+    """
+    Push new mentions as Server-Sent Events.
+
+    Every mention stored for the first time (by the poller or a fresh
+    request) is sent as a `mention` event whose data is the mention's API
+    dict plus the account it was read for. A comment line is sent every
+    STREAM_HEARTBEAT_SECONDS to keep proxies from closing the
+    connection.
+
+    Args:
+        account: Optional bot account to filter on
+
+    Returns:
+        text/event-stream response
+    """
+    logger.info(f"API request: mention stream (account={account or 'all'})")
+
+    async def events():
+        async with _mention_broadcaster.subscribe() as queue:
+            yield ": connected\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=config.STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                # Events without an account come from the default (first configured) one
+                event_account = config.resolve_account(event.get("account"))
+                if account and event_account != account:
+                    continue
+                payload = {**event["mention"], "account": event_account}
+                yield f"event: mention\nid: {payload['idTweet']}\ndata: {json.dumps(payload)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/tweets/unanswered/{username}", response_model=UnansweredTweetsResponse)
-async def get_unanswered_tweets_from_user(username: str, count: int = Query(5, ge=1, le=50)):
+async def get_unanswered_tweets_from_user(
+    username: str,
+    count: int = Query(5, ge=1, le=50),
+    account: str = Query(None, description="Optional: bot account to read as")
+):
     """
     Get unanswered tweets from a specific user.
 
@@ -377,6 +649,7 @@ async def get_unanswered_tweets_from_user(username: str, count: int = Query(5, g
     Args:
         username: Twitter username (without @)
         count: Number of unanswered tweets to return (1-50)
+        account: Optional bot account (default account if omitted)
 
     Returns:
         UnansweredTweetsResponse with list of tweets
@@ -388,7 +661,7 @@ async def get_unanswered_tweets_from_user(username: str, count: int = Query(5, g
     logger.info(f"API request: get {count} unanswered tweets from @{username}")
 
     try:
-        tweets = await _get_unanswered_tweets_from_user_use_case.execute(username, count)
+        tweets = await _get_unanswered_tweets_from_user_use_case.execute(username, count, account=account)
 
         # Convert to API format
         tweets_data = [t.to_api_dict() for t in tweets]
@@ -403,13 +676,23 @@ async def get_unanswered_tweets_from_user(username: str, count: int = Query(5, g
     except TwitterRepositoryError as e:
         logger.error(f"Twitter error fetching tweets from @{username}: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=_repository_error_status(e),
             detail={
                 "success": False,
                 "error": e.message,
                 "error_code": e.error_code
             }
         )
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": str(e),
+                "error_code": "VALIDATION_ERROR"
+            }
+        )
     except Exception as e:
         logger.exception(f"Unexpected error fetching tweets from @{username}: {e}")
         raise HTTPException(
@@ -423,7 +706,10 @@ async def get_unanswered_tweets_from_user(username: str, count: int = Query(5, g
 
 
 @router.post("/reply_by_id", response_model=ActionResponse)
-async def reply_by_id_tweet(request: ReplyByIdRequest):
+async def reply_by_id_tweet(
+    request: ReplyByIdRequest,
+    run_async: bool = Query(False, alias="async", description="Return 202 with a job ID instead of waiting")
+):
     """
     Reply to a tweet using its internal MongoDB ID.
 
@@ -435,6 +721,7 @@ async def reply_by_id_tweet(request: ReplyByIdRequest):
 
     Args:
         request: ReplyByIdRequest with idTweet, text, and optional quoted flag
+        run_async: If true, enqueue the action and return 202 with a job ID
 
     Returns:
         ActionResponse with success status
@@ -445,11 +732,28 @@ async def reply_by_id_tweet(request: ReplyByIdRequest):
     action_type = "quote tweet" if request.quoted else "reply"
     logger.info(f"API request: {action_type} to idTweet={request.idTweet}")
 
+    # The use case raises ValueError both for this and for an unknown idTweet;
+    # checking here also keeps the error synchronous in async mode
+    _require_known_account(request.account)
+
     try:
+        if run_async:
+            return await _accept_job(
+                "reply_by_id",
+                request,
+                lambda: _reply_by_id_use_case.execute(
+                    request.idTweet,
+                    request.text,
+                    quoted=request.quoted,
+                    account=request.account
+                )
+            )
+
         result = await _reply_by_id_use_case.execute(
             request.idTweet,
             request.text,
-            quoted=request.quoted
+            quoted=request.quoted,
+            account=request.account
         )
 
         return ActionResponse(
@@ -471,7 +775,7 @@ async def reply_by_id_tweet(request: ReplyByIdRequest):
     except TwitterRepositoryError as e:
         logger.error(f"Twitter error replying: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=_repository_error_status(e),
             detail={
                 "success": False,
                 "error": e.message,
@@ -488,3 +792,88 @@ async def reply_by_id_tweet(request: ReplyByIdRequest):
                 "error_code": "INTERNAL_ERROR"
             }
         )
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """
+    Get the state of a job accepted with ?async=true.
+
+    Args:
+        job_id: ID returned in the 202 response
+
+    Returns:
+        JobResponse with status (queued, running, succeeded, failed) and,
+        once finished, the action result or error
+
+    Raises:
+        HTTPException: If the job does not exist
+    """
+    job = await _job_runner.mongo_repo.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "error": f"Job not found with jobId={job_id}",
+                "error_code": "NOT_FOUND"
+            }
+        )
+    return JobResponse(success=True, job=job.to_api_dict(), status_url=f"{router.prefix}/jobs/{job_id}")
+
+
+@router.get("/jobs/{job_id}/stream")
+async def stream_job(job_id: str):
+    """
+    Follow a job as Server-Sent Events until it finishes.
+
+    Sends the current state first, then a `job` event per state change;
+    the stream ends after the succeeded/failed event.
+
+    Args:
+        job_id: ID returned in the 202 response
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        HTTPException: If the job does not exist
+    """
+    if not await _job_runner.mongo_repo.get_job(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "error": f"Job not found with jobId={job_id}",
+                "error_code": "NOT_FOUND"
+            }
+        )
+
+    def job_event(job_data: Dict[str, Any]) -> str:
+        return f"event: job\ndata: {json.dumps(job_data)}\n\n"
+
+    async def events():
+        # Subscribe before re-reading the job so no state change is missed in between
+        async with _job_runner.broadcaster.subscribe() as queue:
+            job = await _job_runner.mongo_repo.get_job(job_id)
+            yield job_event(job.to_api_dict())
+            if job.done:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=config.STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                job_data = event["job"]
+                if job_data["jobId"] != job_id:
+                    continue
+                yield job_event(job_data)
+                if job_data["status"] in ("succeeded", "failed"):
+                    return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -9,6 +9,7 @@ class ReadTweetsRequest(BaseModel):
 
     username: str = Field(..., description="Twitter username (without @)", min_length=1)
     count: int = Field(5, description="Number of tweets to retrieve", ge=1, le=100)
+    account: Optional[str] = Field(None, description="Bot account to act as (default account if omitted)")
 
     @validator('username')
     def username_no_at(cls, v):
@@ -21,18 +22,21 @@ class ReplyToTweetRequest(BaseModel):
 
     tweet_id: str = Field(..., description="ID of the tweet to reply to", min_length=1)
     text: str = Field(..., description="Reply text", min_length=1, max_length=280)
+    account: Optional[str] = Field(None, description="Bot account to act as (default account if omitted)")
 
 
 class RetweetRequest(BaseModel):
     """Request schema for retweeting."""
 
     tweet_id: str = Field(..., description="ID of the tweet to retweet", min_length=1)
+    account: Optional[str] = Field(None, description="Bot account to act as (default account if omitted)")
 
 
 class PostTweetRequest(BaseModel):
     """Request schema for posting a tweet."""
 
     text: str = Field(..., description="Tweet text", min_length=1, max_length=280)
+    account: Optional[str] = Field(None, description="Bot account to act as (default account if omitted)")
 
 
 class TweetSchema(BaseModel):
@@ -54,6 +58,7 @@ class ReadTweetsResponse(BaseModel):
     success: bool
     tweets: List[TweetSchema]
     count: int
+    cache_age_seconds: Optional[float] = None  # Set when served by the timeline cache (0 = just read)
 
 
 class ActionResponse(BaseModel):
@@ -65,6 +70,14 @@ class ActionResponse(BaseModel):
     error_code: Optional[str] = None
 
 
+class JobResponse(BaseModel):
+    """Response schema for write actions accepted with ?async=true, and job lookups."""
+
+    success: bool
+    job: Dict[str, Any]  # Job.to_api_dict(): jobId, status, result/error once finished
+    status_url: str
+
+
 class ErrorResponse(BaseModel):
     """Error response schema."""
 
@@ -124,3 +137,4 @@ class ReplyByIdRequest(BaseModel):
     idTweet: str = Field(..., description="Internal MongoDB UUID of the tweet", min_length=1)
     text: str = Field(..., description="Reply text", min_length=1, max_length=280)
     quoted: bool = Field(False, description="If true, post as quote tweet instead of reply")
+    account: Optional[str] = Field(None, description="Bot account to act as (default account if omitted)")
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,14 +15,97 @@ class Config:
     # Twitter settings
     TWITTER_BASE_URL: str = os.getenv("TWITTER_BASE_URL", "https://x.com")
     AUTH_STATE_PATH: str = os.getenv("AUTH_STATE_PATH", "auth.json")
+    # Several bot accounts as "name=auth_file,name2=auth_file2" (first is the default);
+    # empty means a single "default" account using AUTH_STATE_PATH
+    TWITTER_ACCOUNTS: str = os.getenv("TWITTER_ACCOUNTS", "")
+    # "network" reads timelines from captured GraphQL responses (falls back to DOM); "dom" scrapes only
+    TWITTER_CAPTURE_MODE: str = os.getenv("TWITTER_CAPTURE_MODE", "network").lower()
+    # "playwright" drives X in a browser; "memory" serves synthetic timelines (load testing, no browser)
+    TWITTER_BACKEND: str = os.getenv("TWITTER_BACKEND", "playwright").lower()
+
+    # In-memory backend (TWITTER_BACKEND=memory): per-call latency (fixed, uniform,
+    # exponential or lognormal around the median; spread is the uniform +/- fraction
+    # or the lognormal sigma), injected error rates (0-1) and calls running at once
+    MEMORY_LATENCY_DISTRIBUTION: str = os.getenv("MEMORY_LATENCY_DISTRIBUTION", "lognormal").lower()
+    MEMORY_READ_LATENCY_MS: float = float(os.getenv("MEMORY_READ_LATENCY_MS", "300"))
+    MEMORY_WRITE_LATENCY_MS: float = float(os.getenv("MEMORY_WRITE_LATENCY_MS", "1500"))
+    MEMORY_LATENCY_SPREAD: float = float(os.getenv("MEMORY_LATENCY_SPREAD", "0.5"))
+    MEMORY_TIMEOUT_RATE: float = float(os.getenv("MEMORY_TIMEOUT_RATE", "0"))
+    MEMORY_FAILURE_RATE: float = float(os.getenv("MEMORY_FAILURE_RATE", "0"))
+    # How long an injected timeout holds its slot before failing
+    MEMORY_TIMEOUT_MS: float = float(os.getenv("MEMORY_TIMEOUT_MS", "5000"))
+    MEMORY_MAX_CONCURRENCY: int = int(os.getenv("MEMORY_MAX_CONCURRENCY", "3"))
+    MEMORY_TIMELINE_LENGTH: int = int(os.getenv("MEMORY_TIMELINE_LENGTH", "1000"))
 
     # Browser settings
     BROWSER_HEADLESS: bool = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
     BROWSER_TIMEOUT: int = int(os.getenv("BROWSER_TIMEOUT", "60000"))
+    BROWSER_WARMUP: bool = os.getenv("BROWSER_WARMUP", "true").lower() == "true"
+    # Persistent profile directory (keeps the session warm across restarts)
+    BROWSER_USER_DATA_DIR: Optional[str] = os.getenv("BROWSER_USER_DATA_DIR") or None
+    # Attach to an already-running Chromium (e.g. http://localhost:9222) instead of launching
+    BROWSER_CDP_URL: Optional[str] = os.getenv("BROWSER_CDP_URL") or None
+    BROWSER_PAGE_POOL_SIZE: int = int(os.getenv("BROWSER_PAGE_POOL_SIZE", "3"))
+    BROWSER_CONTEXT_COUNT: int = int(os.getenv("BROWSER_CONTEXT_COUNT", "1"))
+    BROWSER_PAGE_ACQUIRE_TIMEOUT: float = float(os.getenv("BROWSER_PAGE_ACQUIRE_TIMEOUT", "60"))
+    BROWSER_ACTION_TIMEOUT: int = int(os.getenv("BROWSER_ACTION_TIMEOUT", "5000"))
+
+    # Shared browser worker (run_browser_worker.py); front ends proxy to it when enabled
+    BROWSER_SERVICE_ENABLED: bool = os.getenv("BROWSER_SERVICE_ENABLED", "false").lower() == "true"
+    BROWSER_SERVICE_URL: str = os.getenv("BROWSER_SERVICE_URL", "http://127.0.0.1:8765")
+    # Unix socket path; takes precedence over BROWSER_SERVICE_URL when set
+    BROWSER_SERVICE_UDS: Optional[str] = os.getenv("BROWSER_SERVICE_UDS") or None
+    BROWSER_SERVICE_TIMEOUT: float = float(os.getenv("BROWSER_SERVICE_TIMEOUT", "180"))
+
+    # Resource blocking (comma-separated lists; URL patterns are substrings)
+    BROWSER_BLOCK_RESOURCES: bool = os.getenv("BROWSER_BLOCK_RESOURCES", "true").lower() == "true"
+    BROWSER_BLOCKED_RESOURCE_TYPES: List[str] = [
+        t.strip() for t in os.getenv("BROWSER_BLOCKED_RESOURCE_TYPES", "image,media,font").split(",") if t.strip()
+    ]
+    BROWSER_BLOCKED_URL_PATTERNS: List[str] = [
+        p.strip() for p in os.getenv(
+            "BROWSER_BLOCKED_URL_PATTERNS",
+            "google-analytics.com,googletagmanager.com,doubleclick.net,ads-twitter.com,"
+            "ads-api.x.com,analytics.twitter.com,/i/api/1.1/jot/,/1.1/jot/,/i/jot"
+        ).split(",") if p.strip()
+    ]
+    BROWSER_ALLOWED_URL_PATTERNS: List[str] = [
+        p.strip() for p in os.getenv("BROWSER_ALLOWED_URL_PATTERNS", "abs.twimg.com/responsive-web/").split(",") if p.strip()
+    ]
+
+    # Readiness waits (upper bounds for event-driven waits, in milliseconds)
+    READINESS_MAX_WAIT_MS: int = int(os.getenv("READINESS_MAX_WAIT_MS", "3000"))
+    READINESS_STABLE_MS: int = int(os.getenv("READINESS_STABLE_MS", "400"))
+
+    # Timeline pagination
+    TIMELINE_TIME_BUDGET_SECONDS: float = float(os.getenv("TIMELINE_TIME_BUDGET_SECONDS", "20"))
+    TIMELINE_MAX_IDLE_SCROLLS: int = int(os.getenv("TIMELINE_MAX_IDLE_SCROLLS", "3"))
 
     # MCP settings
     MCP_SERVER_NAME: str = os.getenv("MCP_SERVER_NAME", "TwitterMCPAgent")
 
+    # Profile timeline cache ("memory" per process, or "redis" shared by every worker)
+    TIMELINE_CACHE_ENABLED: bool = os.getenv("TIMELINE_CACHE_ENABLED", "false").lower() == "true"
+    TIMELINE_CACHE_BACKEND: str = os.getenv("TIMELINE_CACHE_BACKEND", "memory").lower()
+    TIMELINE_CACHE_TTL_SECONDS: float = float(os.getenv("TIMELINE_CACHE_TTL_SECONDS", "30"))
+    # Past the TTL, serve the cached list for this long while refreshing in the background
+    TIMELINE_CACHE_STALE_SECONDS: float = float(os.getenv("TIMELINE_CACHE_STALE_SECONDS", "300"))
+    TIMELINE_CACHE_MAX_BYTES: int = int(os.getenv("TIMELINE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+    TIMELINE_CACHE_REDIS_URL: str = os.getenv("TIMELINE_CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+    # Action scheduler: priority lanes in front of the browser (interactive > background ingestion)
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "false").lower() == "true"
+    # Calls running at once across lanes; defaults to the page pool size
+    SCHEDULER_TOTAL_CONCURRENCY: int = int(os.getenv("SCHEDULER_TOTAL_CONCURRENCY", "0")) or BROWSER_PAGE_POOL_SIZE
+    SCHEDULER_INTERACTIVE_CONCURRENCY: int = int(os.getenv("SCHEDULER_INTERACTIVE_CONCURRENCY", "3"))
+    SCHEDULER_BACKGROUND_CONCURRENCY: int = int(os.getenv("SCHEDULER_BACKGROUND_CONCURRENCY", "1"))
+    SCHEDULER_MAX_QUEUE_DEPTH: int = int(os.getenv("SCHEDULER_MAX_QUEUE_DEPTH", "50"))
+    # A waiting lower-priority lane is served after being skipped this many times
+    SCHEDULER_FAIRNESS: int = int(os.getenv("SCHEDULER_FAIRNESS", "4"))
+
+    # Share one in-flight scrape between concurrent identical reads (a larger count serves a smaller one)
+    SINGLE_FLIGHT_ENABLED: bool = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
     # REST API settings
     HTTP_HOST: str = os.getenv("HTTP_HOST", "0.0.0.0")
     HTTP_PORT: int = int(os.getenv("HTTP_PORT", "8000"))
@@ -45,6 +128,35 @@ class Config:
     # Abuse prevention settings
     MAX_MENTIONS_PER_USER_IN_BATCH: int = int(os.getenv("MAX_MENTIONS_PER_USER_IN_BATCH", "1"))
     MAX_IGNORED_BEFORE_BLOCK: int = int(os.getenv("MAX_IGNORED_BEFORE_BLOCK", "10"))
+    # Blocked usernames are cached in memory; reload interval, and optional change-stream sync (replica set only)
+    BLOCKED_USERS_CACHE_TTL_SECONDS: float = float(os.getenv("BLOCKED_USERS_CACHE_TTL_SECONDS", "60"))
+    BLOCKED_USERS_WATCH: bool = os.getenv("BLOCKED_USERS_WATCH", "false").lower() == "true"
+    # Ignore duplicate mentions / block offenders after the response instead of inside the request
+    MENTION_DUPLICATES_IN_BACKGROUND: bool = os.getenv("MENTION_DUPLICATES_IN_BACKGROUND", "false").lower() == "true"
+
+    # Background mention poller (REST API); GET /mentions/unanswered then reads MongoDB only
+    MENTION_POLLER_ENABLED: bool = os.getenv("MENTION_POLLER_ENABLED", "false").lower() == "true"
+    MENTION_POLLER_INTERVAL_SECONDS: float = float(os.getenv("MENTION_POLLER_INTERVAL_SECONDS", "60"))
+    MENTION_POLLER_JITTER_SECONDS: float = float(os.getenv("MENTION_POLLER_JITTER_SECONDS", "15"))
+    MENTION_POLLER_COUNT: int = int(os.getenv("MENTION_POLLER_COUNT", "20"))
+    # Stop reading mentions at the newest one already synced (high-water mark in sync_state)
+    MENTION_SYNC_INCREMENTAL: bool = os.getenv("MENTION_SYNC_INCREMENTAL", "true").lower() == "true"
+    # Seconds between keep-alive comments on event streams (mentions, jobs)
+    STREAM_HEARTBEAT_SECONDS: float = float(os.getenv("STREAM_HEARTBEAT_SECONDS", "15"))
+
+    # Write actions accepted with ?async=true run in the background, this many at a time
+    JOBS_MAX_CONCURRENCY: int = int(os.getenv("JOBS_MAX_CONCURRENCY", "2"))
+
+    # pymongo command monitoring: per-collection latency, slow-command log (GET /debug/mongo)
+    # and queryPlanner explains for a sampled share (0-1) of slow commands
+    MONGO_MONITORING_ENABLED: bool = os.getenv("MONGO_MONITORING_ENABLED", "false").lower() == "true"
+    MONGO_SLOW_QUERY_MS: float = float(os.getenv("MONGO_SLOW_QUERY_MS", "100"))
+    MONGO_EXPLAIN_SAMPLE_RATE: float = float(os.getenv("MONGO_EXPLAIN_SAMPLE_RATE", "0"))
+
+    # Prometheus-text metrics at GET /metrics (REST API); the MCP server serves its
+    # own on METRICS_MCP_PORT (0 = not served)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    METRICS_MCP_PORT: int = int(os.getenv("METRICS_MCP_PORT", "0"))
 
     @classmethod
     def get_mongo_uri(cls) -> str:
@@ -58,18 +170,41 @@ class Config:
     @classmethod
     def validate(cls) -> None:
         """Validate that required configuration is present."""
-        auth_path = Path(cls.AUTH_STATE_PATH)
-        if not auth_path.exists():
-            raise FileNotFoundError(
-                f"Authentication file not found: {cls.AUTH_STATE_PATH}. "
-                f"Please run login_and_save_auth.py first."
-            )
+        for auth_path in cls.get_accounts().values():
+            if not auth_path.exists():
+                raise FileNotFoundError(
+                    f"Authentication file not found: {auth_path}. "
+                    f"Please run login_and_save_auth.py first."
+                )
 
     @classmethod
     def get_auth_state_path(cls) -> Path:
         """Get the authentication state file path."""
         return Path(cls.AUTH_STATE_PATH)
 
+    @classmethod
+    def get_accounts(cls) -> Dict[str, Path]:
+        """
+        Get the configured accounts and their storage-state files, in order.
+
+        Raises:
+            ValueError: If TWITTER_ACCOUNTS is malformed
+        """
+        accounts: Dict[str, Path] = {}
+        for entry in cls.TWITTER_ACCOUNTS.split(","):
+            if not entry.strip():
+                continue
+            name, sep, path = entry.partition("=")
+            if not sep or not name.strip() or not path.strip():
+                raise ValueError(f"Invalid TWITTER_ACCOUNTS entry '{entry}', expected name=auth_file")
+            accounts[name.strip()] = Path(path.strip())
+        return accounts or {"default": cls.get_auth_state_path()}
+
+    @classmethod
+    def resolve_account(cls, account: Optional[str]) -> str:
+        """Name of `account`, or of the default (first configured) account if None."""
+        return account or next(iter(cls.get_accounts()))
+
 
 # Global config instance
 config = Config()
@@ -1,13 +1,33 @@
 """Domain interfaces (ports) for dependency inversion."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from src.domain.models import Tweet, ActionResult, TweetPostResult, ReplyResult
 
 
 class ITwitterRepository(ABC):
     """Interface for Twitter operations - to be implemented by infrastructure layer."""
 
+    def for_account(self, account: Optional[str]) -> 'ITwitterRepository':
+        """
+        Get a repository that acts as the given bot account.
+
+        Implementations that manage several accounts override this; the
+        default only knows its own account.
+
+        Args:
+            account: Account name, or None for the default account
+
+        Returns:
+            Repository bound to that account
+
+        Raises:
+            ValueError: If the account is not available
+        """
+        if account is None:
+            return self
+        raise ValueError(f"Account '{account}' is not available in this repository")
+
     @abstractmethod
     async def read_last_tweets(self, username: str, count: int) -> List[Tweet]:
         """
@@ -92,12 +112,14 @@ class ITwitterRepository(ABC):
         pass
 
     @abstractmethod
-    async def read_last_mentions(self, count: int) -> List[Tweet]:
+    async def read_last_mentions(self, count: int, since_id: Optional[str] = None) -> List[Tweet]:
         """
         Read the last N mentions of the authenticated account.
 
         Args:
             count: Number of mentions to retrieve
+            since_id: Only return mentions newer than this status ID; reading
+                stops as soon as the timeline reaches it
 
         Returns:
             List of Tweet objects representing mentions
@@ -27,6 +27,29 @@ class Tweet:
             data["created_at"] = self.created_at.isoformat()
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Tweet':
+        """Create Tweet from the dictionary produced by to_dict()."""
+        data = dict(data)
+        if data.get("created_at"):
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return cls(**data)
+
+
+class TweetList(list):
+    """List of tweets plus read metadata (how old a cached read is)."""
+
+    def __init__(self, tweets=(), cache_age_seconds: Optional[float] = None):
+        super().__init__(tweets)
+        self.cache_age_seconds = cache_age_seconds
+
+    def __getitem__(self, index):
+        # Slices keep the metadata (callers trim cached or shared reads to their count)
+        result = super().__getitem__(index)
+        if isinstance(index, slice):
+            return TweetList(result, self.cache_age_seconds)
+        return result
+
 
 @dataclass
 class ActionResult:
@@ -103,6 +126,14 @@ class BlockedReason(str, Enum):
     MANUAL = "manual"
 
 
+class JobStatus(str, Enum):
+    """Lifecycle of an asynchronous write job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
 @dataclass
 class StoredTweet:
     """Tweet as stored in MongoDB with tracking metadata."""
@@ -198,20 +229,37 @@ class Mention(StoredTweet):
     """Mention-specific extension of StoredTweet."""
 
     mentioned_users: List[str] = field(default_factory=list)
+    account: Optional[str] = None  # Bot account whose mentions timeline it was read from
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for MongoDB storage."""
         data = super().to_dict()
         data["mentionedUsers"] = self.mentioned_users
+        if self.account:
+            data["account"] = self.account
         return data
 
     def to_api_dict(self) -> Dict[str, Any]:
         """Convert to API response format."""
         data = super().to_api_dict()
         data["mentionedUsers"] = self.mentioned_users
+        data["account"] = self.account
         return data
 
 
+@dataclass
+class BulkStoreResult:
+    """Outcome of upserting a batch of tweets or mentions."""
+
+    inserted_count: int = 0
+    matched_count: int = 0
+    inserted_tweet_ids: List[str] = field(default_factory=list)  # Twitter IDs seen for the first time
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-serializable dictionary."""
+        return asdict(self)
+
+
 @dataclass
 class BlockedUser:
     """User that has been blocked due to abuse."""
@@ -240,6 +288,29 @@ class BlockedUser:
         }
 
 
+@dataclass
+class AuthorStats:
+    """Running mention counters for one author (author_stats collection)."""
+
+    username: str
+    total_mentions: int = 0
+    ignored_mentions: int = 0
+    replied_mentions: int = 0
+    first_seen_at: Optional[datetime] = None
+    last_activity_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for MongoDB storage."""
+        return {
+            "username": self.username,
+            "totalMentions": self.total_mentions,
+            "ignoredMentions": self.ignored_mentions,
+            "repliedMentions": self.replied_mentions,
+            "firstSeenAt": self.first_seen_at,
+            "lastActivityAt": self.last_activity_at
+        }
+
+
 @dataclass
 class Action:
     """Audit log of actions we've taken."""
@@ -270,3 +341,51 @@ class Action:
             "performedAt": self.performed_at,
             "metadata": self.metadata
         }
+
+
+@dataclass
+class Job:
+    """Write action accepted with ?async=true and run in the background."""
+
+    action: str  # "reply" | "reply_by_id" | "retweet" | "post_tweet"
+    params: Dict[str, Any]
+    job_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: JobStatus = JobStatus.QUEUED
+    account: Optional[str] = None
+
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    error_code: Optional[str] = None
+
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job reached a final state."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for MongoDB storage."""
+        return {
+            "jobId": self.job_id,
+            "action": self.action,
+            "params": self.params,
+            "status": self.status.value,
+            "account": self.account,
+            "result": self.result,
+            "error": self.error,
+            "errorCode": self.error_code,
+            "createdAt": self.created_at,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at
+        }
+
+    def to_api_dict(self) -> Dict[str, Any]:
+        """Convert to API response format."""
+        data = self.to_dict()
+        for key in ("createdAt", "startedAt", "finishedAt"):
+            if data[key]:
+                data[key] = data[key].isoformat()
+        return data
@@ -3,6 +3,7 @@
 import logging
 from typing import List, Optional
 from datetime import datetime
+from src.config import config
 from src.domain.interfaces import ITwitterRepository, TwitterRepositoryError
 from src.domain.models import Tweet, ActionResult, TweetPostResult, ReplyResult, Action
 
@@ -12,16 +13,18 @@ logger = logging.getLogger(__name__)
 class ReadLastTweetsUseCase:
     """Use case for reading the last tweets from a user."""
 
-    def __init__(self, twitter_repo: ITwitterRepository):
+    def __init__(self, twitter_repo: ITwitterRepository, single_flight=None):
         self.twitter_repo = twitter_repo
+        self.single_flight = single_flight  # Optional SingleFlight coalescing identical concurrent reads
 
-    async def execute(self, username: str, count: int = 5) -> List[Tweet]:
+    async def execute(self, username: str, count: int = 5, account: Optional[str] = None) -> List[Tweet]:
         """
         Execute the use case to read last tweets.
 
         Args:
             username: Twitter username (without @)
             count: Number of tweets to retrieve (default: 5)
+            account: Bot account to read as (default account if None)
 
         Returns:
             List of Tweet objects
@@ -36,8 +39,18 @@ class ReadLastTweetsUseCase:
         if count > 100:
             raise ValueError("Count cannot exceed 100")
 
+        if self.single_flight:
+            return await self.single_flight.do(
+                ("read_last_tweets", username.lower(), account),
+                count,
+                lambda n: self._read(username, n, account)
+            )
+        return await self._read(username, count, account)
+
+    async def _read(self, username: str, count: int, account: Optional[str]) -> List[Tweet]:
+        """Read from Twitter (one browser navigation)."""
         try:
-            tweets = await self.twitter_repo.read_last_tweets(username, count)
+            tweets = await self.twitter_repo.for_account(account).read_last_tweets(username, count)
             logger.info(f"Successfully retrieved {len(tweets)} tweets from @{username}")
             return tweets
         except TwitterRepositoryError as e:
@@ -52,13 +65,14 @@ class ReplyToTweetUseCase:
         self.twitter_repo = twitter_repo
         self.mongo_repo = mongo_repo  # Optional MongoDB repository
 
-    async def execute(self, tweet_id: str, text: str) -> ReplyResult:
+    async def execute(self, tweet_id: str, text: str, account: Optional[str] = None) -> ReplyResult:
         """
         Execute the use case to reply to a tweet.
 
         Args:
             tweet_id: The ID of the tweet to reply to
             text: The reply text
+            account: Bot account to reply as (default account if None)
 
         Returns:
             ReplyResult with success status and metadata
@@ -74,12 +88,12 @@ class ReplyToTweetUseCase:
             raise ValueError("Reply text cannot exceed 280 characters")
 
         try:
-            result = await self.twitter_repo.reply_to_tweet(tweet_id, text)
+            result = await self.twitter_repo.for_account(account).reply_to_tweet(tweet_id, text)
             logger.info(f"Successfully replied to tweet {tweet_id}")
 
             # If MongoDB is available, mark the tweet/mention as replied
             if self.mongo_repo:
-                await self._mark_as_replied_in_mongodb(tweet_id, result.reply_tweet_id or "unknown", text)
+                await self._mark_as_replied_in_mongodb(tweet_id, result.reply_tweet_id or "unknown", text, account)
 
             return result
         except TwitterRepositoryError as e:
@@ -87,15 +101,21 @@ class ReplyToTweetUseCase:
 
             # Log failed action if MongoDB is available
             if self.mongo_repo:
-                await self._log_failed_reply(tweet_id, text, e.message)
+                await self._log_failed_reply(tweet_id, text, e.message, account)
 
             raise
 
-    async def _mark_as_replied_in_mongodb(self, tweet_id: str, reply_tweet_id: str, reply_text: str):
+    async def _mark_as_replied_in_mongodb(
+        self,
+        tweet_id: str,
+        reply_tweet_id: str,
+        reply_text: str,
+        account: Optional[str] = None
+    ):
         """Mark tweet/mention as replied in MongoDB if it exists."""
         try:
-            # Try to find by tweetId in mentions collection
-            mention = await self.mongo_repo.get_mention_by_twitter_id(tweet_id)
+            # Try to find by tweetId in the replying account's mentions
+            mention = await self.mongo_repo.get_mention_by_twitter_id(tweet_id, config.resolve_account(account))
             if mention:
                 await self.mongo_repo.mark_mention_as_replied(mention.id_tweet, reply_tweet_id)
                 logger.info(f"Marked mention {tweet_id} as replied in MongoDB")
@@ -140,11 +160,17 @@ class ReplyToTweetUseCase:
             logger.error(f"Failed to mark tweet {tweet_id} as replied in MongoDB: {e}")
             # Don't raise - MongoDB marking is optional
 
-    async def _log_failed_reply(self, tweet_id: str, reply_text: str, error_message: str):
+    async def _log_failed_reply(
+        self,
+        tweet_id: str,
+        reply_text: str,
+        error_message: str,
+        account: Optional[str] = None
+    ):
         """Log failed reply action to MongoDB."""
         try:
             # Try to get tweet info for logging
-            mention = await self.mongo_repo.get_mention_by_twitter_id(tweet_id)
+            mention = await self.mongo_repo.get_mention_by_twitter_id(tweet_id, config.resolve_account(account))
             if not mention:
                 tweet = await self.mongo_repo.get_tweet_by_twitter_id(tweet_id)
                 if tweet:
@@ -171,12 +197,13 @@ class RetweetUseCase:
     def __init__(self, twitter_repo: ITwitterRepository):
         self.twitter_repo = twitter_repo
 
-    async def execute(self, tweet_id: str) -> ActionResult:
+    async def execute(self, tweet_id: str, account: Optional[str] = None) -> ActionResult:
         """
         Execute the use case to retweet a tweet.
 
         Args:
             tweet_id: The ID of the tweet to retweet
+            account: Bot account to retweet as (default account if None)
 
         Returns:
             ActionResult with success status
@@ -187,7 +214,7 @@ class RetweetUseCase:
         logger.info(f"Retweeting tweet {tweet_id}")
 
         try:
-            result = await self.twitter_repo.retweet(tweet_id)
+            result = await self.twitter_repo.for_account(account).retweet(tweet_id)
             logger.info(f"Successfully retweeted tweet {tweet_id}")
             return result
         except TwitterRepositoryError as e:
@@ -201,12 +228,13 @@ class PostTweetUseCase:
     def __init__(self, twitter_repo: ITwitterRepository):
         self.twitter_repo = twitter_repo
 
-    async def execute(self, text: str) -> TweetPostResult:
+    async def execute(self, text: str, account: Optional[str] = None) -> TweetPostResult:
         """
         Execute the use case to post a new tweet.
 
         Args:
             text: The tweet text
+            account: Bot account to post as (default account if None)
 
         Returns:
             TweetPostResult with success status and metadata
@@ -222,7 +250,7 @@ class PostTweetUseCase:
             raise ValueError("Tweet text cannot exceed 280 characters")
 
         try:
-            result = await self.twitter_repo.post_tweet(text)
+            result = await self.twitter_repo.for_account(account).post_tweet(text)
             logger.info(f"Successfully posted tweet: {result.tweet_id}")
             return result
         except TwitterRepositoryError as e:
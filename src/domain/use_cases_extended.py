@@ -3,7 +3,8 @@
 import logging
 import re
 from datetime import datetime
-from typing import List
+from typing import List, Optional
+from src.config import config
 from src.domain.interfaces import ITwitterRepository, TwitterRepositoryError
 from src.domain.models import (
     Tweet,
@@ -15,34 +16,145 @@ from src.domain.models import (
     ReplyResult
 )
 from src.infrastructure.mongo_repository import MongoRepository
+from src.infrastructure.event_broadcaster import EventBroadcaster
 
 logger = logging.getLogger(__name__)
 
 
+class SyncMentionsUseCase:
+    """Use case for scraping recent mentions into MongoDB."""
+
+    def __init__(
+        self,
+        twitter_repo: ITwitterRepository,
+        mongo_repo: MongoRepository,
+        broadcaster: Optional[EventBroadcaster] = None,
+        incremental: bool = True
+    ):
+        self.twitter_repo = twitter_repo
+        self.mongo_repo = mongo_repo
+        self.broadcaster = broadcaster
+        self.incremental = incremental
+
+    async def execute(self, count: int, account: Optional[str] = None) -> List[Mention]:
+        """
+        Fetch the last N mentions from Twitter and upsert them.
+
+        Flow:
+        1. Fetch last N mentions from Twitter, stopping at the account's
+           high-water mark (newest mention already synced) when incremental
+        2. Upsert the batch into MongoDB (one bulk write) and advance the mark
+        3. Publish the mentions seen for the first time (if a broadcaster is set)
+
+        Args:
+            count: Number of mentions to fetch
+            account: Bot account whose mentions are fetched (default account if None)
+
+        Returns:
+            Mentions stored for the first time (empty if storing failed)
+
+        Raises:
+            TwitterRepositoryError: If Twitter scraping fails
+        """
+        # Step 1: Fetch mentions from Twitter, only those newer than the mark
+        twitter_repo = self.twitter_repo.for_account(account)
+        # Resolve the name, so None and the default account share one mark and one queue
+        account = config.resolve_account(account)
+        source = f"mentions:{account}"
+        since_id = await self.mongo_repo.get_high_water_mark(source) if self.incremental else None
+        try:
+            raw_tweets = await twitter_repo.read_last_mentions(count, since_id=since_id)
+            logger.info(f"Fetched {len(raw_tweets)} raw mentions from Twitter")
+        except TwitterRepositoryError as e:
+            logger.error(f"Failed to fetch mentions from Twitter: {e.message}")
+            raise
+
+        if not raw_tweets:
+            return []
+        if since_id and len(raw_tweets) >= count:
+            logger.warning(
+                f"{count} new mentions since {since_id} filled the batch; "
+                f"older new mentions were not read (poll more often or raise the count)"
+            )
+
+        # Step 2: Store/update all mentions in MongoDB with one bulk upsert
+        mentions_to_store = [
+            Mention(
+                **StoredTweet.from_tweet(tweet, TweetType.MENTION).__dict__,
+                mentioned_users=self._extract_mentioned_users(tweet.text),
+                account=account
+            )
+            for tweet in raw_tweets
+        ]
+        try:
+            stored = await self.mongo_repo.store_mentions_bulk(mentions_to_store)
+            logger.info(f"Stored mentions: {stored.inserted_count} new, {stored.matched_count} already known")
+        except Exception as e:
+            logger.error(f"Failed to store mentions: {e}")
+            return []
+
+        if self.incremental:
+            newest = max(raw_tweets, key=lambda tweet: int(tweet.id) if tweet.id.isdigit() else 0)
+            await self.mongo_repo.advance_high_water_mark(source, newest.id)
+
+        new_ids = set(stored.inserted_tweet_ids)
+        new_mentions = [m for m in mentions_to_store if m.tweet_id in new_ids]
+
+        # Step 3: Push new mentions to streaming clients (blocked authors' are stored as ignored)
+        if self.broadcaster:
+            for mention in new_mentions:
+                if not mention.ignored:
+                    self.broadcaster.publish({
+                        "type": "mention",
+                        "account": account,
+                        "mention": mention.to_api_dict()
+                    })
+
+        return new_mentions
+
+    def _extract_mentioned_users(self, text: str) -> List[str]:
+        """Extract @mentions from tweet text."""
+        # Find all @username patterns
+        mentions = re.findall(r'@(\w+)', text)
+        return [f"@{m}" for m in mentions]
+
+
 class GetUnansweredMentionsUseCase:
     """Use case for getting unanswered mentions with abuse prevention."""
 
     def __init__(
         self,
         twitter_repo: ITwitterRepository,
-        mongo_repo: MongoRepository
+        mongo_repo: MongoRepository,
+        sync_mentions: Optional[SyncMentionsUseCase] = None,
+        single_flight=None
     ):
         self.twitter_repo = twitter_repo
         self.mongo_repo = mongo_repo
+        self.sync_mentions = sync_mentions or SyncMentionsUseCase(twitter_repo, mongo_repo)
+        self.single_flight = single_flight  # Optional SingleFlight coalescing identical concurrent reads
 
-    async def execute(self, count: int = 5, username: str = None) -> List[Mention]:
+    async def execute(
+        self,
+        count: int = 5,
+        username: str = None,
+        account: Optional[str] = None,
+        fresh: bool = True
+    ) -> List[Mention]:
         """
         Get unanswered mentions with abuse prevention.
 
         Flow:
-        1. Fetch last N*2 mentions from Twitter (buffer for filtering)
-        2. Store/update each in MongoDB
-        3. Get unanswered mentions from MongoDB (with abuse filtering)
-        4. Return up to `count` mentions
+        1. If `fresh`, fetch last N*2 mentions from Twitter (buffer for filtering)
+           and upsert them into MongoDB
+        2. Get unanswered mentions from MongoDB (with abuse filtering)
+        3. Return up to `count` mentions
 
         Args:
             count: Number of unanswered mentions to return
             username: Optional filter to get mentions only from this specific user
+            account: Bot account whose mentions are fetched (default account if None)
+            fresh: Scrape Twitter first; False serves what the mention poller stored
 
         Returns:
             List of Mention objects (with idTweet)
@@ -55,49 +167,40 @@ class GetUnansweredMentionsUseCase:
         else:
             logger.info(f"Getting {count} unanswered mentions")
 
-        # Step 1: Fetch mentions from Twitter (get more to account for filtering)
-        buffer_count = count * 2
-        try:
-            raw_tweets = await self.twitter_repo.read_last_mentions(buffer_count)
-            logger.info(f"Fetched {len(raw_tweets)} raw mentions from Twitter")
-        except TwitterRepositoryError as e:
-            logger.error(f"Failed to fetch mentions from Twitter: {e.message}")
-            raise
-
-        # Step 2: Store each mention in MongoDB
-        for tweet in raw_tweets:
-            # Parse mentioned users from tweet text
-            mentioned_users = self._extract_mentioned_users(tweet.text)
-
-            # Create Mention object
-            mention = Mention(
-                **StoredTweet.from_tweet(tweet, TweetType.MENTION).__dict__,
-                mentioned_users=mentioned_users
+        if self.single_flight:
+            return await self.single_flight.do(
+                ("unanswered_mentions", username, account, fresh),
+                count,
+                lambda n: self._get(n, username, account, fresh)
             )
+        return await self._get(count, username, account, fresh)
 
-            # Store/update in MongoDB
-            try:
-                await self.mongo_repo.store_mention(mention)
-            except Exception as e:
-                logger.error(f"Failed to store mention {tweet.id}: {e}")
-                # Continue with others even if one fails
+    async def _get(
+        self,
+        count: int,
+        username: Optional[str],
+        account: Optional[str],
+        fresh: bool
+    ) -> List[Mention]:
+        """Sync (if fresh) and read unanswered mentions."""
+        # Step 1: Sync from Twitter (get more to account for filtering)
+        if fresh:
+            await self.sync_mentions.execute(count * 2, account=account)
+        else:
+            # Still reject unknown accounts, as a scrape would
+            self.twitter_repo.for_account(account)
 
-        # Step 3: Get unanswered mentions with abuse filtering
+        # Step 2: Get the account's unanswered mentions with abuse filtering
         mentions = await self.mongo_repo.get_unanswered_mentions(
             limit=count,
             apply_abuse_filter=True,
-            username=username
+            username=username,
+            account=config.resolve_account(account)
         )
 
         logger.info(f"Returning {len(mentions)} unanswered mentions")
         return mentions
 
-    def _extract_mentioned_users(self, text: str) -> List[str]:
-        """Extract @mentions from tweet text."""
-        # Find all @username patterns
-        mentions = re.findall(r'@(\w+)', text)
-        return [f"@{m}" for m in mentions]
-
 
 class GetUnansweredTweetsFromUserUseCase:
     """Use case for getting unanswered tweets from a specific user."""
@@ -105,24 +208,32 @@ class GetUnansweredTweetsFromUserUseCase:
     def __init__(
         self,
         twitter_repo: ITwitterRepository,
-        mongo_repo: MongoRepository
+        mongo_repo: MongoRepository,
+        single_flight=None
     ):
         self.twitter_repo = twitter_repo
         self.mongo_repo = mongo_repo
+        self.single_flight = single_flight  # Optional SingleFlight coalescing identical concurrent reads
 
-    async def execute(self, username: str, count: int = 5) -> List[StoredTweet]:
+    async def execute(
+        self,
+        username: str,
+        count: int = 5,
+        account: Optional[str] = None
+    ) -> List[StoredTweet]:
         """
         Get unanswered tweets from a specific user.
 
         Flow:
         1. Fetch last N tweets from Twitter for this user
-        2. Store/update each in MongoDB
+        2. Upsert the batch into MongoDB (one bulk write)
         3. Get unanswered tweets from MongoDB
         4. Return up to `count` tweets
 
         Args:
             username: Twitter username (without @)
             count: Number of unanswered tweets to return
+            account: Bot account to read as (default account if None)
 
         Returns:
             List of StoredTweet objects
@@ -132,22 +243,33 @@ class GetUnansweredTweetsFromUserUseCase:
         """
         logger.info(f"Getting {count} unanswered tweets from @{username}")
 
+        if self.single_flight:
+            # Not lowercased: the stored authorUsername lookup is case-sensitive
+            return await self.single_flight.do(
+                ("unanswered_tweets", username, account),
+                count,
+                lambda n: self._get(username, n, account)
+            )
+        return await self._get(username, count, account)
+
+    async def _get(self, username: str, count: int, account: Optional[str]) -> List[StoredTweet]:
+        """Scrape, store and read unanswered tweets from one user."""
         # Step 1: Fetch tweets from Twitter
         try:
-            raw_tweets = await self.twitter_repo.read_last_tweets(username, count * 2)
+            raw_tweets = await self.twitter_repo.for_account(account).read_last_tweets(username, count * 2)
             logger.info(f"Fetched {len(raw_tweets)} tweets from @{username}")
         except TwitterRepositoryError as e:
             logger.error(f"Failed to fetch tweets from @{username}: {e.message}")
             raise
 
-        # Step 2: Store each tweet in MongoDB
-        for tweet in raw_tweets:
-            stored_tweet = StoredTweet.from_tweet(tweet, TweetType.REGULAR)
-
-            try:
-                await self.mongo_repo.store_tweet(stored_tweet)
-            except Exception as e:
-                logger.error(f"Failed to store tweet {tweet.id}: {e}")
+        # Step 2: Store/update all tweets in MongoDB with one bulk upsert
+        try:
+            stored = await self.mongo_repo.store_tweets_bulk(
+                [StoredTweet.from_tweet(tweet, TweetType.REGULAR) for tweet in raw_tweets]
+            )
+            logger.info(f"Stored tweets: {stored.inserted_count} new, {stored.matched_count} already known")
+        except Exception as e:
+            logger.error(f"Failed to store tweets from @{username}: {e}")
 
         # Step 3: Get unanswered tweets from MongoDB
         tweets = await self.mongo_repo.get_unanswered_tweets_from_user(
@@ -170,7 +292,13 @@ class ReplyByIdTweetUseCase:
         self.twitter_repo = twitter_repo
         self.mongo_repo = mongo_repo
 
-    async def execute(self, id_tweet: str, text: str, quoted: bool = False) -> ReplyResult:
+    async def execute(
+        self,
+        id_tweet: str,
+        text: str,
+        quoted: bool = False,
+        account: Optional[str] = None
+    ) -> ReplyResult:
         """
         Reply to a tweet using its internal MongoDB ID.
 
@@ -184,6 +312,7 @@ class ReplyByIdTweetUseCase:
             id_tweet: Internal MongoDB UUID
             text: Reply text
             quoted: If True, post as quote tweet instead of reply
+            account: Bot account to reply as (default account if None)
 
         Returns:
             ReplyResult with success status
@@ -195,6 +324,9 @@ class ReplyByIdTweetUseCase:
         action_type = "quote_tweet" if quoted else "reply"
         logger.info(f"{'Quote tweeting' if quoted else 'Replying to'} idTweet={id_tweet}")
 
+        # Resolve the account first so an unknown one fails before any lookup
+        twitter_repo = self.twitter_repo.for_account(account)
+
         # Step 1: Get the tweet/mention from MongoDB
         # Try mentions first, then tweets
         stored_item = await self.mongo_repo.get_mention_by_id_tweet(id_tweet)
@@ -206,6 +338,12 @@ class ReplyByIdTweetUseCase:
             logger.error(error_msg)
             raise ValueError(error_msg)
 
+        # A mention belongs to the bot it was read for; another account must not answer it
+        if isinstance(stored_item, Mention) and stored_item.account != config.resolve_account(account):
+            error_msg = f"Mention not found with idTweet={id_tweet} for account '{config.resolve_account(account)}'"
+            logger.error(f"{error_msg} (it was received by '{stored_item.account}')")
+            raise ValueError(error_msg)
+
         if stored_item.replied_to:
             logger.warning(f"Tweet {id_tweet} already replied to")
             return ReplyResult(
@@ -218,13 +356,13 @@ class ReplyByIdTweetUseCase:
         # Step 2: Reply or quote tweet on Twitter
         try:
             if quoted:
-                result = await self.twitter_repo.quote_tweet(
+                result = await twitter_repo.quote_tweet(
                     stored_item.tweet_id,
                     text
                 )
                 logger.info(f"Successfully quote tweeted {stored_item.tweet_id}")
             else:
-                result = await self.twitter_repo.reply_to_tweet(
+                result = await twitter_repo.reply_to_tweet(
                     stored_item.tweet_id,
                     text
                 )
@@ -0,0 +1,283 @@
+"""Priority lanes in front of the browser: interactive work first, ingestion after."""
+
+import asyncio
+import contextvars
+import logging
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncContextManager, AsyncIterator, Deque, Dict, Iterator, List, Optional
+from src.domain.interfaces import ITwitterRepository, TwitterRepositoryError
+from src.domain.models import Tweet, ActionResult, TweetPostResult, ReplyResult
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+# Lanes in priority order
+INTERACTIVE_LANE = "interactive"
+BACKGROUND_LANE = "background"
+
+_current_lane: contextvars.ContextVar[str] = contextvars.ContextVar("scheduler_lane", default=INTERACTIVE_LANE)
+
+
+@contextmanager
+def scheduler_lane(lane: str) -> Iterator[None]:
+    """Run repository calls made inside the block (and tasks it starts) in `lane`."""
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+class QueueFullError(TwitterRepositoryError):
+    """Raised when a lane already holds its maximum number of waiting calls."""
+
+    def __init__(self, lane: str, depth: int):
+        super().__init__(f"Too many queued browser actions in the {lane} lane ({depth})", "QUEUE_FULL")
+        self.lane = lane
+
+
+@dataclass
+class LaneLimits:
+    """Limits for one lane."""
+
+    concurrency: int
+    max_depth: int
+
+
+class _Lane:
+    def __init__(self, name: str, limits: LaneLimits):
+        self.name = name
+        self.limits = limits
+        self.waiting: Deque[asyncio.Future] = deque()
+        self.gated = 0  # Admitted calls still waiting for their gate (e.g. a write lock)
+        self.running = 0
+        self.passed_over = 0
+        self.granted = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    @property
+    def depth(self) -> int:
+        return len(self.waiting) + self.gated
+
+    def eligible(self) -> bool:
+        return bool(self.waiting) and self.running < self.limits.concurrency
+
+
+class ActionScheduler:
+    """
+    Admit browser calls through prioritized lanes.
+
+    At most `total_concurrency` calls run at once (normally the page pool
+    size), and at most `concurrency` per lane. A free slot goes to the
+    highest-priority lane with waiting calls, except that a lane passed
+    over `fairness` times in a row gets the next slot, so background
+    ingestion keeps moving under constant interactive load. A lane with
+    `max_depth` calls waiting (for a slot or for their gate) rejects new
+    ones with QueueFullError.
+    """
+
+    def __init__(self, lanes: Dict[str, LaneLimits], total_concurrency: int, fairness: int = 4):
+        """
+        Initialize the scheduler.
+
+        Args:
+            lanes: Lane limits, highest priority first
+            total_concurrency: Calls allowed to run at once across lanes
+            fairness: Grants a waiting lower-priority lane may be skipped before it is served
+        """
+        if total_concurrency < 1:
+            raise ValueError("Scheduler total concurrency must be at least 1")
+        self._lanes: List[_Lane] = [_Lane(name, limits) for name, limits in lanes.items()]
+        self._by_name: Dict[str, _Lane] = {lane.name: lane for lane in self._lanes}
+        self._total_concurrency = total_concurrency
+        self._fairness = max(1, fairness)
+        self._running = 0
+
+    @asynccontextmanager
+    async def slot(self, lane: Optional[str] = None, gate: Optional[asyncio.Lock] = None) -> AsyncIterator[None]:
+        """
+        Hold a run slot in `lane` (the current context's lane by default).
+
+        With a `gate`, the call is admitted to the lane first and then takes
+        the lock before queueing for a slot: while it waits for the lock it
+        counts toward the lane's depth and queue-wait time but holds no slot.
+
+        Raises:
+            QueueFullError: If the lane's queue is at max depth
+            ValueError: If the lane does not exist
+        """
+        state = self._lane(lane or _current_lane.get())
+        await self._acquire(state, gate)
+        try:
+            yield
+        finally:
+            self._release(state)
+            if gate is not None:
+                gate.release()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-lane queue depth, running calls and queue-wait metrics."""
+        return {
+            lane.name: {
+                "waiting": lane.depth,
+                "running": lane.running,
+                "granted": lane.granted,
+                "rejected": lane.rejected,
+                "wait_seconds_total": round(lane.wait_seconds_total, 3),
+                "wait_seconds_max": round(lane.wait_seconds_max, 3),
+                "wait_seconds_avg": round(lane.wait_seconds_total / lane.granted, 3) if lane.granted else 0.0
+            }
+            for lane in self._lanes
+        }
+
+    # Helper methods
+
+    def _lane(self, name: str) -> _Lane:
+        lane = self._by_name.get(name)
+        if lane is None:
+            raise ValueError(f"Unknown scheduler lane '{name}'. Lanes: {', '.join(self._by_name)}")
+        return lane
+
+    async def _acquire(self, lane: _Lane, gate: Optional[asyncio.Lock] = None) -> None:
+        if lane.depth >= lane.limits.max_depth:
+            lane.rejected += 1
+            raise QueueFullError(lane.name, lane.depth)
+
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        if gate is not None:
+            lane.gated += 1
+            try:
+                await gate.acquire()
+            finally:
+                lane.gated -= 1
+
+        grant = loop.create_future()
+        lane.waiting.append(grant)
+        self._dispatch()
+
+        try:
+            await grant
+        except asyncio.CancelledError:
+            if grant.done() and not grant.cancelled():
+                # Granted just before the cancellation landed; hand the slot on
+                self._release(lane)
+            elif grant in lane.waiting:
+                lane.waiting.remove(grant)
+            if gate is not None:
+                gate.release()
+            raise
+
+        waited = loop.time() - queued_at
+        lane.granted += 1
+        lane.wait_seconds_total += waited
+        lane.wait_seconds_max = max(lane.wait_seconds_max, waited)
+        if waited > 1:
+            logger.debug(f"Waited {waited:.2f}s for a {lane.name} slot")
+
+    def _release(self, lane: _Lane) -> None:
+        lane.running -= 1
+        self._running -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting calls, by priority with the fairness override."""
+        while self._running < self._total_concurrency:
+            eligible = [lane for lane in self._lanes if lane.eligible()]
+            if not eligible:
+                return
+
+            starved = [lane for lane in eligible if lane.passed_over >= self._fairness]
+            chosen = starved[0] if starved else eligible[0]
+            for lane in eligible:
+                lane.passed_over = 0 if lane is chosen else lane.passed_over + 1
+
+            grant = chosen.waiting.popleft()
+            if grant.cancelled():
+                continue
+            chosen.running += 1
+            self._running += 1
+            grant.set_result(None)
+
+
+class ScheduledTwitterRepository(ITwitterRepository):
+    """
+    ITwitterRepository decorator that runs every call through an ActionScheduler.
+
+    Reads only need a lane slot, so they run in parallel on pooled pages.
+    Writes (reply, retweet, post, quote) are admitted to the lane and then
+    take a per-account lock before queueing for a slot, so one account's
+    writes happen one at a time and in arrival order while other accounts
+    and reads proceed, and writes backed up on the lock still count toward
+    the lane's max depth.
+    """
+
+    def __init__(self, inner: ITwitterRepository, scheduler: ActionScheduler):
+        self.inner = inner
+        self.scheduler = scheduler
+        self._account: Optional[str] = None
+        self._write_locks: Dict[str, asyncio.Lock] = {}
+
+    def for_account(self, account: Optional[str]) -> 'ScheduledTwitterRepository':
+        """Get a scheduled view of the wrapped repository acting as `account`."""
+        inner = self.inner.for_account(account)
+        if inner is self.inner:
+            return self
+        view = ScheduledTwitterRepository(inner, self.scheduler)
+        view._account = account
+        view._write_locks = self._write_locks
+        return view
+
+    async def read_last_tweets(self, username: str, count: int) -> List[Tweet]:
+        async with self.scheduler.slot():
+            return await self.inner.read_last_tweets(username, count)
+
+    async def read_last_mentions(self, count: int, since_id: Optional[str] = None) -> List[Tweet]:
+        async with self.scheduler.slot():
+            return await self.inner.read_last_mentions(count, since_id=since_id)
+
+    async def reply_to_tweet(self, tweet_id: str, text: str) -> ReplyResult:
+        async with self._write_slot():
+            return await self.inner.reply_to_tweet(tweet_id, text)
+
+    async def retweet(self, tweet_id: str) -> ActionResult:
+        async with self._write_slot():
+            return await self.inner.retweet(tweet_id)
+
+    async def post_tweet(self, text: str) -> TweetPostResult:
+        async with self._write_slot():
+            return await self.inner.post_tweet(text)
+
+    async def quote_tweet(self, tweet_id: str, text: str) -> ReplyResult:
+        async with self._write_slot():
+            return await self.inner.quote_tweet(tweet_id, text)
+
+    # Helper methods
+
+    def _write_slot(self) -> AsyncContextManager[None]:
+        """Lane slot gated by the account's write lock (queued writes count toward depth, hold no slot)."""
+        # Keyed by the resolved name, so None and the default account share one lock
+        lock = self._write_locks.setdefault(config.resolve_account(self._account), asyncio.Lock())
+        return self.scheduler.slot(gate=lock)
+
+
+def create_action_scheduler() -> ActionScheduler:
+    """Build the scheduler described by the SCHEDULER_* settings."""
+    return ActionScheduler(
+        lanes={
+            INTERACTIVE_LANE: LaneLimits(
+                concurrency=config.SCHEDULER_INTERACTIVE_CONCURRENCY,
+                max_depth=config.SCHEDULER_MAX_QUEUE_DEPTH
+            ),
+            BACKGROUND_LANE: LaneLimits(
+                concurrency=config.SCHEDULER_BACKGROUND_CONCURRENCY,
+                max_depth=config.SCHEDULER_MAX_QUEUE_DEPTH
+            )
+        },
+        total_concurrency=config.SCHEDULER_TOTAL_CONCURRENCY,
+        fairness=config.SCHEDULER_FAIRNESS
+    )
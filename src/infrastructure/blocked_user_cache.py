@@ -0,0 +1,96 @@
+"""Process-local cache of blocked usernames backed by the blocked_users collection."""
+
+import asyncio
+import logging
+from typing import Optional, Set
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+logger = logging.getLogger(__name__)
+
+
+class BlockedUserCache:
+    """
+    In-memory set of blocked usernames.
+
+    The set is reloaded from MongoDB when it is older than `ttl_seconds`.
+    Blocks made by this process are applied immediately via `add()`; blocks
+    made by other processes show up after the TTL, or right away when
+    `start_watching()` follows the collection's change stream (requires a
+    replica set; on a standalone server the cache silently stays TTL-only).
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection, ttl_seconds: float):
+        self._collection = collection
+        self._ttl = ttl_seconds
+        self._usernames: Set[str] = set()
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
+
+    async def contains(self, username: str) -> bool:
+        """Check whether a user is blocked (O(1) once the set is loaded)."""
+        return username in await self.usernames()
+
+    async def usernames(self) -> Set[str]:
+        """Get the current set of blocked usernames, reloading it if stale."""
+        if self._is_stale():
+            async with self._lock:
+                # Another caller may have reloaded while we waited
+                if self._is_stale():
+                    await self._reload()
+        return self._usernames
+
+    def add(self, username: str) -> None:
+        """Record a block made by this process without waiting for a reload."""
+        self._usernames.add(username)
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup."""
+        self._loaded_at = None
+
+    def start_watching(self) -> None:
+        """Follow inserts/deletes on blocked_users through a change stream."""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.ensure_future(self._watch())
+
+    async def stop_watching(self) -> None:
+        """Cancel the change-stream task, if running."""
+        if self._watch_task and not self._watch_task.done():
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+        self._watch_task = None
+
+    # Helper methods
+
+    def _is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return asyncio.get_running_loop().time() - self._loaded_at >= self._ttl
+
+    async def _reload(self) -> None:
+        """Load every blocked username (projection keeps the scan small)."""
+        usernames = set()
+        async for doc in self._collection.find({}, {"username": 1, "_id": 0}):
+            usernames.add(doc["username"])
+        self._usernames = usernames
+        self._loaded_at = asyncio.get_running_loop().time()
+        logger.debug(f"Loaded {len(usernames)} blocked usernames")
+
+    async def _watch(self) -> None:
+        """Apply change events; deletes carry no document, so they force a reload."""
+        try:
+            pipeline = [{"$match": {"operationType": {"$in": ["insert", "replace", "delete"]}}}]
+            async with self._collection.watch(pipeline) as stream:
+                logger.info("Watching blocked_users change stream")
+                async for change in stream:
+                    if change["operationType"] == "delete":
+                        self.invalidate()
+                    else:
+                        self.add(change["fullDocument"]["username"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"blocked_users change stream unavailable, using TTL refresh only: {e}")
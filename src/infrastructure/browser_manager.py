@@ -1,7 +1,11 @@
 """Browser lifecycle management for Playwright."""
 
+import asyncio
+import json
 import logging
-from typing import Optional
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 from playwright.async_api import (
     async_playwright,
     Browser,
@@ -11,19 +15,52 @@ from playwright.async_api import (
     Playwright
 )
 from src.config import config
+from src.infrastructure.page_pool import PagePool, PagePoolTimeoutError
+from src.infrastructure.resource_blocker import ResourceBlocker, ResourceBlockingPolicy
 
 logger = logging.getLogger(__name__)
 
+LAUNCH_ARGS = ["--disable-blink-features=AutomationControlled"]
+
 
 class BrowserManager:
-    """Manages Playwright browser lifecycle and provides reusable browser instances."""
+    """
+    Manages Playwright browser lifecycle and provides reusable browser instances.
+
+    Three ways to get a browser, chosen from config:
+    - BROWSER_CDP_URL: attach to an already-running Chromium over CDP
+      (without a storage-state file, the default account works inside
+      that browser's own logged-in context)
+    - BROWSER_USER_DATA_DIR: launch a persistent profile that keeps the
+      session (cookies, cache) warm between restarts
+    - otherwise: launch a fresh browser and load AUTH_STATE_PATH
+
+    Every account in TWITTER_ACCOUNTS gets its own authenticated contexts
+    and page pool inside the one browser, so accounts never share cookies
+    and a busy account cannot starve another one's queue.
+
+    Crashes are recovered at the smallest level that failed: crashed pages
+    are replaced by the pool, a closed context is recreated, and a lost
+    browser is relaunched. Page checkouts wait while any recovery runs.
+    """
 
     def __init__(self):
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
-        self._context: Optional[BrowserContext] = None
+        self._accounts: Dict[str, Path] = config.get_accounts()
+        self._default_account = next(iter(self._accounts))
+        self._contexts: Dict[str, List[BrowserContext]] = {}
+        self._borrowed_contexts: Set[BrowserContext] = set()
+        self._pools: Dict[str, PagePool] = {}
+        self._checkouts: Dict[Page, str] = {}
+        self._resource_blocker: Optional[ResourceBlocker] = None
         self._page: Optional[Page] = None
         self._is_started = False
+        self._stopping = False
+        self._ready = asyncio.Event()
+        # Keyed by the context being recreated; None is a whole-browser relaunch
+        self._recoveries: Dict[Optional[BrowserContext], asyncio.Task] = {}
+        self._restarts = {"context": 0, "browser": 0}
 
     async def start(self) -> None:
         """
@@ -31,51 +68,32 @@ class BrowserManager:
 
         Raises:
             RuntimeError: If browser is already started
-            FileNotFoundError: If auth.json doesn't exist
+            FileNotFoundError: If an account's storage-state file doesn't exist
         """
         if self._is_started:
             logger.warning("Browser is already started")
             return
 
         logger.info("Starting browser manager")
+        self._stopping = False
 
         try:
-            # Validate auth file exists
-            config.validate()
+            # A persistent profile or an attached browser can already be logged in
+            if self._needs_auth_file():
+                config.validate()
 
             # Start Playwright
             self._playwright = await async_playwright().start()
             logger.debug("Playwright started")
 
-            # Launch browser
-            self._browser = await self._playwright.chromium.launch(
-                headless=config.BROWSER_HEADLESS,
-                args=["--disable-blink-features=AutomationControlled"],
-            )
-            logger.debug(f"Browser launched (headless={config.BROWSER_HEADLESS})")
+            await self._launch()
 
-            # Create context with saved authentication
-            self._context = await self._browser.new_context(
-                storage_state=str(config.get_auth_state_path())
-            )
-            logger.debug("Browser context created with authentication")
-
-            # Create initial page
-            self._page = await self._context.new_page()
-            logger.debug("Initial page created")
-
-            # Navigate to Twitter (don't wait for networkidle as Twitter constantly loads)
-            try:
-                await self._page.goto(
-                    config.TWITTER_BASE_URL,
-                    wait_until="domcontentloaded",
-                    timeout=config.BROWSER_TIMEOUT
-                )
-                logger.info(f"Navigated to {config.TWITTER_BASE_URL}")
-            except PlaywrightTimeoutError:
-                logger.warning("Timeout loading Twitter homepage, continuing anyway")
+            # Navigate to Twitter once so the first request hits a warm page
+            if config.BROWSER_WARMUP:
+                await self._warm_up()
 
             self._is_started = True
+            self._ready.set()
             logger.info("Browser manager started successfully")
 
         except Exception as e:
@@ -86,15 +104,17 @@ class BrowserManager:
     async def stop(self) -> None:
         """Stop the browser and clean up resources."""
         logger.info("Stopping browser manager")
+        self._stopping = True
+        self._ready.clear()
 
-        try:
-            if self._context:
-                await self._context.close()
-                logger.debug("Browser context closed")
+        for task in self._recoveries.values():
+            task.cancel()
 
-            if self._browser:
-                await self._browser.close()
-                logger.debug("Browser closed")
+        if self._resource_blocker:
+            logger.info(f"Resource blocking stats: {self._resource_blocker.stats()}")
+
+        try:
+            await self._teardown()
 
             if self._playwright:
                 await self._playwright.stop()
@@ -105,18 +125,24 @@ class BrowserManager:
 
         finally:
             self._page = None
-            self._context = None
+            self._pools = {}
+            self._contexts = {}
+            self._checkouts = {}
             self._browser = None
             self._playwright = None
+            self._recoveries = {}
             self._is_started = False
             logger.info("Browser manager stopped")
 
     def get_page(self) -> Page:
         """
-        Get the current page instance.
+        Get the initial page instance.
+
+        This page is also a member of the pool, so concurrent code should use
+        `acquire_page()` / `page()` instead. Kept for debugging scripts.
 
         Returns:
-            The active page
+            The initial page
 
         Raises:
             RuntimeError: If browser is not started
@@ -125,10 +151,364 @@ class BrowserManager:
             raise RuntimeError("Browser is not started. Call start() first.")
         return self._page
 
+    @property
+    def accounts(self) -> List[str]:
+        """Names of the configured accounts; the first one is the default."""
+        return list(self._accounts)
+
+    def resolve_account(self, account: Optional[str] = None) -> str:
+        """
+        Map an optional account name to a configured one.
+
+        Raises:
+            ValueError: If the account is not configured
+        """
+        if account is None:
+            return self._default_account
+        if account not in self._accounts:
+            raise ValueError(
+                f"Unknown account '{account}'. Configured accounts: {', '.join(self._accounts)}"
+            )
+        return account
+
+    async def acquire_page(self, account: Optional[str] = None) -> Page:
+        """
+        Check a page out of an account's pool for exclusive use.
+
+        Waits (up to BROWSER_PAGE_ACQUIRE_TIMEOUT) while a crashed browser or
+        context is being relaunched. The caller must hand the page back with
+        `release_page()`.
+
+        Args:
+            account: Account whose session the page uses (default account if None)
+
+        Raises:
+            RuntimeError: If browser is not started
+            ValueError: If the account is not configured
+            PagePoolTimeoutError: If no page is free within BROWSER_PAGE_ACQUIRE_TIMEOUT
+        """
+        if not self._is_started:
+            raise RuntimeError("Browser is not started. Call start() first.")
+        account = self.resolve_account(account)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.BROWSER_PAGE_ACQUIRE_TIMEOUT
+
+        # A recovery can tear the pools down after _ready wakes us, or while we
+        # wait inside a pool; wait for it again, all within one acquire timeout
+        while True:
+            if not self._ready.is_set():
+                logger.debug("Browser is recovering, waiting before checkout")
+                try:
+                    await asyncio.wait_for(self._ready.wait(), timeout=max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    raise PagePoolTimeoutError("Browser did not recover in time")
+            if not self._is_started:
+                raise RuntimeError("Browser was stopped while waiting for a page")
+
+            pool = self._pools.get(account)
+            if pool is None:
+                if self._ready.is_set():
+                    # Pools are only missing while a recovery runs (it clears _ready first)
+                    raise PagePoolTimeoutError(f"No page pool for account '{account}'")
+                continue
+            try:
+                page = await pool.acquire(timeout=max(deadline - loop.time(), 0))
+            except RuntimeError:
+                if self._pools.get(account) is pool:
+                    raise
+                continue  # Pool closed by a recovery; wait for its replacement
+            self._checkouts[page] = account
+            return page
+
+    async def release_page(self, page: Page) -> None:
+        """Return a page obtained from `acquire_page()` to its account's pool."""
+        account = self._checkouts.pop(page, None)
+        pool = self._pools.get(account) if account else None
+        if pool:
+            await pool.release(page)
+
+    @asynccontextmanager
+    async def page(self, account: Optional[str] = None) -> AsyncIterator[Page]:
+        """Async context manager that checks a page out of the pool and returns it."""
+        page = await self.acquire_page(account)
+        try:
+            yield page
+        finally:
+            await self.release_page(page)
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get page pool occupancy per account (empty if the browser is not started)."""
+        return {account: pool.stats() for account, pool in self._pools.items()}
+
+    def resource_stats(self) -> Dict[str, Any]:
+        """Get blocked/allowed request counters (empty if blocking is disabled)."""
+        return self._resource_blocker.stats() if self._resource_blocker else {}
+
+    def restart_stats(self) -> Dict[str, int]:
+        """Get how many times a context or the browser was relaunched after a crash."""
+        return dict(self._restarts)
+
     def is_started(self) -> bool:
         """Check if the browser is currently started."""
         return self._is_started
 
+    # Launch helpers
+
+    def _needs_auth_file(self) -> bool:
+        """auth.json is only required when nothing else can provide a session."""
+        if len(self._accounts) > 1:
+            return True
+        if config.BROWSER_CDP_URL:
+            return False
+        if config.BROWSER_USER_DATA_DIR and Path(config.BROWSER_USER_DATA_DIR).exists():
+            return False
+        return True
+
+    async def _launch(self) -> None:
+        """Obtain a browser and per-account contexts for the configured mode and build the pools."""
+        if config.BROWSER_USER_DATA_DIR:
+            # A persistent profile is a single cookie jar, i.e. a single account
+            if len(self._accounts) > 1:
+                raise ValueError("BROWSER_USER_DATA_DIR cannot be combined with multiple TWITTER_ACCOUNTS")
+            context = await self._playwright.chromium.launch_persistent_context(
+                config.BROWSER_USER_DATA_DIR,
+                headless=config.BROWSER_HEADLESS,
+                args=LAUNCH_ARGS
+            )
+            await self._seed_persistent_session(context)
+            self._browser = None
+            self._contexts = {self._default_account: [await self._prepare_context(context)]}
+            logger.debug(f"Persistent context launched from {config.BROWSER_USER_DATA_DIR}")
+        else:
+            if config.BROWSER_CDP_URL:
+                self._browser = await self._playwright.chromium.connect_over_cdp(config.BROWSER_CDP_URL)
+                logger.debug(f"Connected to running browser at {config.BROWSER_CDP_URL}")
+            else:
+                self._browser = await self._playwright.chromium.launch(
+                    headless=config.BROWSER_HEADLESS,
+                    args=LAUNCH_ARGS,
+                )
+                logger.debug(f"Browser launched (headless={config.BROWSER_HEADLESS})")
+            self._browser.on("disconnected", self._on_browser_disconnected)
+
+            # Create contexts with each account's saved authentication (pages are spread across them)
+            self._contexts = {}
+            for account in self._accounts:
+                # The attached browser has a single logged-in context to work in
+                count = 1 if self._uses_attached_session(account) else max(1, config.BROWSER_CONTEXT_COUNT)
+                self._contexts[account] = [await self._new_context(account) for _ in range(count)]
+            logger.debug(
+                f"Created {config.BROWSER_CONTEXT_COUNT} browser context(s) for "
+                f"{len(self._accounts)} account(s)"
+            )
+
+        self._pools = {
+            account: PagePool(
+                contexts,
+                size=config.BROWSER_PAGE_POOL_SIZE,
+                acquire_timeout=config.BROWSER_PAGE_ACQUIRE_TIMEOUT
+            )
+            for account, contexts in self._contexts.items()
+        }
+        logger.debug(f"Page pools created (size={config.BROWSER_PAGE_POOL_SIZE} per account)")
+
+    def _uses_attached_session(self, account: str) -> bool:
+        """Whether `account` relies on the session of the browser at BROWSER_CDP_URL (no auth file)."""
+        return (
+            bool(config.BROWSER_CDP_URL)
+            and account == self._default_account
+            and not self._accounts[account].exists()
+        )
+
+    async def _new_context(self, account: str) -> BrowserContext:
+        """Create a context on the current browser, authenticated as `account`."""
+        if self._uses_attached_session(account):
+            # A new context would start logged out; reuse the one the user logged in with
+            if not self._browser.contexts:
+                raise RuntimeError(
+                    f"Browser at {config.BROWSER_CDP_URL} has no open context to reuse; "
+                    f"log in there or provide {self._accounts[account]}"
+                )
+            context = self._browser.contexts[0]
+            self._borrowed_contexts.add(context)
+            logger.debug("Using the attached browser's existing context")
+            return await self._prepare_context(context)
+
+        storage_state = self._accounts[account]
+        context = await self._browser.new_context(
+            storage_state=str(storage_state) if storage_state.exists() else None
+        )
+        return await self._prepare_context(context)
+
+    async def _prepare_context(self, context: BrowserContext) -> BrowserContext:
+        """Install resource blocking and crash handling on a context."""
+        await self._install_resource_blocking(context)
+        context.on("close", self._on_context_closed)
+        return context
+
+    async def _seed_persistent_session(self, context: BrowserContext) -> None:
+        """Copy cookies from auth.json into a brand-new persistent profile."""
+        auth_path = self._accounts[self._default_account]
+        if not auth_path.exists() or await context.cookies():
+            return
+        with open(auth_path) as f:
+            cookies = json.load(f).get("cookies", [])
+        if cookies:
+            await context.add_cookies(cookies)
+            logger.info(f"Seeded persistent profile with {len(cookies)} cookies from {auth_path}")
+
+    async def _warm_up(self) -> None:
+        """Load the Twitter homepage in the first pooled page of every account."""
+        for account, pool in self._pools.items():
+            page = await pool.acquire()
+            if account == self._default_account:
+                self._page = page
+            # Don't wait for networkidle as Twitter constantly loads
+            try:
+                await page.goto(
+                    config.TWITTER_BASE_URL,
+                    wait_until="domcontentloaded",
+                    timeout=config.BROWSER_TIMEOUT
+                )
+                logger.info(f"Navigated to {config.TWITTER_BASE_URL} as account '{account}'")
+            except PlaywrightTimeoutError:
+                logger.warning(f"Timeout loading Twitter homepage for account '{account}', continuing anyway")
+            finally:
+                await pool.release(page)
+
+    async def _teardown(self) -> None:
+        """Close the pool, contexts and browser (errors are logged, not raised)."""
+        # Detach everything first so close events are not mistaken for crashes
+        pools, self._pools = self._pools, {}
+        contexts, self._contexts = self._contexts, {}
+        browser, self._browser = self._browser, None
+        borrowed, self._borrowed_contexts = self._borrowed_contexts, set()
+        self._checkouts = {}
+
+        for pool in pools.values():
+            await pool.close()
+        if pools:
+            logger.debug("Page pools closed")
+
+        for context in [c for account_contexts in contexts.values() for c in account_contexts]:
+            if context in borrowed:
+                # The attached browser's own session; leave it open for its user
+                continue
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing context: {e}")
+        if contexts:
+            logger.debug("Browser contexts closed")
+
+        if browser:
+            try:
+                # For CDP connections this only disconnects; the external browser keeps running
+                await browser.close()
+                logger.debug("Browser closed")
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+
+    async def _install_resource_blocking(self, context: BrowserContext) -> None:
+        """Apply the configured resource blocking policy to a new context."""
+        if not config.BROWSER_BLOCK_RESOURCES:
+            return
+        if self._resource_blocker is None:
+            self._resource_blocker = ResourceBlocker(ResourceBlockingPolicy.from_config())
+        await self._resource_blocker.install(context)
+
+    # Crash recovery
+
+    def _on_browser_disconnected(self, browser: Browser) -> None:
+        """Relaunch the whole browser when it goes away unexpectedly."""
+        if self._stopping or browser is not self._browser:
+            return
+        logger.error("Browser disconnected unexpectedly, relaunching")
+        self._schedule_recovery(self._recover_browser())
+
+    def _on_context_closed(self, context: BrowserContext) -> None:
+        """Recreate a single context that closed while the browser is still up."""
+        if self._stopping or self._account_of(context) is None:
+            return
+        if self._browser is None or not self._browser.is_connected():
+            # Persistent contexts own their browser; a lost browser is handled on disconnect
+            logger.error("Browser context closed unexpectedly, relaunching browser")
+            self._schedule_recovery(self._recover_browser())
+            return
+        logger.error("Browser context closed unexpectedly, recreating it")
+        self._schedule_recovery(self._recover_context(context), context)
+
+    def _schedule_recovery(self, recovery, context: Optional[BrowserContext] = None) -> None:
+        """
+        Start a recovery; checkouts wait until every running recovery is done.
+
+        Each closed context is recreated by its own task, so contexts that
+        crash close together are all replaced. A browser relaunch (no
+        `context`) rebuilds everything, so it supersedes context recoveries
+        in flight and none start while it runs.
+        """
+        running = self._recoveries.get(None) or self._recoveries.get(context)
+        if running and not running.done():
+            recovery.close()
+            return
+
+        if context is None:
+            current = asyncio.current_task()
+            for task in self._recoveries.values():
+                if task is not current:
+                    task.cancel()
+
+        self._ready.clear()
+        task = asyncio.ensure_future(recovery)
+        self._recoveries[context] = task
+        task.add_done_callback(lambda done: self._on_recovery_done(context, done))
+
+    def _on_recovery_done(self, context: Optional[BrowserContext], task: asyncio.Task) -> None:
+        """Forget a finished recovery and reopen checkouts once none is left."""
+        if self._recoveries.get(context) is task:
+            del self._recoveries[context]
+        if not self._recoveries and not self._stopping:
+            self._ready.set()
+
+    def _account_of(self, context: BrowserContext) -> Optional[str]:
+        """Find the account a live context belongs to."""
+        for account, contexts in self._contexts.items():
+            if context in contexts:
+                return account
+        return None
+
+    async def _recover_context(self, old_context: BrowserContext) -> None:
+        """Replace a closed context in its account's pool with a fresh one."""
+        try:
+            account = self._account_of(old_context)
+            if account is None:
+                return
+            new_context = await self._new_context(account)
+            self._contexts[account] = [
+                new_context if c is old_context else c for c in self._contexts[account]
+            ]
+            await self._pools[account].replace_context(old_context, new_context)
+            self._restarts["context"] += 1
+            logger.info(f"Browser context for account '{account}' recreated")
+        except Exception as e:
+            logger.error(f"Failed to recreate context, relaunching browser: {e}")
+            self._schedule_recovery(self._recover_browser())
+
+    async def _recover_browser(self) -> None:
+        """Tear down whatever is left and relaunch, retrying with backoff."""
+        delay = 1.0
+        while not self._stopping:
+            try:
+                await self._teardown()
+                await self._launch()
+                self._restarts["browser"] += 1
+                logger.info("Browser relaunched after crash")
+                return
+            except Exception as e:
+                logger.error(f"Browser relaunch failed, retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.start()
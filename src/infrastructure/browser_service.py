@@ -0,0 +1,140 @@
+"""Browser worker: exposes a single PlaywrightTwitterRepository over local HTTP.
+
+The REST API and the MCP server can both run against one worker process
+(see RemoteTwitterRepository) instead of each launching its own Chromium.
+The worker owns the browser, the page pool and therefore the request
+queue: concurrent calls from every front end wait for a pooled page here.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+from src.domain.interfaces import ITwitterRepository, TwitterRepositoryError
+from src.infrastructure.browser_manager import BrowserManager
+from src.infrastructure.twitter_repository import PlaywrightTwitterRepository
+
+logger = logging.getLogger(__name__)
+
+# Global instances (initialized in lifespan)
+browser_manager: BrowserManager = None
+twitter_repo: ITwitterRepository = None
+
+
+class RepositoryCall(BaseModel):
+    account: Optional[str] = None
+
+
+class ReadTweetsCall(RepositoryCall):
+    username: str
+    count: int = Field(ge=1)
+
+
+class ReadMentionsCall(RepositoryCall):
+    count: int = Field(ge=1)
+    since_id: Optional[str] = None
+
+
+class TweetTextCall(RepositoryCall):
+    tweet_id: str
+    text: str
+
+
+class TweetIdCall(RepositoryCall):
+    tweet_id: str
+
+
+class PostCall(RepositoryCall):
+    text: str
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the shared browser once for the lifetime of the worker."""
+    global browser_manager, twitter_repo
+
+    logger.info("Starting browser worker")
+    browser_manager = BrowserManager()
+    try:
+        await browser_manager.start()
+        twitter_repo = PlaywrightTwitterRepository(browser_manager)
+        logger.info("Browser worker ready")
+        yield
+    finally:
+        await browser_manager.stop()
+        logger.info("Browser worker stopped")
+
+
+def create_browser_service_app() -> FastAPI:
+    """
+    Create the worker app.
+
+    Every route maps one-to-one to an ITwitterRepository method and may name
+    the account to act as (see TWITTER_ACCOUNTS). Repository
+    errors are returned as 502 with their error code so the proxy can raise
+    the same TwitterRepositoryError on the caller's side.
+
+    Returns:
+        Configured FastAPI app instance
+    """
+    app = FastAPI(title="Twitter MCP Agent browser worker", lifespan=lifespan)
+
+    @app.exception_handler(TwitterRepositoryError)
+    async def repository_error_handler(request: Request, exc: TwitterRepositoryError):
+        return JSONResponse(
+            status_code=502,
+            content={"message": exc.message, "error_code": exc.error_code}
+        )
+
+    @app.exception_handler(ValueError)
+    async def validation_error_handler(request: Request, exc: ValueError):
+        return JSONResponse(
+            status_code=400,
+            content={"message": str(exc), "error_code": "VALIDATION_ERROR"}
+        )
+
+    @app.post("/read_last_tweets")
+    async def read_last_tweets(call: ReadTweetsCall) -> Dict[str, Any]:
+        tweets = await twitter_repo.for_account(call.account).read_last_tweets(call.username, call.count)
+        return {"tweets": [tweet.to_dict() for tweet in tweets]}
+
+    @app.post("/read_last_mentions")
+    async def read_last_mentions(call: ReadMentionsCall) -> Dict[str, Any]:
+        tweets = await twitter_repo.for_account(call.account).read_last_mentions(call.count, call.since_id)
+        return {"tweets": [tweet.to_dict() for tweet in tweets]}
+
+    @app.post("/reply_to_tweet")
+    async def reply_to_tweet(call: TweetTextCall) -> Dict[str, Any]:
+        result = await twitter_repo.for_account(call.account).reply_to_tweet(call.tweet_id, call.text)
+        return result.to_dict()
+
+    @app.post("/quote_tweet")
+    async def quote_tweet(call: TweetTextCall) -> Dict[str, Any]:
+        result = await twitter_repo.for_account(call.account).quote_tweet(call.tweet_id, call.text)
+        return result.to_dict()
+
+    @app.post("/retweet")
+    async def retweet(call: TweetIdCall) -> Dict[str, Any]:
+        result = await twitter_repo.for_account(call.account).retweet(call.tweet_id)
+        return result.to_dict()
+
+    @app.post("/post_tweet")
+    async def post_tweet(call: PostCall) -> Dict[str, Any]:
+        result = await twitter_repo.for_account(call.account).post_tweet(call.text)
+        return result.to_dict()
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        started = browser_manager is not None and browser_manager.is_started()
+        stats: Optional[Dict[str, Any]] = None
+        if started:
+            stats = {
+                "pool": browser_manager.pool_stats(),
+                "resources": browser_manager.resource_stats(),
+                "restarts": browser_manager.restart_stats()
+            }
+        return {"status": "healthy" if started else "starting", "browser": stats}
+
+    return app
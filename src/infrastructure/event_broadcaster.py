@@ -0,0 +1,50 @@
+"""In-process publish/subscribe for pushing events to streaming clients."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Set
+
+logger = logging.getLogger(__name__)
+
+
+class EventBroadcaster:
+    """
+    Fan out events to every current subscriber.
+
+    Each subscriber gets its own bounded queue. Publishing never blocks: a
+    subscriber that falls `max_queue_size` events behind loses the oldest
+    ones rather than slowing down the publisher (or the other subscribers).
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        self._max_queue_size = max_queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscribers)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Queue an event for every subscriber."""
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                logger.debug("Subscriber queue full, dropped oldest event")
+            queue.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        """
+        Register a subscriber for the duration of the block.
+
+        Yields:
+            Queue receiving every event published while subscribed
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
@@ -0,0 +1,268 @@
+"""Capture and parse X timeline data from GraphQL network responses."""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from playwright.async_api import Page, Response
+from src.domain.models import Tweet
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+# GraphQL operations whose payloads carry the timelines we read
+PROFILE_TIMELINE_OPERATIONS = ("UserTweets",)
+MENTIONS_TIMELINE_OPERATIONS = ("NotificationsTimeline", "Mentions")
+
+# Older REST endpoint still used by some clients for the mentions tab
+LEGACY_MENTIONS_PATH = "/2/notifications/mentions.json"
+
+TWITTER_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+
+def parse_twitter_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse X's legacy created_at ("Wed Oct 10 20:19:24 +0000 2018") into naive UTC."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.strptime(value, TWITTER_DATE_FORMAT)
+    except ValueError:
+        return None
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _iter_tweet_results(node: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every `tweet_results.result` object in timeline order.
+
+    Only `tweet_results` keys are followed, so quoted tweets
+    (`quoted_status_result`) and retweeted originals
+    (`retweeted_status_result`) are not reported as separate timeline items.
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "tweet_results" and isinstance(value, dict):
+                result = value.get("result")
+                if isinstance(result, dict):
+                    yield result
+            else:
+                yield from _iter_tweet_results(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _iter_tweet_results(item)
+
+
+def _tweet_from_result(result: Dict[str, Any]) -> Optional[Tweet]:
+    """Convert one GraphQL tweet result into a Tweet."""
+    # Tweets with visibility limits wrap the real result one level deeper
+    if result.get("__typename") == "TweetWithVisibilityResults":
+        result = result.get("tweet") or {}
+
+    legacy = result.get("legacy") or {}
+    tweet_id = result.get("rest_id") or legacy.get("id_str")
+    if not tweet_id:
+        return None
+
+    user = ((result.get("core") or {}).get("user_results") or {}).get("result") or {}
+    username = (
+        (user.get("core") or {}).get("screen_name")
+        or (user.get("legacy") or {}).get("screen_name")
+    )
+
+    # Long posts keep their full text in note_tweet
+    note = (((result.get("note_tweet") or {}).get("note_tweet_results") or {}).get("result") or {})
+    text = note.get("text") or legacy.get("full_text") or ""
+
+    if not username or not text:
+        return None
+
+    return Tweet(
+        id=tweet_id,
+        text=text,
+        author_username=username,
+        url=f"{config.TWITTER_BASE_URL}/{username}/status/{tweet_id}",
+        created_at=parse_twitter_date(legacy.get("created_at")),
+        retweet_count=legacy.get("retweet_count"),
+        like_count=legacy.get("favorite_count"),
+        reply_count=legacy.get("reply_count")
+    )
+
+
+def _parse_legacy_mentions(payload: Dict[str, Any]) -> List[Tweet]:
+    """Parse the REST notifications payload (globalObjects + timeline entries)."""
+    global_objects = payload.get("globalObjects") or {}
+    tweets_by_id = global_objects.get("tweets") or {}
+    users_by_id = global_objects.get("users") or {}
+
+    # Timeline entries give the display order; fall back to object order
+    ordered_ids = []
+    for instruction in ((payload.get("timeline") or {}).get("instructions") or []):
+        for entry in ((instruction.get("addEntries") or {}).get("entries") or []):
+            tweet_ref = (((entry.get("content") or {}).get("item") or {}).get("content") or {}).get("tweet")
+            if tweet_ref and tweet_ref.get("id"):
+                ordered_ids.append(tweet_ref["id"])
+    if not ordered_ids:
+        ordered_ids = list(tweets_by_id.keys())
+
+    tweets = []
+    for tweet_id in ordered_ids:
+        raw = tweets_by_id.get(tweet_id)
+        if not raw:
+            continue
+        username = (users_by_id.get(raw.get("user_id_str")) or {}).get("screen_name")
+        text = raw.get("full_text") or raw.get("text")
+        if not username or not text:
+            continue
+        tweets.append(Tweet(
+            id=tweet_id,
+            text=text,
+            author_username=username,
+            url=f"{config.TWITTER_BASE_URL}/{username}/status/{tweet_id}",
+            created_at=parse_twitter_date(raw.get("created_at")),
+            retweet_count=raw.get("retweet_count"),
+            like_count=raw.get("favorite_count"),
+            reply_count=raw.get("reply_count")
+        ))
+    return tweets
+
+
+def parse_timeline_payload(payload: Dict[str, Any]) -> List[Tweet]:
+    """
+    Parse a timeline response body into Tweets, in timeline order.
+
+    Handles GraphQL timelines (UserTweets, NotificationsTimeline, ...) and
+    the legacy REST mentions payload.
+
+    Args:
+        payload: Decoded JSON response body
+
+    Returns:
+        List of Tweet objects (duplicates within the payload removed)
+    """
+    if "globalObjects" in payload:
+        return _parse_legacy_mentions(payload)
+
+    tweets = []
+    seen = set()
+    for result in _iter_tweet_results(payload.get("data") or payload):
+        tweet = _tweet_from_result(result)
+        if tweet and tweet.id not in seen:
+            seen.add(tweet.id)
+            tweets.append(tweet)
+    return tweets
+
+
+class TimelineCapture:
+    """
+    Collects tweets from timeline responses while a page loads and scrolls.
+
+    Attach before navigating so the first page of results is not missed:
+
+        capture = TimelineCapture(page, PROFILE_TIMELINE_OPERATIONS)
+        capture.attach()
+        try:
+            await page.goto(...)
+            if await capture.wait_for_payload():
+                tweets = capture.tweets
+        finally:
+            capture.detach()
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        operations: Sequence[str],
+        include_legacy_mentions: bool = False
+    ):
+        self._page = page
+        self._operations = tuple(operations)
+        self._include_legacy_mentions = include_legacy_mentions
+        self._tweets: Dict[str, Tweet] = {}
+        self._payload_count = 0
+        self._payload_event = asyncio.Event()
+        self._pending: set = set()
+
+    @property
+    def tweets(self) -> List[Tweet]:
+        """Unique tweets captured so far, in the order they arrived."""
+        return list(self._tweets.values())
+
+    @property
+    def payload_count(self) -> int:
+        """Number of timeline payloads parsed so far."""
+        return self._payload_count
+
+    def attach(self) -> None:
+        """Start listening to page responses."""
+        self._page.on("response", self._on_response)
+
+    def detach(self) -> None:
+        """Stop listening and cancel any payload still being read."""
+        self._page.remove_listener("response", self._on_response)
+        for task in self._pending:
+            task.cancel()
+        self._pending.clear()
+
+    async def wait_for_payload(self, after: int = 0, max_wait_ms: Optional[int] = None) -> bool:
+        """
+        Wait until more than `after` payloads have been parsed.
+
+        Returns:
+            True if a new payload arrived, False if the cap was reached
+        """
+        max_wait_ms = max_wait_ms if max_wait_ms is not None else config.READINESS_MAX_WAIT_MS
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait_ms / 1000
+
+        while self._payload_count <= after:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            self._payload_event.clear()
+            try:
+                await asyncio.wait_for(self._payload_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return self._payload_count > after
+        return True
+
+    def matches(self, url: str) -> bool:
+        """Check whether a response URL is one of the captured timeline endpoints."""
+        path = url.split("?", 1)[0]
+        if "/graphql/" in path and path.rsplit("/", 1)[-1] in self._operations:
+            return True
+        return self._include_legacy_mentions and path.endswith(LEGACY_MENTIONS_PATH)
+
+    def add_payload(self, payload: Dict[str, Any]) -> int:
+        """
+        Parse one payload and merge its tweets.
+
+        Returns:
+            Number of tweets that were not captured before
+        """
+        new_tweets = 0
+        for tweet in parse_timeline_payload(payload):
+            if tweet.id not in self._tweets:
+                self._tweets[tweet.id] = tweet
+                new_tweets += 1
+
+        self._payload_count += 1
+        self._payload_event.set()
+        logger.debug(f"Captured timeline payload with {new_tweets} new tweets")
+        return new_tweets
+
+    def _on_response(self, response: Response) -> None:
+        """Page response listener; reads matching bodies in the background."""
+        if not self.matches(response.url):
+            return
+        task = asyncio.ensure_future(self._read(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response: Response) -> None:
+        """Decode a matching response body and merge it."""
+        try:
+            if not response.ok:
+                return
+            self.add_payload(await response.json())
+        except Exception as e:
+            logger.debug(f"Could not parse timeline response {response.url}: {e}")
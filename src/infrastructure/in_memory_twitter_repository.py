@@ -0,0 +1,337 @@
+"""ITwitterRepository serving synthetic timelines from memory (TWITTER_BACKEND=memory).
+
+Meant for load testing the REST API, MCP tools, use cases and MongoDB
+without a browser: reads return deterministic generated tweets, writes are
+recorded, and every call waits a sampled latency, holds one of a bounded
+number of slots (like a pooled page) and may fail with the error codes
+PlaywrightTwitterRepository raises.
+"""
+
+import asyncio
+import copy
+import itertools
+import logging
+import math
+import random
+import zlib
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+from src.domain.interfaces import ITwitterRepository, TwitterRepositoryError
+from src.domain.models import Tweet, ActionResult, TweetPostResult, ReplyResult
+from src.infrastructure.tweet_extraction import is_newer_status
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# Error code of an injected non-timeout failure, per operation (as raised by the browser flows)
+FAILURE_CODES = {
+    "read_last_tweets": "READ_FAILED",
+    "read_last_mentions": "READ_FAILED",
+    "reply_to_tweet": "REPLY_FAILED",
+    "retweet": "RETWEET_FAILED",
+    "post_tweet": "POST_FAILED",
+    "quote_tweet": "QUOTE_FAILED"
+}
+
+# Timeline statuses count down from here (per-timeline offset added);
+# tweets created by writes count up from CREATED_ID_BASE
+TIMELINE_ID_BASE = 1_800_000_000_000_000_000
+CREATED_ID_BASE = 1_950_000_000_000_000_000
+
+# Writes kept for inspection (older ones are only counted)
+MAX_RECORDED_WRITES = 10_000
+
+
+@dataclass
+class LatencyModel:
+    """Distribution of simulated call durations."""
+
+    distribution: str = "lognormal"
+    median_ms: float = 0.0
+    spread: float = 0.5  # +/- fraction for uniform, sigma for lognormal
+
+    def __post_init__(self):
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution '{self.distribution}', expected one of {', '.join(LATENCY_DISTRIBUTIONS)}"
+            )
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one duration in seconds."""
+        if self.median_ms <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            value = self.median_ms * rng.uniform(max(0.0, 1 - self.spread), 1 + self.spread)
+        elif self.distribution == "exponential":
+            # An exponential with rate ln(2)/median has that median
+            value = rng.expovariate(math.log(2) / self.median_ms)
+        elif self.distribution == "lognormal":
+            value = self.median_ms * math.exp(rng.gauss(0, self.spread))
+        else:
+            value = self.median_ms
+        return value / 1000
+
+
+class _SharedState:
+    """Slots, counters and recorded writes shared by every account's view."""
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.slots: Dict[str, asyncio.Semaphore] = {}
+        self.in_flight = 0
+        self.calls: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.writes: Deque[Dict[str, Any]] = deque(maxlen=MAX_RECORDED_WRITES)
+        self.write_count = 0
+        self.created_ids = itertools.count(CREATED_ID_BASE + 1)
+
+
+class InMemoryTwitterRepository(ITwitterRepository):
+    """
+    Twitter repository backed by generated data instead of a browser.
+
+    Profile and mention timelines are generated from the username (or
+    account) and position, so repeated reads return the same tweets and
+    `since_id` stops a mentions read exactly like on X. Each call first
+    takes a slot (at most `max_concurrency` per account, waiting up to
+    BROWSER_PAGE_ACQUIRE_TIMEOUT before BROWSER_BUSY), then waits a latency
+    drawn from the read or write model. A `timeout_rate` share of calls
+    holds the slot for `timeout_ms` and raises TIMEOUT; a `failure_rate`
+    share raises the operation's failure code (READ_FAILED, REPLY_FAILED...).
+    """
+
+    def __init__(
+        self,
+        read_latency: Optional[LatencyModel] = None,
+        write_latency: Optional[LatencyModel] = None,
+        timeout_rate: Optional[float] = None,
+        failure_rate: Optional[float] = None,
+        timeout_ms: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        timeline_length: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the repository (arguments default to the MEMORY_* settings).
+
+        Args:
+            read_latency: Latency of read_last_tweets/read_last_mentions
+            write_latency: Latency of reply, retweet, post and quote
+            timeout_rate: Share of calls (0-1) failing with TIMEOUT
+            failure_rate: Share of calls (0-1) failing with the operation's error code
+            timeout_ms: How long an injected timeout holds its slot
+            max_concurrency: Calls running at once per account (0 = unlimited)
+            timeline_length: Statuses in each generated timeline
+            seed: Seed for latency and fault sampling (timelines never vary)
+        """
+        self.read_latency = read_latency or LatencyModel(
+            config.MEMORY_LATENCY_DISTRIBUTION, config.MEMORY_READ_LATENCY_MS, config.MEMORY_LATENCY_SPREAD
+        )
+        self.write_latency = write_latency or LatencyModel(
+            config.MEMORY_LATENCY_DISTRIBUTION, config.MEMORY_WRITE_LATENCY_MS, config.MEMORY_LATENCY_SPREAD
+        )
+        self.timeout_rate = timeout_rate if timeout_rate is not None else config.MEMORY_TIMEOUT_RATE
+        self.failure_rate = failure_rate if failure_rate is not None else config.MEMORY_FAILURE_RATE
+        self.timeout_ms = timeout_ms if timeout_ms is not None else config.MEMORY_TIMEOUT_MS
+        self.timeline_length = timeline_length if timeline_length is not None else config.MEMORY_TIMELINE_LENGTH
+        self._rng = random.Random(seed)
+        self._state = _SharedState(max_concurrency if max_concurrency is not None else config.MEMORY_MAX_CONCURRENCY)
+        self._accounts = list(config.get_accounts())
+        self.account = self._accounts[0]
+        self._epoch = datetime.utcnow()
+        logger.info(
+            f"In-memory Twitter backend: {self.read_latency.distribution} latency "
+            f"(read {self.read_latency.median_ms}ms, write {self.write_latency.median_ms}ms), "
+            f"timeout rate {self.timeout_rate}, failure rate {self.failure_rate}, "
+            f"concurrency {self._state.max_concurrency or 'unlimited'}"
+        )
+
+    def for_account(self, account: Optional[str]) -> 'InMemoryTwitterRepository':
+        """
+        Get a view acting as `account` (one of TWITTER_ACCOUNTS).
+
+        Views share recorded writes and counters; each account has its own slots.
+
+        Raises:
+            ValueError: If the account is not configured
+        """
+        account = account or self._accounts[0]
+        if account == self.account:
+            return self
+        if account not in self._accounts:
+            raise ValueError(f"Unknown account '{account}'. Configured accounts: {', '.join(self._accounts)}")
+        repo = copy.copy(self)
+        repo.account = account
+        return repo
+
+    async def read_last_tweets(self, username: str, count: int) -> List[Tweet]:
+        """Return the newest `count` generated tweets of `username`'s profile."""
+        async with self._call("read_last_tweets", self.read_latency):
+            return [
+                self._timeline_tweet("profile", username, index)
+                for index in range(min(count, self.timeline_length))
+            ]
+
+    async def read_last_mentions(self, count: int, since_id: Optional[str] = None) -> List[Tweet]:
+        """Return the newest `count` generated mentions, stopping at `since_id`."""
+        async with self._call("read_last_mentions", self.read_latency):
+            mentions = []
+            for index in range(min(count, self.timeline_length)):
+                tweet = self._timeline_tweet("mentions", self.account, index)
+                if not is_newer_status(tweet.id, since_id):
+                    break
+                mentions.append(tweet)
+            return mentions
+
+    async def reply_to_tweet(self, tweet_id: str, text: str) -> ReplyResult:
+        """Record a reply and return a result shaped like the browser flow's."""
+        async with self._call("reply_to_tweet", self.write_latency):
+            reply_tweet_id = self._record_write("reply", tweet_id, text)
+            return ReplyResult(
+                success=True,
+                message=f"Successfully replied to tweet {tweet_id}",
+                original_tweet_id=tweet_id,
+                reply_tweet_id=reply_tweet_id,
+                reply_url=self._status_url(reply_tweet_id),
+                data={"reply_text": text}
+            )
+
+    async def retweet(self, tweet_id: str) -> ActionResult:
+        """Record a retweet."""
+        async with self._call("retweet", self.write_latency):
+            self._record_write("retweet", tweet_id)
+            return ActionResult(
+                success=True,
+                message=f"Successfully retweeted tweet {tweet_id}",
+                data={"tweet_id": tweet_id}
+            )
+
+    async def post_tweet(self, text: str) -> TweetPostResult:
+        """Record a new tweet."""
+        async with self._call("post_tweet", self.write_latency):
+            new_tweet_id = self._record_write("post", None, text)
+            return TweetPostResult(
+                success=True,
+                message="Successfully posted tweet",
+                tweet_id=new_tweet_id,
+                tweet_url=self._status_url(new_tweet_id),
+                data={"tweet_text": text}
+            )
+
+    async def quote_tweet(self, tweet_id: str, text: str) -> ReplyResult:
+        """Record a quote tweet."""
+        async with self._call("quote_tweet", self.write_latency):
+            quote_tweet_id = self._record_write("quote", tweet_id, text)
+            return ReplyResult(
+                success=True,
+                message=f"Successfully quote tweeted {tweet_id}",
+                original_tweet_id=tweet_id,
+                reply_tweet_id=quote_tweet_id,
+                reply_url=self._status_url(quote_tweet_id),
+                data={"quote_text": text}
+            )
+
+    @property
+    def writes(self) -> List[Dict[str, Any]]:
+        """Recorded writes, oldest first (the last MAX_RECORDED_WRITES)."""
+        return list(self._state.writes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls per operation, injected errors per code, writes and slot usage."""
+        state = self._state
+        return {
+            "calls": dict(state.calls),
+            "errors": dict(state.errors),
+            "writes": state.write_count,
+            "in_flight": state.in_flight,
+            "max_concurrency": state.max_concurrency
+        }
+
+    # Helper methods
+
+    @asynccontextmanager
+    async def _call(self, operation: str, latency: LatencyModel) -> AsyncIterator[None]:
+        """Hold a slot, wait the sampled latency and inject faults around one call."""
+        state = self._state
+        state.calls[operation] += 1
+
+        slot = self._slot()
+        if slot is not None:
+            try:
+                await asyncio.wait_for(slot.acquire(), timeout=config.BROWSER_PAGE_ACQUIRE_TIMEOUT)
+            except asyncio.TimeoutError:
+                state.errors["BROWSER_BUSY"] += 1
+                raise TwitterRepositoryError("Browser is busy, no page available", error_code="BROWSER_BUSY")
+        state.in_flight += 1
+
+        try:
+            roll = self._rng.random()
+            if roll < self.timeout_rate:
+                await asyncio.sleep(self.timeout_ms / 1000)
+                state.errors["TIMEOUT"] += 1
+                raise TwitterRepositoryError(f"Timeout in {operation} (injected)", error_code="TIMEOUT")
+
+            await asyncio.sleep(latency.sample(self._rng))
+            if roll < self.timeout_rate + self.failure_rate:
+                code = FAILURE_CODES[operation]
+                state.errors[code] += 1
+                raise TwitterRepositoryError(f"Failed in {operation} (injected)", error_code=code)
+            yield
+        finally:
+            state.in_flight -= 1
+            if slot is not None:
+                slot.release()
+
+    def _slot(self) -> Optional[asyncio.Semaphore]:
+        """The account's slot semaphore, or None when concurrency is unlimited."""
+        if self._state.max_concurrency <= 0:
+            return None
+        slot = self._state.slots.get(self.account)
+        if slot is None:
+            slot = self._state.slots[self.account] = asyncio.Semaphore(self._state.max_concurrency)
+        return slot
+
+    def _timeline_tweet(self, timeline: str, owner: str, index: int) -> Tweet:
+        """The `index`-th newest status of a generated timeline (same inputs, same tweet)."""
+        rng = random.Random(f"{timeline}:{owner}:{index}")
+        if timeline == "profile":
+            author = owner
+            text = f"Synthetic post {index} from @{owner} about topic {rng.randint(1, 50)}"
+        else:
+            author = f"fan_{rng.randint(1, 400)}"
+            text = f"@{owner} synthetic mention {index}: question {rng.randint(1, 1000)}?"
+        offset = (zlib.crc32(f"{timeline}:{owner}".encode()) % 1000) * 10 ** 9
+        tweet_id = str(TIMELINE_ID_BASE + offset + self.timeline_length - index)
+        return Tweet(
+            id=tweet_id,
+            text=text,
+            author_username=author,
+            created_at=self._epoch - timedelta(minutes=7 * index),
+            url=f"{config.TWITTER_BASE_URL}/{author}/status/{tweet_id}",
+            retweet_count=rng.randint(0, 50),
+            like_count=rng.randint(0, 200),
+            reply_count=rng.randint(0, 20)
+        )
+
+    def _record_write(self, action: str, tweet_id: Optional[str], text: Optional[str] = None) -> str:
+        """Store one write and return the ID of the status it created."""
+        created_id = str(next(self._state.created_ids))
+        self._state.write_count += 1
+        self._state.writes.append({
+            "action": action,
+            "account": self.account,
+            "tweetId": tweet_id,
+            "text": text,
+            "createdTweetId": created_id,
+            "at": datetime.utcnow()
+        })
+        return created_id
+
+    def _status_url(self, tweet_id: str) -> str:
+        return f"{config.TWITTER_BASE_URL}/i/status/{tweet_id}"
+
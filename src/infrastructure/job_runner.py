@@ -0,0 +1,118 @@
+"""Run write actions in the background and track them in the jobs collection."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from src.domain.interfaces import TwitterRepositoryError
+from src.domain.models import ActionResult, Job, JobStatus
+from src.infrastructure.event_broadcaster import EventBroadcaster
+from src.infrastructure.mongo_repository import MongoRepository
+
+logger = logging.getLogger(__name__)
+
+
+class JobRunner:
+    """
+    Accept write actions, run them as background tasks, persist their state.
+
+    `submit()` stores the job as queued and returns at once, so the HTTP
+    request is answered with 202 instead of waiting for the browser. At
+    most `max_concurrency` jobs run at a time. Every state change is
+    written to MongoDB and published to the broadcaster as a `job` event.
+    """
+
+    def __init__(
+        self,
+        mongo_repo: MongoRepository,
+        broadcaster: EventBroadcaster,
+        max_concurrency: int = 2
+    ):
+        self.mongo_repo = mongo_repo
+        self.broadcaster = broadcaster
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        action: str,
+        params: Dict[str, Any],
+        run: Callable[[], Awaitable[ActionResult]],
+        account: Optional[str] = None
+    ) -> Job:
+        """
+        Persist a job and start running it.
+
+        Args:
+            action: Action name recorded on the job
+            params: Request parameters recorded on the job
+            run: Performs the action (e.g. a bound use case call)
+            account: Bot account the action runs as
+
+        Returns:
+            The queued Job
+
+        Raises:
+            Exception if the job cannot be stored
+        """
+        job = Job(action=action, params=params, account=account)
+        await self.mongo_repo.create_job(job)
+        self._publish(job)
+
+        task = asyncio.ensure_future(self._run(job, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.info(f"Accepted {action} job {job.job_id}")
+        return job
+
+    async def close(self) -> None:
+        """Wait for running jobs to finish."""
+        if self._tasks:
+            logger.info(f"Waiting for {len(self._tasks)} jobs to finish")
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    # Helper methods
+
+    async def _run(self, job: Job, run: Callable[[], Awaitable[ActionResult]]) -> None:
+        async with self._semaphore:
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.utcnow()
+            await self._save(job)
+
+            try:
+                result = await run()
+                job.result = result.to_dict()
+                if result.success:
+                    job.status = JobStatus.SUCCEEDED
+                else:
+                    job.status = JobStatus.FAILED
+                    job.error = result.message
+                    job.error_code = result.error_code
+            except TwitterRepositoryError as e:
+                job.status = JobStatus.FAILED
+                job.error = e.message
+                job.error_code = e.error_code
+            except ValueError as e:
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+                job.error_code = "VALIDATION_ERROR"
+            except Exception as e:
+                logger.exception(f"Unexpected error in {job.action} job {job.job_id}: {e}")
+                job.status = JobStatus.FAILED
+                job.error = "Internal server error"
+                job.error_code = "INTERNAL_ERROR"
+
+            job.finished_at = datetime.utcnow()
+            await self._save(job)
+            logger.info(f"{job.action} job {job.job_id} {job.status.value}")
+
+    async def _save(self, job: Job) -> None:
+        """Persist and publish a state change; a storage error must not kill the job."""
+        try:
+            await self.mongo_repo.save_job(job)
+        except Exception as e:
+            logger.error(f"Failed to save job {job.job_id}: {e}")
+        self._publish(job)
+
+    def _publish(self, job: Job) -> None:
+        self.broadcaster.publish({"type": "job", "job": job.to_api_dict()})
@@ -0,0 +1,111 @@
+"""Background loop that keeps the mentions collection up to date."""
+
+import asyncio
+import logging
+import random
+from typing import Any, Dict, List, Optional
+from src.domain.interfaces import TwitterRepositoryError
+from src.domain.use_cases_extended import SyncMentionsUseCase
+from src.infrastructure.action_scheduler import BACKGROUND_LANE, scheduler_lane
+
+logger = logging.getLogger(__name__)
+
+
+class MentionPoller:
+    """
+    Scrape mentions on a fixed interval and store them in MongoDB.
+
+    With the poller running, GET /mentions/unanswered reads straight from
+    MongoDB, so scrape load is one sync per account per interval no matter
+    how many clients poll. Each cycle sleeps `interval_seconds` plus a
+    random 0..`jitter_seconds` so the scrape pattern is not perfectly
+    periodic. New mentions are published by SyncMentionsUseCase.
+    """
+
+    def __init__(
+        self,
+        sync_mentions: SyncMentionsUseCase,
+        accounts: List[str],
+        interval_seconds: float,
+        jitter_seconds: float = 0.0,
+        count: int = 20
+    ):
+        """
+        Initialize the poller.
+
+        Args:
+            sync_mentions: Use case that scrapes and stores mentions
+            accounts: Bot accounts whose mentions are synced each cycle
+            interval_seconds: Base delay between cycles
+            jitter_seconds: Maximum random delay added to each cycle
+            count: Mentions scraped per account per cycle
+        """
+        self.sync_mentions = sync_mentions
+        self.accounts = accounts
+        self.interval_seconds = interval_seconds
+        self.jitter_seconds = jitter_seconds
+        self.count = count
+
+        self._task: Optional[asyncio.Task] = None
+        self._cycles = 0
+        self._failures = 0
+        self._last_success: Dict[str, float] = {}
+
+    def start(self) -> None:
+        """Start polling in the background (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+            logger.info(
+                f"Mention poller started: every {self.interval_seconds}s "
+                f"(+{self.jitter_seconds}s jitter) for {', '.join(self.accounts)}"
+            )
+
+    async def stop(self) -> None:
+        """Stop polling and wait for the current cycle to be cancelled."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        logger.info("Mention poller stopped")
+
+    def is_running(self) -> bool:
+        """Check whether the polling loop is active."""
+        return self._task is not None and not self._task.done()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cycle counters and the age of each account's last successful sync."""
+        now = asyncio.get_running_loop().time()
+        return {
+            "running": self.is_running(),
+            "cycles": self._cycles,
+            "failures": self._failures,
+            "last_success_age_seconds": {
+                account: round(now - at, 1) for account, at in self._last_success.items()
+            }
+        }
+
+    async def poll_once(self) -> None:
+        """Sync every account once; one account failing does not skip the rest."""
+        for account in self.accounts:
+            try:
+                # Ingestion yields to interactive requests when the action scheduler is on
+                with scheduler_lane(BACKGROUND_LANE):
+                    await self.sync_mentions.execute(self.count, account=account)
+                self._last_success[account] = asyncio.get_running_loop().time()
+            except TwitterRepositoryError as e:
+                self._failures += 1
+                logger.warning(f"Mention poll for account '{account}' failed: {e.message}")
+            except Exception as e:
+                self._failures += 1
+                logger.exception(f"Unexpected error polling mentions for account '{account}': {e}")
+        self._cycles += 1
+
+    # Helper methods
+
+    async def _run(self) -> None:
+        while True:
+            await self.poll_once()
+            await asyncio.sleep(self.interval_seconds + random.uniform(0, self.jitter_seconds))
@@ -0,0 +1,321 @@
+"""In-process metrics (counters, gauges, histograms) in the Prometheus text format.
+
+Modules declare their metrics at import time on the global `metrics`
+registry and the REST API serves `metrics.render()` at /metrics. With
+METRICS_ENABLED=false the registry hands out no-op metrics and `timed`
+returns functions unchanged, so instrumented code pays one attribute
+lookup per call at most.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers a fast Mongo lookup up to a full timeline scroll
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Name, help text and label names shared by every metric type."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Current value per label set (usually set by a collector at scrape time)."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        self._values[labelvalues] = value
+
+    def clear(self) -> None:
+        """Drop every label set (collectors call this before re-reading state)."""
+        self._values.clear()
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed durations per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (non-cumulative, +Inf last), sum]
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        series = self._series.get(labelvalues)
+        if series is None:
+            series = self._series[labelvalues] = ([0] * (len(self.buckets) + 1), [0.0])
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1][0] += value
+
+    @contextmanager
+    def time(self, *labelvalues: str) -> Iterator[None]:
+        """Observe the duration of the `with` block (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labelvalues)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {round(total[0], 6)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class _NullMetric:
+    """Stands in for every metric type when metrics are disabled."""
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        pass
+
+    @contextmanager
+    def time(self, *labelvalues: str) -> Iterator[None]:
+        yield
+
+
+_NULL_METRIC = _NullMetric()
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics.
+
+    Metrics are created once per name (asking again returns the same
+    object). Collectors run at the start of every `render()` and are where
+    gauges read pool, queue and cache state.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run `collector` before each render (no-op when disabled)."""
+        if self.enabled:
+            self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], None]) -> None:
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def timed(self, histogram: Histogram, *labelvalues: str) -> Callable:
+        """
+        Decorator observing how long each call to an async function takes.
+
+        Without label values the function name is the only label. Returns
+        the function unchanged when metrics are disabled.
+        """
+        def decorator(func: Callable) -> Callable:
+            if not self.enabled:
+                return func
+            assert asyncio.iscoroutinefunction(func), f"{func.__qualname__} is not async"
+            labels = labelvalues or (func.__name__,)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with histogram.time(*labels):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector.__qualname__} failed: {e}")
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    # Helper methods
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        if not self.enabled:
+            return _NULL_METRIC
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+        elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} is already registered with a different type or labels")
+        return metric
+
+
+# Global registry (disabled unless METRICS_ENABLED=true)
+metrics = MetricsRegistry(enabled=config.METRICS_ENABLED)
+
+
+def runtime_gauges_collector(
+    browser_manager=None,  # Optional BrowserManager (page pools)
+    action_scheduler=None,  # Optional ActionScheduler (lane queues)
+    single_flight=None  # Optional SingleFlight (coalesced reads)
+) -> Callable[[], None]:
+    """
+    Build a collector that reads pool and queue state into gauges at scrape time.
+
+    Register the result with `metrics.add_collector()`; components that are
+    not in use are passed as None and skipped.
+    """
+    page_pool = metrics.gauge(
+        "browser_page_pool",
+        "Page pool occupancy per account (size, created, idle, in_use, waiting callers)",
+        ("account", "state")
+    )
+    lane_waiting = metrics.gauge("scheduler_lane_waiting", "Calls queued in each scheduler lane", ("lane",))
+    lane_running = metrics.gauge("scheduler_lane_running", "Calls running in each scheduler lane", ("lane",))
+    in_flight = metrics.gauge("single_flight_in_flight", "Distinct reads currently being coalesced")
+
+    def collect() -> None:
+        if browser_manager is not None and browser_manager.is_started():
+            page_pool.clear()
+            for account, stats in browser_manager.pool_stats().items():
+                for state in ("size", "created", "idle", "in_use", "waiting"):
+                    page_pool.set(stats[state], account, state)
+        if action_scheduler is not None:
+            for lane, stats in action_scheduler.stats().items():
+                lane_waiting.set(stats["waiting"], lane)
+                lane_running.set(stats["running"], lane)
+        if single_flight is not None:
+            in_flight.set(single_flight.in_flight)
+
+    return collect
+
+
+async def start_metrics_server(port: int, host: str = "127.0.0.1") -> asyncio.AbstractServer:
+    """
+    Serve `metrics.render()` over plain HTTP on `port`.
+
+    For processes without a web app (the MCP server talks stdio); every
+    request, whatever its path, gets the metrics page.
+    """
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            body = metrics.render().encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                + f"Content-Type: {CONTENT_TYPE}\r\nContent-Length: {len(body)}\r\n".encode()
+                + b"Connection: close\r\n\r\n"
+                + body
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    return server
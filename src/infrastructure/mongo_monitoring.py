@@ -0,0 +1,284 @@
+"""pymongo command monitoring: per-collection latency, slow-command log, sampled explains."""
+
+import asyncio
+import logging
+import random
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from bson import json_util
+from pymongo import monitoring
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from src.infrastructure.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Data commands worth timing (handshakes, auth and heartbeats are ignored)
+MONITORED_COMMANDS = frozenset({
+    "find", "getMore", "aggregate", "count", "distinct",
+    "insert", "update", "delete", "findAndModify", "createIndexes"
+})
+
+# Commands the server can explain; getMore/insert/createIndexes have no plan
+EXPLAINABLE_COMMANDS = frozenset({"find", "aggregate", "count", "distinct", "update", "delete", "findAndModify"})
+
+# Parts of a command kept in the slow log to show the query shape
+SHAPE_KEYS = ("filter", "sort", "pipeline", "query", "q", "updates", "deletes", "key")
+MAX_SHAPE_LENGTH = 500
+
+COMMAND_SECONDS = metrics.histogram(
+    "mongo_command_seconds",
+    "Server round-trip time of MongoDB commands, as reported by pymongo",
+    ("command", "collection")
+)
+SLOW_COMMANDS = metrics.counter(
+    "mongo_slow_commands_total",
+    "Commands slower than MONGO_SLOW_QUERY_MS",
+    ("command", "collection")
+)
+FAILED_COMMANDS = metrics.counter(
+    "mongo_failed_commands_total",
+    "Commands the server answered with an error",
+    ("command", "collection")
+)
+EXPLAINED_PLANS = metrics.counter(
+    "mongo_explained_plans_total",
+    "Plans of sampled slow commands by access type (COLLSCAN, IXSCAN, OTHER)",
+    ("command", "collection", "plan")
+)
+
+
+def explainable_command(command_name: str, command: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn a monitored command document into one the explain command accepts.
+
+    Drops session, cluster-time and `$db` fields (they belong to the
+    original request) and keeps only the first statement of a batched
+    update/delete, since explain takes a single statement.
+    """
+    explained = {
+        key: value for key, value in command.items()
+        if not key.startswith("$") and key not in ("lsid", "txnNumber")
+    }
+    statements = {"update": "updates", "delete": "deletes"}.get(command_name)
+    if statements and len(explained.get(statements) or []) > 1:
+        explained[statements] = explained[statements][:1]
+    return explained
+
+
+def summarize_plan(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce an explain document to the stages and indexes it uses.
+
+    Walks the whole document, so find, aggregate ($cursor stages) and
+    slot-based (queryPlan) explain formats are all covered. Rejected plans
+    are skipped. Execution counters are included when the explain ran with
+    executionStats verbosity.
+
+    Returns:
+        Dict with `plan` ("COLLSCAN" if any stage scans the collection,
+        else "IXSCAN" if an index is used, else "OTHER"), `stages`,
+        `indexes`, and `docs_examined`/`keys_examined`/`n_returned` when known
+    """
+    stages: List[str] = []
+    indexes: List[str] = []
+    counters = {"docs_examined": None, "keys_examined": None, "n_returned": None}
+    fields = {"totalDocsExamined": "docs_examined", "totalKeysExamined": "keys_examined", "nReturned": "n_returned"}
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            if isinstance(node.get("stage"), str):
+                stages.append(node["stage"])
+            if isinstance(node.get("indexName"), str) and node["indexName"] not in indexes:
+                indexes.append(node["indexName"])
+            for key, value in node.items():
+                if key in ("rejectedPlans", "allPlansExecution"):
+                    continue
+                if key == "executionStats" and isinstance(value, dict):
+                    # Top-level counters; per-stage nReturned below must not overwrite them
+                    for source, target in fields.items():
+                        if counters[target] is None and source in value:
+                            counters[target] = value[source]
+                walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(explain)
+
+    if "COLLSCAN" in stages:
+        plan = "COLLSCAN"
+    elif indexes or any(stage in ("IXSCAN", "IDHACK", "EXPRESS_IXSCAN", "COUNT_SCAN", "DISTINCT_SCAN") for stage in stages):
+        plan = "IXSCAN"
+    else:
+        plan = "OTHER"
+
+    summary: Dict[str, Any] = {"plan": plan, "stages": stages, "indexes": indexes}
+    summary.update({key: value for key, value in counters.items() if value is not None})
+    return summary
+
+
+class MongoCommandMonitor(monitoring.CommandListener):
+    """
+    CommandListener that times data commands per command and collection.
+
+    Pass it to the client (`AsyncIOMotorClient(..., event_listeners=[monitor])`),
+    then call `attach()` from the event loop. pymongo calls the listener on
+    its own threads, so shared state is guarded by a lock and explains are
+    handed to the loop. Commands slower than `slow_ms` are counted, logged
+    and kept in a bounded list; a sampled share of them is explained
+    (queryPlanner verbosity, so the query is not run again) to show
+    whether it scanned the collection.
+    """
+
+    def __init__(self, slow_ms: float = 100, explain_sample_rate: float = 0.0, max_slow_entries: int = 100):
+        self.slow_ms = slow_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[int, Any], Tuple[str, str, Optional[Dict[str, Any]]]] = {}
+        self._stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=max_slow_entries)
+        self._explaining: Set[Tuple[str, str]] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._db: Optional[AsyncIOMotorDatabase] = None
+
+    def attach(self, db: AsyncIOMotorDatabase) -> None:
+        """Bind the database and running loop used for explains."""
+        self._db = db
+        self._loop = asyncio.get_running_loop()
+
+    # CommandListener callbacks (run on pymongo threads)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name not in MONITORED_COMMANDS:
+            return
+        command = event.command
+        if event.command_name == "getMore":
+            collection = command.get("collection", "")
+        else:
+            collection = command.get(event.command_name, "")
+        # Keep the command document only if a slow run may need explaining
+        explain_source = command if event.command_name in EXPLAINABLE_COMMANDS else None
+        with self._lock:
+            self._pending[(event.request_id, event.connection_id)] = (event.command_name, str(collection), explain_source)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, failed=True)
+
+    # Reporting
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-command stats (slowest first) and the recent slow commands, newest first."""
+        with self._lock:
+            commands = [
+                {
+                    "command": command,
+                    "collection": collection,
+                    "count": int(stats["count"]),
+                    "failed": int(stats["failed"]),
+                    "slow": int(stats["slow"]),
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 2) if stats["count"] else 0.0,
+                    "max_ms": round(stats["max_ms"], 2)
+                }
+                for (command, collection), stats in self._stats.items()
+            ]
+            slow = [dict(entry) for entry in reversed(self._slow)]
+        commands.sort(key=lambda item: item["max_ms"], reverse=True)
+        return {
+            "slow_ms": self.slow_ms,
+            "explain_sample_rate": self.explain_sample_rate,
+            "commands": commands,
+            "slow_commands": slow
+        }
+
+    # Helper methods
+
+    def _finish(self, event, failed: bool) -> None:
+        with self._lock:
+            pending = self._pending.pop((event.request_id, event.connection_id), None)
+        if pending is None:
+            return
+
+        command_name, collection, explain_source = pending
+        duration_ms = event.duration_micros / 1000
+        slow = duration_ms >= self.slow_ms
+        labels = (command_name, collection)
+
+        with self._lock:
+            stats = self._stats.get(labels)
+            if stats is None:
+                stats = self._stats[labels] = {"count": 0, "failed": 0, "slow": 0, "total_ms": 0.0, "max_ms": 0.0}
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            COMMAND_SECONDS.observe(duration_ms / 1000, *labels)
+            if failed:
+                stats["failed"] += 1
+                FAILED_COMMANDS.inc(*labels)
+            if slow:
+                stats["slow"] += 1
+                SLOW_COMMANDS.inc(*labels)
+
+        if not slow:
+            return
+
+        entry = {
+            "at": datetime.utcnow().isoformat(),
+            "command": command_name,
+            "collection": collection,
+            "duration_ms": round(duration_ms, 2),
+            "failed": failed,
+            "shape": self._shape(explain_source) if explain_source else None,
+            "plan": None
+        }
+        with self._lock:
+            self._slow.append(entry)
+        logger.warning(f"Slow MongoDB {command_name} on {collection}: {duration_ms:.1f}ms")
+
+        if (
+            not failed
+            and explain_source is not None
+            and self._db is not None
+            and random.random() < self.explain_sample_rate
+        ):
+            with self._lock:
+                # One explain per command/collection at a time is plenty
+                if labels in self._explaining:
+                    return
+                self._explaining.add(labels)
+            self._loop.call_soon_threadsafe(self._start_explain, entry, explain_source)
+
+    def _start_explain(self, entry: Dict[str, Any], command: Dict[str, Any]) -> None:
+        asyncio.ensure_future(self._explain(entry, command))
+
+    async def _explain(self, entry: Dict[str, Any], command: Dict[str, Any]) -> None:
+        labels = (entry["command"], entry["collection"])
+        try:
+            result = await self._db.command(
+                "explain", explainable_command(entry["command"], command), verbosity="queryPlanner"
+            )
+            plan = summarize_plan(result)
+            with self._lock:
+                entry["plan"] = plan
+            EXPLAINED_PLANS.inc(*labels, plan["plan"])
+            if plan["plan"] == "COLLSCAN":
+                logger.warning(f"Slow MongoDB {entry['command']} on {entry['collection']} scans the whole collection")
+        except Exception as e:
+            logger.debug(f"Could not explain {entry['command']} on {entry['collection']}: {e}")
+        finally:
+            with self._lock:
+                self._explaining.discard(labels)
+
+    def _shape(self, command: Dict[str, Any]) -> Optional[str]:
+        """Filter/sort/pipeline of a command as truncated extended JSON."""
+        shape = {key: command[key] for key in SHAPE_KEYS if key in command}
+        if not shape:
+            return None
+        text = json_util.dumps(shape)
+        if len(text) > MAX_SHAPE_LENGTH:
+            text = text[:MAX_SHAPE_LENGTH] + "..."
+        return text
@@ -1,24 +1,60 @@
 """MongoDB repository for persisting tweets, mentions, and user data."""
 
+import asyncio
 import logging
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
-from pymongo.errors import DuplicateKeyError
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from src.config import config
+from src.infrastructure.blocked_user_cache import BlockedUserCache
+from src.infrastructure.metrics import metrics
+from src.infrastructure.mongo_monitoring import MongoCommandMonitor
 from src.domain.models import (
     StoredTweet,
     Mention,
     BlockedUser,
     Action,
+    AuthorStats,
+    Job,
+    JobStatus,
     TweetType,
     IgnoredReason,
     BlockedReason,
+    BulkStoreResult,
     Tweet
 )
 
 logger = logging.getLogger(__name__)
 
+MONGO_METHOD_SECONDS = metrics.histogram(
+    "mongo_repository_method_seconds",
+    "Duration of MongoRepository calls (all round trips of one call)",
+    ("method",)
+)
+
+# Fields written only when a document is first inserted. Re-scraping a tweet
+# must never reset our own tracking state or its internal idTweet.
+INSERT_ONLY_FIELDS = (
+    "idTweet", "createdAt", "type", "firstSeenAt",
+    "repliedTo", "repliedAt", "replyTweetId",
+    "repostedByUs", "repostedAt",
+    "ignored", "ignoredReason", "ignoredAt", "account"
+)
+
+# Mention indexes replaced by account-scoped ones; dropped by initialize()
+SUPERSEDED_MENTION_INDEXES = (
+    "tweetId_1",
+    "repliedTo_1_ignored_1_firstSeenAt_-1",
+    "authorUsername_1_repliedTo_1_ignored_1_firstSeenAt_-1"
+)
+
+# Duplicate mentions collected (and ignored) per get_unanswered_mentions call;
+# a larger flood is worked off over the following calls
+MAX_DUPLICATES_PER_READ = 1000
+
 
 class MongoRepository:
     """Repository for MongoDB persistence of tweets, mentions, and user data."""
@@ -28,12 +64,19 @@ class MongoRepository:
         Initialize MongoDB repository.
 
         Args:
-            client: Optional AsyncIOMotorClient. If None, creates one from config.
+            client: Optional AsyncIOMotorClient. If None, creates one from config
+                (with a command monitor when MONGO_MONITORING_ENABLED is set).
         """
+        # Listeners can only be registered when the client is created
+        self.monitor: Optional[MongoCommandMonitor] = None
         if client:
             self.client = client
         else:
-            self.client = AsyncIOMotorClient(config.get_mongo_uri())
+            listeners = []
+            if config.MONGO_MONITORING_ENABLED:
+                self.monitor = MongoCommandMonitor(config.MONGO_SLOW_QUERY_MS, config.MONGO_EXPLAIN_SAMPLE_RATE)
+                listeners.append(self.monitor)
+            self.client = AsyncIOMotorClient(config.get_mongo_uri(), event_listeners=listeners)
 
         self.db: AsyncIOMotorDatabase = self.client[config.MONGO_DB]
 
@@ -42,6 +85,15 @@ class MongoRepository:
         self.mentions: AsyncIOMotorCollection = self.db.mentions
         self.blocked_users: AsyncIOMotorCollection = self.db.blocked_users
         self.actions: AsyncIOMotorCollection = self.db.actions
+        self.author_stats: AsyncIOMotorCollection = self.db.author_stats
+        self.sync_state: AsyncIOMotorCollection = self.db.sync_state
+        self.jobs: AsyncIOMotorCollection = self.db.jobs
+
+        # Blocked usernames are read on every mentions request; keep them in memory
+        self.blocked_cache = BlockedUserCache(self.blocked_users, config.BLOCKED_USERS_CACHE_TTL_SECONDS)
+
+        # Duplicate-mention processing scheduled off the request path
+        self._background_tasks: Set[asyncio.Task] = set()
 
     async def initialize(self) -> None:
         """
@@ -52,6 +104,9 @@ class MongoRepository:
         """
         logger.info("Initializing MongoDB indexes")
 
+        if self.monitor:
+            self.monitor.attach(self.db)
+
         try:
             # Tweets collection indexes
             await self.tweets.create_index("tweetId", unique=True)
@@ -60,16 +115,32 @@ class MongoRepository:
             await self.tweets.create_index([("authorUsername", 1), ("createdAt", -1)])
             await self.tweets.create_index([("ignored", 1), ("firstSeenAt", -1)])
 
-            # Mentions collection indexes
-            await self.mentions.create_index("tweetId", unique=True)
+            # Mentions collection indexes (one document per tweet and bot account)
+            await self._scope_legacy_mentions()
+            await self.mentions.create_index([("tweetId", 1), ("account", 1)], unique=True)
             await self.mentions.create_index("idTweet", unique=True)
-            await self.mentions.create_index([("repliedTo", 1), ("ignored", 1), ("firstSeenAt", -1)])
+            await self.mentions.create_index(
+                [("account", 1), ("repliedTo", 1), ("ignored", 1), ("firstSeenAt", -1)]
+            )
             await self.mentions.create_index([("authorUsername", 1), ("ignored", 1)])
+            await self.mentions.create_index(
+                [("authorUsername", 1), ("account", 1), ("repliedTo", 1), ("ignored", 1), ("firstSeenAt", -1)]
+            )
 
             # Blocked users collection indexes
             await self.blocked_users.create_index("username", unique=True)
             await self.blocked_users.create_index([("blockedAt", -1)])
 
+            # Author stats collection indexes
+            await self.author_stats.create_index("username", unique=True)
+
+            # Sync state collection indexes
+            await self.sync_state.create_index("source", unique=True)
+
+            # Jobs collection indexes
+            await self.jobs.create_index("jobId", unique=True)
+            await self.jobs.create_index([("status", 1), ("createdAt", -1)])
+
             # Actions collection indexes
             await self.actions.create_index([("actionType", 1), ("performedAt", -1)])
             await self.actions.create_index("targetTweetId")
@@ -103,47 +174,60 @@ class MongoRepository:
                 logger.error(f"Error creating MongoDB indexes: {e}")
                 raise
 
+        if config.BLOCKED_USERS_WATCH:
+            self.blocked_cache.start_watching()
+
     async def close(self) -> None:
         """Close MongoDB connection."""
         logger.info("Closing MongoDB connection")
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self.blocked_cache.stop_watching()
         self.client.close()
 
     # Tweet operations
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def store_tweet(self, tweet: StoredTweet) -> StoredTweet:
         """
         Store or update a tweet in MongoDB.
 
+        Single-document form of `store_tweets_bulk` (one upsert round trip).
+
         Args:
             tweet: StoredTweet to store
 
         Returns:
-            The stored tweet (with updated timestamp)
+            The stored tweet as it is in MongoDB (an existing tweet keeps its
+            idTweet and replied state)
 
         Raises:
             Exception if storage fails
         """
-        tweet.last_updated_at = datetime.utcnow()
+        doc = await self._upsert_one(self.tweets, tweet)
+        return self._doc_to_stored_tweet(doc)
 
-        try:
-            # Try to insert (will fail if tweet_id already exists)
-            await self.tweets.insert_one(tweet.to_dict())
-            logger.debug(f"Stored new tweet: {tweet.id_tweet} ({tweet.tweet_id})")
-            return tweet
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def store_tweets_bulk(self, tweets: List[StoredTweet]) -> BulkStoreResult:
+        """
+        Upsert a batch of tweets in one unordered bulk write.
 
-        except DuplicateKeyError:
-            # Tweet already exists, update it
-            result = await self.tweets.update_one(
-                {"tweetId": tweet.tweet_id},
-                {"$set": tweet.to_dict()}
-            )
-            logger.debug(f"Updated existing tweet: {tweet.tweet_id}")
-            return tweet
+        New tweets are inserted whole; tweets already stored only get their
+        mutable fields (text, counts, ...) refreshed, so replied/ignored
+        state and idTweet are preserved.
 
-        except Exception as e:
-            logger.error(f"Error storing tweet {tweet.tweet_id}: {e}")
-            raise
+        Args:
+            tweets: StoredTweets to store
 
+        Returns:
+            BulkStoreResult with inserted vs. matched counts
+
+        Raises:
+            Exception if storage fails
+        """
+        return await self._upsert_bulk(self.tweets, tweets, "tweets")
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def get_tweet_by_id_tweet(self, id_tweet: str) -> Optional[StoredTweet]:
         """
         Retrieve tweet by internal MongoDB ID.
@@ -160,6 +244,7 @@ class MongoRepository:
 
         return self._doc_to_stored_tweet(doc)
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def get_tweet_by_twitter_id(self, tweet_id: str) -> Optional[StoredTweet]:
         """
         Retrieve tweet by Twitter's tweet ID.
@@ -176,6 +261,7 @@ class MongoRepository:
 
         return self._doc_to_stored_tweet(doc)
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def get_unanswered_tweets_from_user(
         self,
         username: str,
@@ -205,6 +291,7 @@ class MongoRepository:
         logger.info(f"Retrieved {len(tweets)} unanswered tweets from @{username}")
         return tweets
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def mark_tweet_as_replied(
         self,
         id_tweet: str,
@@ -240,6 +327,7 @@ class MongoRepository:
 
         return success
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def mark_tweet_as_ignored(
         self,
         id_tweet: str,
@@ -271,38 +359,80 @@ class MongoRepository:
 
     # Mention operations
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def store_mention(self, mention: Mention) -> Mention:
         """
         Store or update a mention in MongoDB.
 
+        Single-document form of `store_mentions_bulk` (one upsert round trip).
+
         Args:
             mention: Mention to store
 
         Returns:
-            The stored mention
+            The stored mention as it is in MongoDB (an existing mention keeps
+            its idTweet and replied/ignored state)
 
         Raises:
             Exception if storage fails
         """
-        mention.last_updated_at = datetime.utcnow()
+        await self._prepare_mentions([mention])
+        doc = await self._upsert_one(self.mentions, mention)
+        # A fresh idTweet came back only if this call inserted the mention
+        if doc["idTweet"] == mention.id_tweet:
+            await self._count_new_mentions([mention], [mention.tweet_id])
+        return self._doc_to_mention(doc)
 
-        try:
-            await self.mentions.insert_one(mention.to_dict())
-            logger.debug(f"Stored new mention: {mention.id_tweet} from @{mention.author_username}")
-            return mention
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def store_mentions_bulk(self, mentions: List[Mention]) -> BulkStoreResult:
+        """
+        Upsert a batch of mentions in one unordered bulk write.
 
-        except DuplicateKeyError:
-            result = await self.mentions.update_one(
-                {"tweetId": mention.tweet_id},
-                {"$set": mention.to_dict()}
-            )
-            logger.debug(f"Updated existing mention: {mention.tweet_id}")
-            return mention
+        New mentions from blocked users are stored already ignored, so they
+        never reach the unanswered queue. Mentions are keyed by (tweetId,
+        account): a tweet mentioning two bots is stored once per bot, each
+        copy with its own replied/ignored state.
 
-        except Exception as e:
-            logger.error(f"Error storing mention {mention.tweet_id}: {e}")
-            raise
+        Args:
+            mentions: Mentions to store (account None means the default account)
+
+        Returns:
+            BulkStoreResult with inserted vs. matched counts
 
+        Raises:
+            Exception if storage fails
+        """
+        await self._prepare_mentions(mentions)
+        result = await self._upsert_bulk(self.mentions, mentions, "mentions")
+        await self._count_new_mentions(mentions, result.inserted_tweet_ids)
+        return result
+
+    async def _prepare_mentions(self, mentions: List[Mention]) -> None:
+        """Assign mentions without an account to the default one and ignore blocked users' before storing."""
+        blocked = await self.blocked_cache.usernames()
+        now = datetime.utcnow()
+        for mention in mentions:
+            mention.account = config.resolve_account(mention.account)
+            if mention.author_username in blocked and not mention.ignored:
+                mention.ignored = True
+                mention.ignored_reason = IgnoredReason.BLOCKED_USER
+                mention.ignored_at = now
+
+    async def _count_new_mentions(self, mentions: List[Mention], inserted_tweet_ids: List[str]) -> None:
+        """Add mentions seen for the first time to their authors' stats."""
+        if not inserted_tweet_ids:
+            return
+        new_ids = set(inserted_tweet_ids)
+        increments: Dict[str, Counter] = defaultdict(Counter)
+        for mention in mentions:
+            if mention.tweet_id in new_ids:
+                new_ids.discard(mention.tweet_id)
+                increments[mention.author_username]["totalMentions"] += 1
+                if mention.ignored:
+                    increments[mention.author_username]["ignoredMentions"] += 1
+        await self._inc_author_stats(increments)
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def get_mention_by_id_tweet(self, id_tweet: str) -> Optional[Mention]:
         """
         Retrieve mention by internal MongoDB ID.
@@ -319,27 +449,34 @@ class MongoRepository:
 
         return self._doc_to_mention(doc)
 
-    async def get_mention_by_twitter_id(self, tweet_id: str) -> Optional[Mention]:
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def get_mention_by_twitter_id(self, tweet_id: str, account: Optional[str] = None) -> Optional[Mention]:
         """
         Retrieve mention by Twitter's tweet ID.
 
         Args:
             tweet_id: Twitter's tweet ID
+            account: Bot account that received the mention (any account if None)
 
         Returns:
             Mention if found, None otherwise
         """
-        doc = await self.mentions.find_one({"tweetId": tweet_id})
+        query = {"tweetId": tweet_id}
+        if account:
+            query["account"] = account
+        doc = await self.mentions.find_one(query)
         if not doc:
             return None
 
         return self._doc_to_mention(doc)
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def get_unanswered_mentions(
         self,
         limit: int = 5,
         apply_abuse_filter: bool = True,
-        username: Optional[str] = None
+        username: Optional[str] = None,
+        account: Optional[str] = None
     ) -> List[Mention]:
         """
         Get unanswered mentions with abuse prevention.
@@ -348,76 +485,145 @@ class MongoRepository:
             limit: Maximum number of mentions to return
             apply_abuse_filter: Whether to apply duplicate user filtering
             username: Optional filter to get mentions only from this specific user
+            account: Bot account whose mention queue is read (all accounts if None)
 
         Returns:
             List of Mention objects
         """
-        # Get blocked users
-        blocked_usernames = await self.get_blocked_usernames()
+        blocked_usernames = await self.blocked_cache.usernames()
 
-        # Build query
-        query = {
-            "repliedTo": False,
-            "ignored": False,
-            "authorUsername": {"$nin": blocked_usernames}
-        }
+        # Mentions from blocked users are marked ignored when the user is
+        # blocked (and on insert afterwards), so the queries need no $nin;
+        # the cache check only covers blocks made by other processes.
+        if username and username in blocked_usernames:
+            logger.warning(f"Requested user @{username} is blocked, returning empty list")
+            return []
 
-        # Add username filter if specified
-        if username:
-            # Override the $nin to specifically match this username
-            # But still check if user is blocked
-            if username in blocked_usernames:
-                logger.warning(f"Requested user @{username} is blocked, returning empty list")
-                return []
-            query["authorUsername"] = username
+        # Filtering by a specific user or without abuse filter: plain newest-first query
+        if username or not apply_abuse_filter:
+            query = {"repliedTo": False, "ignored": False}
+            if username:
+                query["authorUsername"] = username
+            if account:
+                query["account"] = account
+            cursor = self.mentions.find(query).sort("firstSeenAt", -1).limit(limit)
+            mentions = [self._doc_to_mention(doc) async for doc in cursor]
+            return [m for m in mentions if m.author_username not in blocked_usernames]
+
+        # Abuse prevention: newest mention per author, computed by MongoDB
+        groups = await self._latest_unanswered_per_author(limit, account)
+        blocked_groups = [g for g in groups if g["_id"] in blocked_usernames]
+        if blocked_groups:
+            # Blocked by another process since the last cache refresh: ignore and re-query once
+            await self._ignore_pending_mentions([group["_id"] for group in blocked_groups])
+            groups = await self._latest_unanswered_per_author(limit, account)
+            groups = [g for g in groups if g["_id"] not in blocked_usernames]
+
+        filtered_mentions = [self._doc_to_mention(group["mention"]) for group in groups]
+        duplicates = await self._duplicate_mention_ids(groups, account)
+        duplicate_count = sum(len(ids) for ids in duplicates.values())
+
+        # Ignore duplicates and block repeat offenders in a few batched round trips
+        if duplicates:
+            if config.MENTION_DUPLICATES_IN_BACKGROUND:
+                task = asyncio.ensure_future(self._process_duplicates_in_background(duplicates))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            else:
+                await self.process_duplicate_mentions(duplicates)
 
-        # Get more than needed to allow for filtering (unless filtering by specific user)
-        buffer_limit = limit if username else (limit * 3)  # Get 3x to have room for filtering
+        logger.info(
+            f"Retrieved {len(filtered_mentions)} unanswered mentions "
+            f"(filtered {duplicate_count} duplicates)"
+        )
 
-        cursor = self.mentions.find(query).sort("firstSeenAt", -1).limit(buffer_limit)
+        return filtered_mentions
 
-        all_mentions = []
-        async for doc in cursor:
-            all_mentions.append(self._doc_to_mention(doc))
+    @staticmethod
+    def unanswered_mentions_pipeline(limit: int, account: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregation returning the newest unanswered mention of up to `limit` authors.
 
-        # If filtering by specific username, skip abuse filter (all are from same user)
-        if username or not apply_abuse_filter:
-            return all_mentions[:limit]
+        Each result is {"_id": author, "mention": <newest doc>, "pending":
+        <the author's unanswered mentions>}. Groups keep a count rather than
+        the IDs, so a flooding author cannot grow one past the BSON size
+        limit. $match + $sort use the {account, repliedTo, ignored,
+        firstSeenAt} index; without an account they read every account's queue.
+        """
+        match: Dict[str, Any] = {"repliedTo": False, "ignored": False}
+        if account:
+            match["account"] = account
+        return [
+            {"$match": match},
+            {"$sort": {"firstSeenAt": -1}},
+            {"$group": {
+                "_id": "$authorUsername",
+                "mention": {"$first": "$$ROOT"},
+                "pending": {"$sum": 1}
+            }},
+            {"$sort": {"mention.firstSeenAt": -1, "_id": 1}},
+            {"$limit": limit}
+        ]
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def process_duplicate_mentions(self, duplicates: Dict[str, List[str]]) -> List[BlockedUser]:
+        """
+        Ignore duplicate mentions and block users who crossed the threshold.
 
-        # Apply abuse prevention: max 1 mention per user in result set
-        filtered_mentions = []
-        seen_users = set()
-        mentions_to_ignore = []
+        Three round trips regardless of batch size: one update_many for all
+        duplicate IDs, one aggregation counting ignored mentions per affected
+        user, and one bulk insert into blocked_users (plus one update_many
+        ignoring the newly blocked users' pending mentions).
 
-        for mention in all_mentions:
-            if len(filtered_mentions) >= limit:
-                break
+        Args:
+            duplicates: idTweets of duplicate mentions, keyed by author
 
-            mention_username = mention.author_username
+        Returns:
+            Users that were blocked by this call
+        """
+        ids = [id_tweet for id_tweets in duplicates.values() for id_tweet in id_tweets]
+        ignored = await self.mark_mentions_as_ignored(ids, IgnoredReason.DUPLICATE_USER)
+        logger.info(f"Ignored {ignored} duplicate mentions from {len(duplicates)} users")
 
-            if mention_username not in seen_users:
-                # First mention from this user - include it
-                filtered_mentions.append(mention)
-                seen_users.add(mention_username)
-            else:
-                # Duplicate from same user - mark for ignoring
-                mentions_to_ignore.append((mention.id_tweet, mention_username))
+        return await self.block_users_over_threshold(list(duplicates))
 
-        # Mark duplicates as ignored
-        for id_tweet, username in mentions_to_ignore:
-            await self.mark_mention_as_ignored(id_tweet, IgnoredReason.DUPLICATE_USER)
-            logger.info(f"Ignored duplicate mention {id_tweet} from @{username}")
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def mark_mentions_as_ignored(self, id_tweets: List[str], reason: IgnoredReason) -> int:
+        """
+        Mark many mentions as ignored with one update_many.
 
-            # Check if user should be blocked
-            await self.check_and_block_user(username)
+        Args:
+            id_tweets: Internal MongoDB UUIDs
+            reason: Reason for ignoring
 
-        logger.info(
-            f"Retrieved {len(filtered_mentions)} unanswered mentions "
-            f"(filtered {len(mentions_to_ignore)} duplicates)"
+        Returns:
+            Number of mentions that changed
+        """
+        if not id_tweets:
+            return 0
+
+        # Which mentions will flip, per author, for the ignored counters
+        query = {"idTweet": {"$in": id_tweets}, "ignored": False}
+        increments: Dict[str, Counter] = defaultdict(Counter)
+        async for doc in self.mentions.find(query, {"authorUsername": 1, "_id": 0}):
+            increments[doc["authorUsername"]]["ignoredMentions"] += 1
+
+        now = datetime.utcnow()
+        result = await self.mentions.update_many(
+            query,
+            {
+                "$set": {
+                    "ignored": True,
+                    "ignoredReason": reason.value,
+                    "ignoredAt": now,
+                    "lastUpdatedAt": now
+                }
+            }
         )
+        await self._inc_author_stats(increments)
+        return result.modified_count
 
-        return filtered_mentions
-
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def mark_mention_as_replied(
         self,
         id_tweet: str,
@@ -433,8 +639,9 @@ class MongoRepository:
         Returns:
             True if updated successfully
         """
-        result = await self.mentions.update_one(
-            {"idTweet": id_tweet},
+        # Only the first transition to replied counts towards author_stats
+        previous = await self.mentions.find_one_and_update(
+            {"idTweet": id_tweet, "repliedTo": {"$ne": True}},
             {
                 "$set": {
                     "repliedTo": True,
@@ -442,15 +649,19 @@ class MongoRepository:
                     "replyTweetId": reply_tweet_id,
                     "lastUpdatedAt": datetime.utcnow()
                 }
-            }
+            },
+            projection={"authorUsername": 1},
+            return_document=ReturnDocument.BEFORE
         )
 
-        success = result.modified_count > 0
+        success = previous is not None
         if success:
             logger.info(f"Marked mention {id_tweet} as replied")
+            await self._inc_author_stats({previous["authorUsername"]: Counter(repliedMentions=1)})
 
         return success
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def mark_mention_as_ignored(
         self,
         id_tweet: str,
@@ -466,8 +677,8 @@ class MongoRepository:
         Returns:
             True if updated successfully
         """
-        result = await self.mentions.update_one(
-            {"idTweet": id_tweet},
+        previous = await self.mentions.find_one_and_update(
+            {"idTweet": id_tweet, "ignored": {"$ne": True}},
             {
                 "$set": {
                     "ignored": True,
@@ -475,18 +686,24 @@ class MongoRepository:
                     "ignoredAt": datetime.utcnow(),
                     "lastUpdatedAt": datetime.utcnow()
                 }
-            }
+            },
+            projection={"authorUsername": 1},
+            return_document=ReturnDocument.BEFORE
         )
 
-        return result.modified_count > 0
+        if previous is None:
+            return False
+        await self._inc_author_stats({previous["authorUsername"]: Counter(ignoredMentions=1)})
+        return True
 
     # Blocked user operations
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def is_user_blocked(self, username: str) -> bool:
-        """Check if a user is blocked."""
-        doc = await self.blocked_users.find_one({"username": username})
-        return doc is not None
+        """Check if a user is blocked (served from the in-memory cache)."""
+        return await self.blocked_cache.contains(username)
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def get_blocked_usernames(self) -> List[str]:
         """Get list of all blocked usernames."""
         cursor = self.blocked_users.find({}, {"username": 1})
@@ -495,10 +712,14 @@ class MongoRepository:
             usernames.append(doc["username"])
         return usernames
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def block_user(self, blocked_user: BlockedUser) -> bool:
         """
         Block a user.
 
+        Also marks the user's pending mentions as ignored, so the unanswered
+        mentions query does not have to exclude blocked users itself.
+
         Args:
             blocked_user: BlockedUser object
 
@@ -507,13 +728,16 @@ class MongoRepository:
         """
         try:
             await self.blocked_users.insert_one(blocked_user.to_dict())
+            self.blocked_cache.add(blocked_user.username)
             logger.warning(
                 f"Blocked user @{blocked_user.username} - "
                 f"reason: {blocked_user.blocked_reason.value}"
             )
+            await self._ignore_pending_mentions([blocked_user.username])
             return True
 
         except DuplicateKeyError:
+            self.blocked_cache.add(blocked_user.username)
             logger.debug(f"User @{blocked_user.username} already blocked")
             return False
 
@@ -521,6 +745,40 @@ class MongoRepository:
             logger.error(f"Error blocking user @{blocked_user.username}: {e}")
             raise
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def block_users_over_threshold(self, usernames: List[str]) -> List[BlockedUser]:
+        """
+        Block every user in `usernames` whose ignored mentions reached the limit.
+
+        Args:
+            usernames: Candidate users (already-blocked ones are skipped)
+
+        Returns:
+            Users that were newly blocked
+        """
+        blocked_usernames = await self.blocked_cache.usernames()
+        candidates = [u for u in set(usernames) if u not in blocked_usernames]
+        if not candidates:
+            return []
+
+        cursor = self.author_stats.find({
+            "username": {"$in": candidates},
+            "ignoredMentions": {"$gte": config.MAX_IGNORED_BEFORE_BLOCK}
+        })
+        now = datetime.utcnow()
+        to_block = [
+            self._blocked_user_from_stats(self._doc_to_author_stats(doc), now)
+            async for doc in cursor
+        ]
+        if not to_block:
+            return []
+
+        newly_blocked = await self._insert_blocked_users(to_block)
+        if newly_blocked:
+            await self._ignore_pending_mentions([user.username for user in newly_blocked])
+        return newly_blocked
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def check_and_block_user(self, username: str) -> Optional[BlockedUser]:
         """
         Check if user should be blocked based on ignored mention count.
@@ -531,20 +789,12 @@ class MongoRepository:
         Returns:
             BlockedUser if user was blocked, None otherwise
         """
-        # Count ignored mentions from this user
-        ignored_count = await self.mentions.count_documents({
-            "authorUsername": username,
-            "ignored": True
-        })
+        # Read the running counter instead of recounting the user's history
+        stats = await self.get_author_stats(username)
 
-        if ignored_count >= config.MAX_IGNORED_BEFORE_BLOCK:
+        if stats and stats.ignored_mentions >= config.MAX_IGNORED_BEFORE_BLOCK:
             # Block the user
-            blocked_user = BlockedUser(
-                username=username,
-                blocked_at=datetime.utcnow(),
-                blocked_reason=BlockedReason.EXCESSIVE_MENTIONS,
-                ignored_mentions=ignored_count
-            )
+            blocked_user = self._blocked_user_from_stats(stats, datetime.utcnow())
 
             success = await self.block_user(blocked_user)
             if success:
@@ -552,8 +802,210 @@ class MongoRepository:
 
         return None
 
+    async def _ignore_pending_mentions(self, usernames: List[str]) -> int:
+        """Mark every unanswered, not-yet-ignored mention from these users as ignored."""
+        query = {"authorUsername": {"$in": usernames}, "repliedTo": False, "ignored": False}
+        increments: Dict[str, Counter] = {}
+        async for row in self.mentions.aggregate([
+            {"$match": query},
+            {"$group": {"_id": "$authorUsername", "count": {"$sum": 1}}}
+        ]):
+            increments[row["_id"]] = Counter(ignoredMentions=row["count"])
+
+        now = datetime.utcnow()
+        result = await self.mentions.update_many(
+            query,
+            {
+                "$set": {
+                    "ignored": True,
+                    "ignoredReason": IgnoredReason.BLOCKED_USER.value,
+                    "ignoredAt": now,
+                    "lastUpdatedAt": now
+                }
+            }
+        )
+        await self._inc_author_stats(increments)
+        if result.modified_count:
+            logger.info(
+                f"Ignored {result.modified_count} pending mentions from blocked users "
+                f"{', '.join('@' + u for u in usernames)}"
+            )
+        return result.modified_count
+
+    async def _insert_blocked_users(self, users: List[BlockedUser]) -> List[BlockedUser]:
+        """Insert blocked users with one unordered insert_many; returns those not blocked before."""
+        try:
+            await self.blocked_users.insert_many([user.to_dict() for user in users], ordered=False)
+            inserted = users
+        except BulkWriteError as e:
+            failed = {err["index"] for err in e.details.get("writeErrors", []) if err.get("code") == 11000}
+            other_errors = [err for err in e.details.get("writeErrors", []) if err.get("code") != 11000]
+            if other_errors:
+                logger.error(f"Error blocking users: {other_errors[0].get('errmsg')}")
+                raise
+            inserted = [user for index, user in enumerate(users) if index not in failed]
+
+        for user in users:
+            self.blocked_cache.add(user.username)
+        for user in inserted:
+            logger.warning(
+                f"Blocked user @{user.username} - reason: {user.blocked_reason.value} "
+                f"({user.ignored_mentions} ignored mentions)"
+            )
+        return inserted
+
+    async def _process_duplicates_in_background(self, duplicates: Dict[str, List[str]]) -> None:
+        """Background wrapper for process_duplicate_mentions that logs instead of raising."""
+        try:
+            await self.process_duplicate_mentions(duplicates)
+        except Exception as e:
+            logger.error(f"Background duplicate-mention processing failed: {e}")
+
+    # Author stats
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def get_author_stats(self, username: str) -> Optional[AuthorStats]:
+        """
+        Get the mention counters of one author.
+
+        Args:
+            username: Twitter username
+
+        Returns:
+            AuthorStats if the author has ever mentioned us, None otherwise
+        """
+        doc = await self.author_stats.find_one({"username": username})
+        return self._doc_to_author_stats(doc) if doc else None
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def rebuild_author_stats(self) -> int:
+        """
+        Recompute every author's counters from the mentions collection.
+
+        Runs as a single aggregation that $merges into author_stats, then
+        removes stats of authors that no longer have mentions (and saw no
+        counter update since the rebuild started). Use it to backfill after
+        upgrading or to repair drift.
+
+        Returns:
+            Number of authors whose stats were rebuilt
+        """
+        rebuilt_at = datetime.utcnow()
+        pipeline = [
+            {"$group": {
+                "_id": "$authorUsername",
+                "totalMentions": {"$sum": 1},
+                "ignoredMentions": {"$sum": {"$cond": [{"$eq": ["$ignored", True]}, 1, 0]}},
+                "repliedMentions": {"$sum": {"$cond": [{"$eq": ["$repliedTo", True]}, 1, 0]}},
+                "firstSeenAt": {"$min": "$firstSeenAt"},
+                "lastActivityAt": {"$max": "$lastUpdatedAt"}
+            }},
+            {"$project": {
+                "_id": 0,
+                "username": "$_id",
+                "totalMentions": 1,
+                "ignoredMentions": 1,
+                "repliedMentions": 1,
+                "firstSeenAt": 1,
+                "lastActivityAt": 1,
+                "rebuiltAt": {"$literal": rebuilt_at}
+            }},
+            {"$merge": {
+                "into": self.author_stats.name,
+                "on": "username",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert"
+            }}
+        ]
+        async for _ in self.mentions.aggregate(pipeline, allowDiskUse=True):
+            pass
+
+        # Counters upserted by _inc_author_stats while the $merge ran have no
+        # rebuiltAt but a later lastActivityAt; only older ones are stale
+        removed = await self.author_stats.delete_many({
+            "rebuiltAt": {"$ne": rebuilt_at},
+            "lastActivityAt": {"$lt": rebuilt_at}
+        })
+        rebuilt = await self.author_stats.count_documents({"rebuiltAt": rebuilt_at})
+        logger.info(f"Rebuilt author stats for {rebuilt} authors (removed {removed.deleted_count} stale)")
+        return rebuilt
+
+    async def _inc_author_stats(self, increments: Dict[str, Counter]) -> None:
+        """
+        Apply counter deltas with one unordered bulk of $inc upserts.
+
+        Counter updates never fail the calling operation; drift is repaired
+        by rebuild_author_stats().
+        """
+        increments = {user: counts for user, counts in increments.items() if counts}
+        if not increments:
+            return
+
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"username": username},
+                {
+                    "$inc": dict(counts),
+                    "$max": {"lastActivityAt": now},
+                    "$setOnInsert": {"firstSeenAt": now}
+                },
+                upsert=True
+            )
+            for username, counts in increments.items()
+        ]
+        try:
+            await self.author_stats.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.error(f"Failed to update author stats: {e}")
+
+    # Sync state
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def get_high_water_mark(self, source: str) -> Optional[str]:
+        """
+        Get the newest status ID already synced from a source.
+
+        Args:
+            source: Sync source key (e.g. "mentions:default")
+
+        Returns:
+            Status ID as a string, or None if the source was never synced
+        """
+        doc = await self.sync_state.find_one({"source": source}, {"highWaterId": 1})
+        if not doc or doc.get("highWaterId") is None:
+            return None
+        return str(doc["highWaterId"])
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def advance_high_water_mark(self, source: str, tweet_id: str) -> None:
+        """
+        Raise a source's high-water mark to `tweet_id` if it is newer.
+
+        The ID is stored as a 64-bit integer and updated with $max, so
+        concurrent syncs can only move the mark forward.
+
+        Args:
+            source: Sync source key
+            tweet_id: Newest status ID seen in this sync
+        """
+        try:
+            high_water_id = int(tweet_id)
+        except ValueError:
+            logger.warning(f"Not a status ID, high-water mark for {source} unchanged: {tweet_id}")
+            return
+        await self.sync_state.update_one(
+            {"source": source},
+            {
+                "$max": {"highWaterId": high_water_id},
+                "$set": {"updatedAt": datetime.utcnow()}
+            },
+            upsert=True
+        )
+
     # Action logging
 
+    @metrics.timed(MONGO_METHOD_SECONDS)
     async def log_action(self, action: Action) -> None:
         """
         Log an action to the audit trail.
@@ -569,8 +1021,200 @@ class MongoRepository:
             logger.error(f"Error logging action: {e}")
             # Don't raise - logging failure shouldn't break the operation
 
+    # Jobs
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def create_job(self, job: Job) -> None:
+        """
+        Persist a newly accepted job.
+
+        Raises:
+            Exception if storage fails (the job must not be accepted then)
+        """
+        await self.jobs.insert_one(job.to_dict())
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def save_job(self, job: Job) -> None:
+        """Write a job's current status, result and timestamps."""
+        await self.jobs.update_one(
+            {"jobId": job.job_id},
+            {
+                "$set": {
+                    "status": job.status.value,
+                    "result": job.result,
+                    "error": job.error,
+                    "errorCode": job.error_code,
+                    "startedAt": job.started_at,
+                    "finishedAt": job.finished_at
+                }
+            }
+        )
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        """
+        Get a job by its ID.
+
+        Returns:
+            Job if found, None otherwise
+        """
+        doc = await self.jobs.find_one({"jobId": job_id})
+        return self._doc_to_job(doc) if doc else None
+
+    @metrics.timed(MONGO_METHOD_SECONDS)
+    async def fail_interrupted_jobs(self) -> int:
+        """
+        Mark jobs left queued/running by a previous process as failed.
+
+        Jobs run in-process, so after a restart nothing will ever finish them.
+
+        Returns:
+            Number of jobs marked failed
+        """
+        now = datetime.utcnow()
+        result = await self.jobs.update_many(
+            {"status": {"$in": [JobStatus.QUEUED.value, JobStatus.RUNNING.value]}},
+            {
+                "$set": {
+                    "status": JobStatus.FAILED.value,
+                    "error": "Interrupted by a server restart",
+                    "errorCode": "INTERRUPTED",
+                    "finishedAt": now
+                }
+            }
+        )
+        if result.modified_count:
+            logger.warning(f"Marked {result.modified_count} interrupted jobs as failed")
+        return result.modified_count
+
     # Helper methods
 
+    async def _scope_legacy_mentions(self) -> None:
+        """
+        Assign mentions stored before per-account scoping to the default account.
+
+        Runs before the indexes are created: drops the indexes the
+        account-scoped ones replace (including the old unique tweetId index,
+        which would reject one tweet mentioning two bots) once no mention
+        lacks an account.
+        """
+        result = await self.mentions.update_many(
+            {"account": {"$exists": False}},
+            {"$set": {"account": config.resolve_account(None)}}
+        )
+        if result.modified_count:
+            logger.info(f"Assigned {result.modified_count} mentions to account '{config.resolve_account(None)}'")
+
+        existing = await self.mentions.index_information()
+        for name in SUPERSEDED_MENTION_INDEXES:
+            if name in existing:
+                await self.mentions.drop_index(name)
+                logger.info(f"Dropped superseded mentions index {name}")
+
+    async def _latest_unanswered_per_author(self, limit: int, account: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Run the per-author dedup aggregation (one round trip)."""
+        cursor = self.mentions.aggregate(self.unanswered_mentions_pipeline(limit, account), allowDiskUse=True)
+        return [group async for group in cursor]
+
+    async def _duplicate_mention_ids(
+        self,
+        groups: List[Dict[str, Any]],
+        account: Optional[str] = None
+    ) -> Dict[str, List[str]]:
+        """
+        idTweets of the other unanswered mentions of authors with more than one.
+
+        One find on the {authorUsername, account, repliedTo, ignored,
+        firstSeenAt} index, capped at MAX_DUPLICATES_PER_READ.
+        """
+        flooding = [group for group in groups if group["pending"] > 1]
+        if not flooding:
+            return {}
+
+        query = {
+            "authorUsername": {"$in": [group["_id"] for group in flooding]},
+            "repliedTo": False,
+            "ignored": False,
+            "idTweet": {"$nin": [group["mention"]["idTweet"] for group in flooding]}
+        }
+        if account:
+            query["account"] = account
+        cursor = self.mentions.find(query, {"authorUsername": 1, "idTweet": 1, "_id": 0}).limit(MAX_DUPLICATES_PER_READ)
+        duplicates: Dict[str, List[str]] = defaultdict(list)
+        async for doc in cursor:
+            duplicates[doc["authorUsername"]].append(doc["idTweet"])
+        return dict(duplicates)
+
+    async def _upsert_bulk(
+        self,
+        collection: AsyncIOMotorCollection,
+        items: List[StoredTweet],
+        label: str
+    ) -> BulkStoreResult:
+        """Upsert StoredTweets/Mentions by their key (_upsert_key) with a single unordered bulk_write."""
+        # Later duplicates in the batch win; two upserts of one key would race on the unique index
+        by_key: Dict[tuple, StoredTweet] = {}
+        for item in items:
+            by_key[tuple(self._upsert_key(item).values())] = item
+        if not by_key:
+            return BulkStoreResult()
+
+        now = datetime.utcnow()
+        tweet_ids = [item.tweet_id for item in by_key.values()]
+        operations = [
+            UpdateOne(self._upsert_key(item), self._upsert_update(item, now), upsert=True)
+            for item in by_key.values()
+        ]
+
+        try:
+            result = await collection.bulk_write(operations, ordered=False)
+            details = result.bulk_api_result
+        except BulkWriteError as e:
+            details = e.details
+            # A concurrent writer inserting the same tweetId first is harmless
+            other_errors = [err for err in details.get("writeErrors", []) if err.get("code") != 11000]
+            if other_errors:
+                logger.error(f"Error storing {label} batch: {other_errors[0].get('errmsg')}")
+                raise
+            logger.debug(f"{len(details['writeErrors'])} {label} were inserted concurrently")
+
+        upserted = details.get("upserted", [])
+        stored = BulkStoreResult(
+            inserted_count=len(upserted),
+            matched_count=details.get("nMatched", 0),
+            inserted_tweet_ids=[tweet_ids[entry["index"]] for entry in upserted]
+        )
+        logger.debug(
+            f"Stored {label} batch: {stored.inserted_count} new, {stored.matched_count} existing"
+        )
+        return stored
+
+    async def _upsert_one(self, collection: AsyncIOMotorCollection, item: StoredTweet) -> Dict[str, Any]:
+        """Upsert one StoredTweet/Mention by its key and return the document as stored."""
+        return await collection.find_one_and_update(
+            self._upsert_key(item),
+            self._upsert_update(item, datetime.utcnow()),
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+
+    @staticmethod
+    def _upsert_key(item: StoredTweet) -> Dict[str, Any]:
+        """Unique key of a stored tweet: its tweetId, plus the bot account for mentions."""
+        if isinstance(item, Mention):
+            return {"tweetId": item.tweet_id, "account": item.account}
+        return {"tweetId": item.tweet_id}
+
+    @staticmethod
+    def _upsert_update(item: StoredTweet, now: datetime) -> Dict[str, Any]:
+        """Update that inserts `item` whole, or refreshes only its mutable fields if stored."""
+        item.last_updated_at = now
+        doc = item.to_dict()
+        return {
+            "$setOnInsert": {k: v for k, v in doc.items() if k in INSERT_ONLY_FIELDS},
+            "$set": {k: v for k, v in doc.items() if k not in INSERT_ONLY_FIELDS}
+        }
+
     def _doc_to_stored_tweet(self, doc: Dict[str, Any]) -> StoredTweet:
         """Convert MongoDB document to StoredTweet."""
         return StoredTweet(
@@ -596,10 +1240,50 @@ class MongoRepository:
             last_updated_at=doc.get("lastUpdatedAt", datetime.utcnow())
         )
 
+    def _doc_to_job(self, doc: Dict[str, Any]) -> Job:
+        """Convert MongoDB document to Job."""
+        return Job(
+            action=doc["action"],
+            params=doc.get("params") or {},
+            job_id=doc["jobId"],
+            status=JobStatus(doc["status"]),
+            account=doc.get("account"),
+            result=doc.get("result"),
+            error=doc.get("error"),
+            error_code=doc.get("errorCode"),
+            created_at=doc["createdAt"],
+            started_at=doc.get("startedAt"),
+            finished_at=doc.get("finishedAt")
+        )
+
+    def _doc_to_author_stats(self, doc: Dict[str, Any]) -> AuthorStats:
+        """Convert MongoDB document to AuthorStats."""
+        return AuthorStats(
+            username=doc["username"],
+            total_mentions=doc.get("totalMentions", 0),
+            ignored_mentions=doc.get("ignoredMentions", 0),
+            replied_mentions=doc.get("repliedMentions", 0),
+            first_seen_at=doc.get("firstSeenAt"),
+            last_activity_at=doc.get("lastActivityAt")
+        )
+
+    def _blocked_user_from_stats(self, stats: AuthorStats, blocked_at: datetime) -> BlockedUser:
+        """Build an EXCESSIVE_MENTIONS block record from an author's counters."""
+        return BlockedUser(
+            username=stats.username,
+            blocked_at=blocked_at,
+            blocked_reason=BlockedReason.EXCESSIVE_MENTIONS,
+            total_mentions=stats.total_mentions,
+            ignored_mentions=stats.ignored_mentions,
+            first_seen_at=stats.first_seen_at,
+            last_activity_at=stats.last_activity_at
+        )
+
     def _doc_to_mention(self, doc: Dict[str, Any]) -> Mention:
         """Convert MongoDB document to Mention."""
         stored_tweet = self._doc_to_stored_tweet(doc)
         return Mention(
             **stored_tweet.__dict__,
-            mentioned_users=doc.get("mentionedUsers", [])
+            mentioned_users=doc.get("mentionedUsers", []),
+            account=doc.get("account")
         )
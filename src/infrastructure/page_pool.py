@@ -0,0 +1,226 @@
+"""Bounded pool of Playwright pages shared by concurrent repository calls."""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional, Set
+from playwright.async_api import BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+
+class PagePoolTimeoutError(Exception):
+    """Raised when no page could be checked out before the acquire timeout."""
+
+
+class PagePool:
+    """
+    Bounded pool of pages spread across one or more browser contexts.
+
+    Pages are created lazily up to `size`. Callers check a page out with
+    `acquire()` (or the `page()` context manager) and must hand it back with
+    `release()`. Closed or crashed pages are discarded on checkout/checkin and
+    replaced on demand, so a single broken tab never poisons the pool.
+    """
+
+    def __init__(
+        self,
+        contexts: List[BrowserContext],
+        size: int,
+        acquire_timeout: Optional[float] = None
+    ):
+        if not contexts:
+            raise ValueError("PagePool requires at least one browser context")
+        if size < 1:
+            raise ValueError("PagePool size must be at least 1")
+
+        self._contexts = contexts
+        self._size = size
+        self._acquire_timeout = acquire_timeout
+
+        self._condition = asyncio.Condition()
+        self._idle: Deque[Page] = deque()
+        self._pages: Dict[Page, BrowserContext] = {}
+        self._in_use: Set[Page] = set()
+        self._crashed: Set[Page] = set()
+        self._creating = 0
+        self._waiting = 0
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Maximum number of pages the pool will hold."""
+        return self._size
+
+    async def acquire(self, timeout: Optional[float] = None) -> Page:
+        """
+        Check out a healthy page, creating one if the pool is not full.
+
+        Args:
+            timeout: Seconds to wait for a free page (defaults to the pool timeout)
+
+        Returns:
+            A page reserved for the caller
+
+        Raises:
+            PagePoolTimeoutError: If no page became available in time
+            RuntimeError: If the pool is closed
+        """
+        timeout = self._acquire_timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        to_close: List[Page] = []
+
+        try:
+            async with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Page pool is closed")
+
+                    while self._idle:
+                        page = self._idle.popleft()
+                        if self._is_healthy(page):
+                            self._in_use.add(page)
+                            return page
+                        to_close.append(self._forget(page))
+
+                    if len(self._pages) + self._creating < self._size:
+                        self._creating += 1
+                        break
+
+                    remaining = None if deadline is None else deadline - loop.time()
+                    if remaining is not None and remaining <= 0:
+                        raise PagePoolTimeoutError(
+                            f"No browser page available after {timeout}s "
+                            f"(pool size {self._size})"
+                        )
+
+                    self._waiting += 1
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        self._waiting -= 1
+        finally:
+            await self._close_pages(to_close)
+
+        # Create the new page outside the lock so other callers are not blocked
+        try:
+            page = await self._new_page()
+        except BaseException:
+            # Cancellation included, or the reserved slot would be lost for good
+            self._creating -= 1
+            await asyncio.shield(self._notify_one())
+            raise
+
+        # No await between these, so a cancellation cannot leave the page unaccounted for
+        self._creating -= 1
+        self._in_use.add(page)
+        return page
+
+    async def release(self, page: Page) -> None:
+        """
+        Return a checked-out page to the pool.
+
+        Unhealthy pages are closed and dropped; a replacement is created the
+        next time a caller needs one.
+        """
+        to_close: List[Page] = []
+
+        async with self._condition:
+            self._in_use.discard(page)
+            if page in self._pages:
+                if self._closed or not self._is_healthy(page):
+                    to_close.append(self._forget(page))
+                else:
+                    self._idle.append(page)
+            self._condition.notify()
+
+        await self._close_pages(to_close)
+
+    @asynccontextmanager
+    async def page(self, timeout: Optional[float] = None) -> AsyncIterator[Page]:
+        """Async context manager that checks a page out and always returns it."""
+        page = await self.acquire(timeout)
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self) -> None:
+        """Close idle pages and refuse new checkouts. In-use pages close on release."""
+        async with self._condition:
+            self._closed = True
+            to_close = [self._forget(page) for page in list(self._idle)]
+            self._idle.clear()
+            self._condition.notify_all()
+
+        await self._close_pages(to_close)
+
+    async def replace_context(self, old: BrowserContext, new: BrowserContext) -> None:
+        """
+        Swap a dead context for a new one.
+
+        Pages that belonged to `old` are dropped; replacements are created in
+        `new` as callers need them. Pages still checked out are discarded
+        when they are released.
+        """
+        async with self._condition:
+            self._contexts = [new if ctx is old else ctx for ctx in self._contexts]
+            for page in [p for p, ctx in self._pages.items() if ctx is old]:
+                self._forget(page)
+            self._idle = deque(page for page in self._idle if page in self._pages)
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of pool occupancy for health checks and logging."""
+        return {
+            "size": self._size,
+            "created": len(self._pages),
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+            "waiting": self._waiting,
+            "contexts": len(self._contexts)
+        }
+
+    # Helper methods
+
+    async def _new_page(self) -> Page:
+        """Open a page in the context that currently holds the fewest pages."""
+        context = min(
+            self._contexts,
+            key=lambda ctx: sum(1 for owner in self._pages.values() if owner is ctx)
+        )
+        page = await context.new_page()
+        page.on("crash", lambda crashed_page: self._crashed.add(crashed_page))
+        self._pages[page] = context
+        logger.debug(f"Created pooled page ({len(self._pages)}/{self._size})")
+        return page
+
+    async def _notify_one(self) -> None:
+        """Wake one caller waiting for a page."""
+        async with self._condition:
+            self._condition.notify()
+
+    def _is_healthy(self, page: Page) -> bool:
+        """A page is usable if it is still open and has not crashed."""
+        return not page.is_closed() and page not in self._crashed
+
+    def _forget(self, page: Page) -> Page:
+        """Drop a page from the pool bookkeeping (caller closes it)."""
+        self._pages.pop(page, None)
+        self._crashed.discard(page)
+        logger.debug("Discarded unhealthy or retired pooled page")
+        return page
+
+    async def _close_pages(self, pages: List[Page]) -> None:
+        """Close pages that were removed from the pool, ignoring errors."""
+        for page in pages:
+            if page.is_closed():
+                continue
+            try:
+                await page.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled page: {e}")
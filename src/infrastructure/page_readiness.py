@@ -0,0 +1,206 @@
+"""Event-driven readiness waits used instead of fixed sleeps in browser flows."""
+
+import asyncio
+import itertools
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from playwright.async_api import Page, Response, TimeoutError as PlaywrightTimeoutError
+from src.config import config
+from src.infrastructure.tweet_extraction import PERMALINK_JS
+
+logger = logging.getLogger(__name__)
+
+TWEET_ARTICLE_SELECTOR = 'article[data-testid="tweet"]'
+TOAST_SELECTOR = '[data-testid="toast"]'
+
+_wait_tokens = itertools.count()
+
+# Resolves once the article count has stopped changing for `stableMs`.
+# State lives on window and is keyed by the token so consecutive waits don't collide.
+_ARTICLES_STABLE_JS = """
+([selector, minCount, stableMs, token]) => {
+    const count = document.querySelectorAll(selector).length;
+    const now = performance.now();
+    const state = window.__articleStability;
+    if (!state || state.token !== token || state.count !== count) {
+        window.__articleStability = { token, count, since: now };
+        return false;
+    }
+    return count >= minCount && now - state.since >= stableMs;
+}
+"""
+
+# True once an article the timeline harvester would read is in the DOM: one
+# never tagged, or a recycled node whose tag no longer matches its permalink.
+_UNHARVESTED_JS = "(selector) => {" + PERMALINK_JS + """
+    return Array.from(document.querySelectorAll(selector))
+        .some((article) => article.getAttribute('data-harvested') !== harvestTagOf(article));
+}"""
+
+_ENABLED_JS = """
+(selector) => {
+    const el = document.querySelector(selector);
+    return !!el && !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+}
+"""
+
+
+class GraphQLResponseWaiter:
+    """Holds the GraphQL response captured by `expect_graphql_response`."""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.response: Optional[Response] = None
+        self.payload: Optional[Dict[str, Any]] = None
+
+    @property
+    def received(self) -> bool:
+        """True if the mutation response arrived before the cap."""
+        return self.response is not None
+
+
+async def wait_for_articles_stable(
+    page: Page,
+    min_count: int = 1,
+    stable_ms: Optional[int] = None,
+    max_wait_ms: Optional[int] = None
+) -> int:
+    """
+    Wait until the number of rendered tweet articles stops changing.
+
+    Falls back silently once `max_wait_ms` elapses, so callers never wait
+    longer than the old fixed delay.
+
+    Returns:
+        The number of articles on the page when the wait ended
+    """
+    stable_ms = stable_ms if stable_ms is not None else config.READINESS_STABLE_MS
+    max_wait_ms = max_wait_ms if max_wait_ms is not None else config.READINESS_MAX_WAIT_MS
+    token = next(_wait_tokens)
+
+    try:
+        await page.wait_for_function(
+            _ARTICLES_STABLE_JS,
+            arg=[TWEET_ARTICLE_SELECTOR, min_count, stable_ms, token],
+            polling=100,
+            timeout=max_wait_ms
+        )
+    except PlaywrightTimeoutError:
+        logger.debug(f"Article count did not stabilise within {max_wait_ms}ms, continuing")
+
+    return await page.locator(TWEET_ARTICLE_SELECTOR).count()
+
+
+async def wait_for_new_articles(page: Page, max_wait_ms: Optional[int] = None) -> bool:
+    """
+    Wait until the timeline renders an article the harvester has not seen.
+
+    Used after scrolling: resolves as soon as X appends the next batch
+    instead of sleeping for a fixed interval.
+
+    Returns:
+        True if new articles appeared, False if the cap was reached
+    """
+    max_wait_ms = max_wait_ms if max_wait_ms is not None else config.READINESS_MAX_WAIT_MS
+    try:
+        await page.wait_for_function(
+            _UNHARVESTED_JS,
+            arg=TWEET_ARTICLE_SELECTOR,
+            polling=100,
+            timeout=max_wait_ms
+        )
+        return True
+    except PlaywrightTimeoutError:
+        logger.debug(f"No new articles within {max_wait_ms}ms after scrolling")
+        return False
+
+
+async def wait_for_enabled(page: Page, selector: str, max_wait_ms: Optional[int] = None) -> bool:
+    """
+    Wait until the first element matching `selector` exists and is enabled.
+
+    X marks disabled composer buttons with aria-disabled, which a plain
+    visibility wait does not catch.
+
+    Returns:
+        True if the element became enabled, False if the cap was reached
+    """
+    max_wait_ms = max_wait_ms if max_wait_ms is not None else config.READINESS_MAX_WAIT_MS
+    try:
+        await page.wait_for_function(_ENABLED_JS, arg=selector, polling=50, timeout=max_wait_ms)
+        return True
+    except PlaywrightTimeoutError:
+        logger.debug(f"{selector} not enabled within {max_wait_ms}ms, continuing")
+        return False
+
+
+async def wait_for_toast(page: Page, max_wait_ms: Optional[int] = None) -> bool:
+    """
+    Wait for X's confirmation toast ("Your post was sent", etc.).
+
+    Returns:
+        True if a toast appeared, False if the cap was reached
+    """
+    max_wait_ms = max_wait_ms if max_wait_ms is not None else config.READINESS_MAX_WAIT_MS
+    try:
+        await page.wait_for_selector(TOAST_SELECTOR, state="visible", timeout=max_wait_ms)
+        return True
+    except PlaywrightTimeoutError:
+        logger.debug(f"No confirmation toast within {max_wait_ms}ms")
+        return False
+
+
+@asynccontextmanager
+async def expect_graphql_response(
+    page: Page,
+    operation: str,
+    max_wait_ms: Optional[int] = None
+) -> AsyncIterator[GraphQLResponseWaiter]:
+    """
+    Capture the GraphQL response for `operation` triggered inside the block.
+
+    Usage:
+        async with expect_graphql_response(page, "CreateTweet") as waiter:
+            await send_button.click()
+        if waiter.received: ...
+
+    If the response does not arrive within `max_wait_ms` the block exits
+    normally and `waiter.received` is False; the caller then falls back to
+    a weaker signal such as the toast.
+    """
+    max_wait_ms = max_wait_ms if max_wait_ms is not None else config.READINESS_MAX_WAIT_MS
+    waiter = GraphQLResponseWaiter(operation)
+    received: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def on_response(response: Response) -> None:
+        url = response.url.split("?", 1)[0]
+        if "/graphql/" in url and url.endswith(f"/{operation}") and not received.done():
+            received.set_result(response)
+
+    # Listen before the caller triggers the mutation so the response can't be missed
+    page.on("response", on_response)
+    try:
+        yield waiter
+
+        try:
+            waiter.response = await asyncio.wait_for(received, timeout=max_wait_ms / 1000)
+        except asyncio.TimeoutError:
+            logger.debug(f"No {operation} response within {max_wait_ms}ms")
+            return
+
+        try:
+            waiter.payload = json.loads(await waiter.response.text())
+        except Exception as e:
+            logger.debug(f"Could not decode {operation} response: {e}")
+    finally:
+        page.remove_listener("response", on_response)
+
+
+def extract_created_tweet_id(payload: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Pull the new tweet's rest_id out of a CreateTweet mutation payload."""
+    try:
+        return payload["data"]["create_tweet"]["tweet_results"]["result"]["rest_id"]
+    except (KeyError, TypeError):
+        return None
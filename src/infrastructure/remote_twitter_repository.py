@@ -0,0 +1,152 @@
+"""ITwitterRepository proxy that forwards calls to the shared browser worker."""
+
+import copy
+import logging
+from typing import Any, Dict, List, Optional
+import httpx
+from src.domain.interfaces import ITwitterRepository, TwitterRepositoryError
+from src.domain.models import Tweet, ActionResult, TweetPostResult, ReplyResult
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+# Host part of request URLs when talking over a Unix socket (never resolved)
+UDS_BASE_URL = "http://browser-worker"
+
+
+class RemoteTwitterRepository(ITwitterRepository):
+    """
+    Twitter repository backed by a browser worker process.
+
+    The worker (run_browser_worker.py) owns the only Chromium instance; this
+    class is a thin HTTP client for it, over a Unix socket when
+    BROWSER_SERVICE_UDS is set and over local TCP otherwise.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        uds: Optional[str] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Initialize the proxy.
+
+        Args:
+            base_url: Worker URL (defaults to BROWSER_SERVICE_URL)
+            uds: Unix socket path (defaults to BROWSER_SERVICE_UDS)
+            timeout: Per-call timeout in seconds (defaults to BROWSER_SERVICE_TIMEOUT)
+        """
+        uds = uds if uds is not None else config.BROWSER_SERVICE_UDS
+        transport = httpx.AsyncHTTPTransport(uds=uds) if uds else None
+        self._client = httpx.AsyncClient(
+            base_url=UDS_BASE_URL if uds else (base_url or config.BROWSER_SERVICE_URL),
+            transport=transport,
+            timeout=timeout if timeout is not None else config.BROWSER_SERVICE_TIMEOUT
+        )
+        self._target = uds or base_url or config.BROWSER_SERVICE_URL
+        self._account: Optional[str] = None
+
+    def for_account(self, account: Optional[str]) -> 'RemoteTwitterRepository':
+        """
+        Get a proxy whose calls act as `account` on the worker.
+
+        The proxies share one HTTP connection pool; the worker validates the
+        account name and answers unknown ones with a ValueError.
+        """
+        if account == self._account:
+            return self
+        repo = copy.copy(self)
+        repo._account = account
+        return repo
+
+    async def check_health(self) -> Dict[str, Any]:
+        """
+        Ask the worker for its status.
+
+        Raises:
+            TwitterRepositoryError: If the worker cannot be reached
+        """
+        try:
+            response = await self._client.get("/health")
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise TwitterRepositoryError(
+                f"Browser worker at {self._target} is not reachable: {e}",
+                "BROWSER_SERVICE_UNAVAILABLE"
+            )
+        return response.json()
+
+    async def close(self) -> None:
+        """Close the HTTP connection pool."""
+        await self._client.aclose()
+
+    async def read_last_tweets(self, username: str, count: int) -> List[Tweet]:
+        """Read the last N tweets from a user's profile via the worker."""
+        data = await self._call("/read_last_tweets", {"username": username, "count": count})
+        return [Tweet.from_dict(item) for item in data["tweets"]]
+
+    async def reply_to_tweet(self, tweet_id: str, text: str) -> ReplyResult:
+        """Reply to a tweet via the worker."""
+        data = await self._call("/reply_to_tweet", {"tweet_id": tweet_id, "text": text})
+        return ReplyResult(**data)
+
+    async def retweet(self, tweet_id: str) -> ActionResult:
+        """Retweet a tweet via the worker."""
+        data = await self._call("/retweet", {"tweet_id": tweet_id})
+        return ActionResult(**data)
+
+    async def post_tweet(self, text: str) -> TweetPostResult:
+        """Post a new tweet via the worker."""
+        data = await self._call("/post_tweet", {"text": text})
+        return TweetPostResult(**data)
+
+    async def quote_tweet(self, tweet_id: str, text: str) -> ReplyResult:
+        """Quote a tweet via the worker."""
+        data = await self._call("/quote_tweet", {"tweet_id": tweet_id, "text": text})
+        return ReplyResult(**data)
+
+    async def read_last_mentions(self, count: int, since_id: Optional[str] = None) -> List[Tweet]:
+        """Read the last N mentions (newer than since_id) via the worker."""
+        data = await self._call("/read_last_mentions", {"count": count, "since_id": since_id})
+        return [Tweet.from_dict(item) for item in data["tweets"]]
+
+    # Helper methods
+
+    async def _call(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST one repository call and translate worker errors.
+
+        Raises:
+            TwitterRepositoryError: For repository errors or transport failures
+            ValueError: If the worker rejected the arguments
+        """
+        try:
+            response = await self._client.post(path, json={**payload, "account": self._account})
+        except httpx.TimeoutException:
+            raise TwitterRepositoryError(
+                f"Browser worker did not answer {path} in time",
+                "BROWSER_SERVICE_TIMEOUT"
+            )
+        except httpx.TransportError as e:
+            raise TwitterRepositoryError(
+                f"Browser worker at {self._target} is not reachable: {e}",
+                "BROWSER_SERVICE_UNAVAILABLE"
+            )
+
+        if response.status_code == 200:
+            return response.json()
+
+        try:
+            error = response.json()
+        except ValueError:
+            error = {}
+
+        if response.status_code in (400, 422):
+            raise ValueError(str(error.get("message") or error.get("detail") or response.text))
+
+        logger.debug(f"Browser worker returned {response.status_code} for {path}")
+        raise TwitterRepositoryError(
+            error.get("message") or f"Browser worker error ({response.status_code})",
+            error.get("error_code", "BROWSER_SERVICE_ERROR")
+        )
@@ -0,0 +1,84 @@
+"""Coalesce identical concurrent reads into one in-flight call."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent callers asking for the same thing.
+
+    Calls are keyed by operation and arguments, minus the result count:
+    a caller joins any in-flight call for its key that was started with a
+    count at least as large as its own, and receives the first `count`
+    items of that result. Only read operations whose results are ordered
+    newest first (so a prefix of a larger read equals a smaller read) may
+    be coalesced.
+
+    The shared call runs as its own task, so one caller disconnecting
+    does not cancel it for the others. Errors are delivered to every
+    caller that joined it.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, List[Tuple[int, asyncio.Task]]] = {}
+        self._shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return sum(len(calls) for calls in self._in_flight.values())
+
+    @property
+    def shared_count(self) -> int:
+        """Number of callers that were served by another caller's call."""
+        return self._shared
+
+    async def do(
+        self,
+        key: Hashable,
+        count: int,
+        fn: Callable[[int], Awaitable[List[T]]]
+    ) -> List[T]:
+        """
+        Run `fn(count)`, or join an in-flight call that covers it.
+
+        Args:
+            key: Operation name and arguments identifying the read
+            count: Number of items this caller needs
+            fn: Performs the read for a given count
+
+        Returns:
+            Up to `count` items
+        """
+        for running_count, task in self._in_flight.get(key, []):
+            if running_count >= count:
+                self._shared += 1
+                logger.debug(f"Joining in-flight {key} (count={running_count}) for count={count}")
+                result = await asyncio.shield(task)
+                return result[:count]
+
+        task = asyncio.ensure_future(fn(count))
+        entry = (count, task)
+        self._in_flight.setdefault(key, []).append(entry)
+        task.add_done_callback(lambda _: self._forget(key, entry))
+        return await asyncio.shield(task)
+
+    # Helper methods
+
+    def _forget(self, key: Hashable, entry: Tuple[int, asyncio.Task]) -> None:
+        calls = self._in_flight.get(key, [])
+        if entry in calls:
+            calls.remove(entry)
+        if not calls:
+            self._in_flight.pop(key, None)
+
+        # Nobody may be awaiting any more (every caller cancelled); don't warn about it
+        task = entry[1]
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,259 @@
+"""Cache in front of read_last_tweets with TTL and stale-while-revalidate."""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+from src.config import config
+from src.domain.interfaces import ITwitterRepository
+from src.domain.models import Tweet, TweetList, ActionResult, TweetPostResult, ReplyResult
+from src.infrastructure.action_scheduler import BACKGROUND_LANE, scheduler_lane
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedTimeline:
+    """A cached profile read: the tweets, how many were asked for, and when."""
+
+    tweets: List[Tweet]
+    count: int
+    stored_at: float  # Unix time, so the age means the same to every worker
+
+    def to_bytes(self) -> bytes:
+        return json.dumps({
+            "tweets": [tweet.to_dict() for tweet in self.tweets],
+            "count": self.count,
+            "stored_at": self.stored_at
+        }).encode()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CachedTimeline':
+        raw = json.loads(data)
+        return cls(
+            tweets=[Tweet.from_dict(item) for item in raw["tweets"]],
+            count=raw["count"],
+            stored_at=raw["stored_at"]
+        )
+
+
+class InMemoryTimelineStore:
+    """Process-local store, evicting least recently used entries past `max_bytes`."""
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    async def set(self, key: str, data: bytes, ttl_seconds: float) -> None:
+        # ttl_seconds is for stores that expire on their own; stale entries here are aged out by the LRU
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        if len(data) > self._max_bytes:
+            return
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    async def close(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self._max_bytes}
+
+
+class RedisTimelineStore:
+    """
+    Store shared by every worker through a Redis-compatible server.
+
+    Entries expire after the stale window; memory-size eviction is left to
+    the server (configure maxmemory with an allkeys-lru policy).
+    Requires the optional `redis` package.
+    """
+
+    def __init__(self, url: str, key_prefix: str = "timeline:"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError:
+            raise ValueError("TIMELINE_CACHE_BACKEND=redis requires the 'redis' package (pip install redis)")
+        self._client = redis_asyncio.from_url(url)
+        self._prefix = key_prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, data: bytes, ttl_seconds: float) -> None:
+        await self._client.set(self._prefix + key, data, px=max(1, int(ttl_seconds * 1000)))
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    def stats(self) -> Dict[str, str]:
+        return {"backend": "redis"}
+
+
+class CachingTwitterRepository(ITwitterRepository):
+    """
+    ITwitterRepository decorator that caches profile timelines.
+
+    Reads of the same profile by the same account are served from the
+    store while younger than `ttl_seconds`. Up to `stale_seconds` after
+    that, the cached list is still returned immediately and one background
+    refresh is started for the key. Older entries, or entries holding fewer
+    tweets than requested, are read through. Returned lists carry their
+    age in `TweetList.cache_age_seconds` (0 for a fresh read).
+
+    Writes and mentions go straight to the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        inner: ITwitterRepository,
+        store,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            inner: Repository that performs the reads
+            store: InMemoryTimelineStore or RedisTimelineStore
+            ttl_seconds: Age below which an entry is served as fresh
+            stale_seconds: Extra age during which an entry is served while refreshing
+        """
+        self.inner = inner
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._account: Optional[str] = None
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._counters = {"hits": 0, "stale_hits": 0, "misses": 0}
+
+    def for_account(self, account: Optional[str]) -> 'CachingTwitterRepository':
+        """Get a caching view of the wrapped repository acting as `account` (same store)."""
+        inner = self.inner.for_account(account)
+        if inner is self.inner:
+            return self
+        view = CachingTwitterRepository.__new__(CachingTwitterRepository)
+        view.__dict__.update(self.__dict__)
+        view.inner = inner
+        view._account = account
+        return view
+
+    async def read_last_tweets(self, username: str, count: int) -> List[Tweet]:
+        """Read a profile timeline, from the cache when possible."""
+        # Keyed by the resolved name, so None and the default account share entries
+        key = f"{config.resolve_account(self._account)}:{username.lower()}"
+        cached = await self._get(key)
+
+        if cached and cached.count >= count:
+            age = time.time() - cached.stored_at
+            if age < self.ttl_seconds:
+                self._counters["hits"] += 1
+                return TweetList(cached.tweets[:count], cache_age_seconds=age)
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._counters["stale_hits"] += 1
+                self._refresh_in_background(key, username, cached.count)
+                return TweetList(cached.tweets[:count], cache_age_seconds=age)
+
+        self._counters["misses"] += 1
+        tweets = await self._read_through(key, username, count)
+        return TweetList(tweets, cache_age_seconds=0.0)
+
+    async def reply_to_tweet(self, tweet_id: str, text: str) -> ReplyResult:
+        return await self.inner.reply_to_tweet(tweet_id, text)
+
+    async def retweet(self, tweet_id: str) -> ActionResult:
+        return await self.inner.retweet(tweet_id)
+
+    async def post_tweet(self, text: str) -> TweetPostResult:
+        return await self.inner.post_tweet(text)
+
+    async def quote_tweet(self, tweet_id: str, text: str) -> ReplyResult:
+        return await self.inner.quote_tweet(tweet_id, text)
+
+    async def read_last_mentions(self, count: int, since_id: Optional[str] = None) -> List[Tweet]:
+        return await self.inner.read_last_mentions(count, since_id=since_id)
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters and store usage."""
+        return {
+            **self._counters,
+            "refreshing": len(self._refreshing),
+            "store": self.store.stats()
+        }
+
+    async def close(self) -> None:
+        """Wait for background refreshes, then close the store."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.store.close()
+
+    # Helper methods
+
+    async def _get(self, key: str) -> Optional[CachedTimeline]:
+        """Load an entry; a failing or corrupt store counts as a miss."""
+        try:
+            data = await self.store.get(key)
+            return CachedTimeline.from_bytes(data) if data else None
+        except Exception as e:
+            logger.warning(f"Timeline cache read failed for {key}: {e}")
+            return None
+
+    async def _read_through(self, key: str, username: str, count: int) -> List[Tweet]:
+        tweets = await self.inner.read_last_tweets(username, count)
+        entry = CachedTimeline(tweets=list(tweets), count=count, stored_at=time.time())
+        try:
+            await self.store.set(key, entry.to_bytes(), self.ttl_seconds + self.stale_seconds)
+        except Exception as e:
+            logger.warning(f"Timeline cache write failed for {key}: {e}")
+        return tweets
+
+    def _refresh_in_background(self, key: str, username: str, count: int) -> None:
+        """Start one refresh per key; concurrent stale hits don't stack up."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh():
+            try:
+                with scheduler_lane(BACKGROUND_LANE):
+                    await self._read_through(key, username, count)
+                logger.debug(f"Refreshed cached timeline {key}")
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.ensure_future(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def create_timeline_store(backend: str, max_bytes: int, redis_url: str):
+    """
+    Build the store named by TIMELINE_CACHE_BACKEND.
+
+    Raises:
+        ValueError: For an unknown backend or a missing redis package
+    """
+    if backend == "memory":
+        return InMemoryTimelineStore(max_bytes)
+    if backend == "redis":
+        return RedisTimelineStore(redis_url)
+    raise ValueError(f"Unknown TIMELINE_CACHE_BACKEND '{backend}', expected 'memory' or 'redis'")
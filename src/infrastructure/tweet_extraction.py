@@ -0,0 +1,186 @@
+"""Bulk DOM extraction of tweet articles in as few browser round trips as possible."""
+
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from src.domain.models import Tweet
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+TWEET_ARTICLE_SELECTOR = 'article[data-testid="tweet"]'
+
+STATUS_HREF_PATTERN = re.compile(r'/([^/]+)/status/(\d+)')
+
+# Defines permalinkOf(article). Shared with the readiness wait in
+# page_readiness.py, which must agree with the harvester on what an article shows.
+PERMALINK_JS = r"""
+    const STATUS_RE = /\/[^/]+\/status\/\d+/;
+
+    // The timestamp link is the tweet's own permalink; fall back to any status link
+    const permalinkOf = (article) => {
+        const timeEl = article.querySelector('time[datetime]');
+        const timeLink = timeEl ? timeEl.closest('a[href*="/status/"]') : null;
+        if (timeLink && timeLink.getAttribute('href')) {
+            return timeLink.getAttribute('href');
+        }
+        for (const link of article.querySelectorAll('a[href*="/status/"]')) {
+            const candidate = link.getAttribute('href');
+            if (candidate && STATUS_RE.test(candidate)) {
+                return candidate;
+            }
+        }
+        return '';
+    };
+
+    // Value of data-harvested for an article once harvested ('-' without a permalink)
+    const harvestTagOf = (article) => permalinkOf(article) || '-';
+"""
+
+# Builds one compact record per article; used by the harvest script below.
+_ARTICLE_RECORD_JS = PERMALINK_JS + r"""
+    const TEXT_SELECTORS = ['[data-testid="tweetText"]', 'div[lang]', 'div[dir="auto"][lang]'];
+
+    const countFor = (article, testids) => {
+        for (const testid of testids) {
+            const el = article.querySelector(`[data-testid="${testid}"]`);
+            if (!el) continue;
+            const label = el.getAttribute('aria-label') || el.innerText || '';
+            const match = label.match(/\d[\d,]*/);
+            return match ? parseInt(match[0].replace(/,/g, ''), 10) : 0;
+        }
+        return null;
+    };
+
+    const articleRecord = (article) => {
+        let text = '';
+        for (const selector of TEXT_SELECTORS) {
+            const el = article.querySelector(selector);
+            if (el && el.innerText) {
+                text = el.innerText;
+                break;
+            }
+        }
+        if (!text) {
+            text = (article.innerText || '').split('\n')[0];
+        }
+
+        const timeEl = article.querySelector('time[datetime]');
+        const href = permalinkOf(article);
+
+        return {
+            text,
+            href,
+            datetime: timeEl ? timeEl.getAttribute('datetime') : null,
+            counts: {
+                reply: countFor(article, ['reply']),
+                retweet: countFor(article, ['retweet', 'unretweet']),
+                like: countFor(article, ['like', 'unlike'])
+            }
+        };
+    };
+"""
+
+# Runs in the page via page.evaluate(selector). Returns records only for
+# articles not harvested yet and tags every visited one (harvestTagOf), so
+# repeated calls while scrolling never re-parse an article, including
+# placeholders without a permalink. The tag stores the href because X's
+# virtualized list may recycle an article node for another tweet.
+HARVEST_ARTICLES_JS = "(selector) => {" + _ARTICLE_RECORD_JS + """
+    const fresh = [];
+    for (const article of document.querySelectorAll(selector)) {
+        const tag = harvestTagOf(article);
+        if (article.getAttribute('data-harvested') === tag) continue;
+        article.setAttribute('data-harvested', tag);
+        fresh.push(articleRecord(article));
+    }
+    return fresh;
+}"""
+
+def parse_status_href(href: str) -> Optional[tuple]:
+    """
+    Parse a status link into (username, tweet_id).
+
+    Returns:
+        Tuple of (username, tweet_id) or None if the link is not a status link
+    """
+    match = STATUS_HREF_PATTERN.search(href or "")
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
+
+def is_newer_status(tweet_id: str, since_id: Optional[str]) -> bool:
+    """
+    Check whether a status ID is newer than `since_id`.
+
+    Status IDs are snowflakes, so they grow with time; compare them as
+    integers (as strings "999" > "1000"). Always True without a since_id.
+    """
+    if not since_id:
+        return True
+    try:
+        return int(tweet_id) > int(since_id)
+    except ValueError:
+        return True
+
+
+def parse_tweet_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp from a <time datetime> attribute into naive UTC."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def build_tweet(raw: Dict[str, Any], username: str = "") -> Optional[Tweet]:
+    """
+    Build a Tweet from one record returned by HARVEST_ARTICLES_JS.
+
+    Args:
+        raw: Article record ({text, href, datetime, counts})
+        username: Profile username; when empty the author is taken from the link
+
+    Returns:
+        Tweet, or None if the record lacks text or a status ID
+    """
+    text = (raw.get("text") or "").strip()
+    parsed = parse_status_href(raw.get("href", ""))
+    if not text or not parsed:
+        return None
+
+    extracted_username, tweet_id = parsed
+    tweet_username = username or extracted_username
+    counts = raw.get("counts") or {}
+
+    return Tweet(
+        id=tweet_id,
+        text=text,
+        author_username=tweet_username,
+        url=f"{config.TWITTER_BASE_URL}/{tweet_username}/status/{tweet_id}",
+        created_at=parse_tweet_datetime(raw.get("datetime")) or datetime.now(),
+        retweet_count=counts.get("retweet"),
+        like_count=counts.get("like"),
+        reply_count=counts.get("reply")
+    )
+
+
+def build_tweets(raw_articles: List[Dict[str, Any]], count: int, username: str = "") -> List[Tweet]:
+    """Build up to `count` Tweets from article records, skipping incomplete ones."""
+    tweets = []
+    for i, raw in enumerate(raw_articles):
+        if len(tweets) >= count:
+            break
+        tweet = build_tweet(raw, username)
+        if tweet:
+            tweets.append(tweet)
+            logger.debug(f"Extracted tweet {tweet.id} from @{tweet.author_username}: {tweet.text[:80]}")
+        else:
+            logger.debug(f"Tweet {i}: Skipping - missing text or status link (href={raw.get('href')})")
+    return tweets
@@ -1,18 +1,57 @@
 """Playwright-based implementation of Twitter operations."""
 
-import logging
 import asyncio
-import re
-from typing import List, Optional
-from datetime import datetime
+import logging
+from typing import Dict, List, Optional
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from src.domain.interfaces import ITwitterRepository, TwitterRepositoryError
 from src.domain.models import Tweet, ActionResult, TweetPostResult, ReplyResult
 from src.infrastructure.browser_manager import BrowserManager
+from src.infrastructure.page_pool import PagePoolTimeoutError
+from src.infrastructure.metrics import metrics
+from src.infrastructure.graphql_timeline import (
+    MENTIONS_TIMELINE_OPERATIONS,
+    PROFILE_TIMELINE_OPERATIONS,
+    TimelineCapture
+)
+from src.infrastructure.tweet_extraction import (
+    HARVEST_ARTICLES_JS,
+    TWEET_ARTICLE_SELECTOR,
+    build_tweets,
+    is_newer_status
+)
+from src.infrastructure.page_readiness import (
+    GraphQLResponseWaiter,
+    expect_graphql_response,
+    extract_created_tweet_id,
+    wait_for_articles_stable,
+    wait_for_enabled,
+    wait_for_new_articles,
+    wait_for_toast
+)
 from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Twitter uses data-testid="tweetButton" (dialog) or "tweetButtonInline" (timeline)
+SEND_BUTTON_SELECTOR = '[data-testid="tweetButton"], [data-testid="tweetButtonInline"]'
+
+BROWSER_OPERATION_SECONDS = metrics.histogram(
+    "twitter_browser_operation_seconds",
+    "Duration of a browser repository call, page checkout included",
+    ("operation",)
+)
+BROWSER_STAGE_SECONDS = metrics.histogram(
+    "twitter_browser_stage_seconds",
+    "Duration of one stage of a browser repository call",
+    ("operation", "stage")
+)
+EXTRACTION_SECONDS = metrics.histogram(
+    "twitter_extraction_seconds",
+    "Duration of reading tweets out of the DOM (one evaluate round trip plus parsing)",
+    ("method",)
+)
+
 
 class PlaywrightTwitterRepository(ITwitterRepository):
     """
@@ -21,49 +60,74 @@ class PlaywrightTwitterRepository(ITwitterRepository):
     Uses web scraping and DOM manipulation to interact with Twitter.
     """
 
-    def __init__(self, browser_manager: BrowserManager):
+    def __init__(self, browser_manager: BrowserManager, account: Optional[str] = None):
         self.browser_manager = browser_manager
+        self.account = browser_manager.resolve_account(account)
         self._timeout = config.BROWSER_TIMEOUT
+        self._action_timeout = config.BROWSER_ACTION_TIMEOUT
+        self._account_repos: Dict[str, 'PlaywrightTwitterRepository'] = {self.account: self}
+
+    def for_account(self, account: Optional[str]) -> 'PlaywrightTwitterRepository':
+        """
+        Get the repository acting as `account` (pages come from that account's pool).
 
+        Raises:
+            ValueError: If the account is not configured
+        """
+        account = self.browser_manager.resolve_account(account)
+        repo = self._account_repos.get(account)
+        if repo is None:
+            repo = PlaywrightTwitterRepository(self.browser_manager, account)
+            repo._account_repos = self._account_repos
+            self._account_repos[account] = repo
+        return repo
+
+    @metrics.timed(BROWSER_OPERATION_SECONDS)
     async def read_last_tweets(self, username: str, count: int) -> List[Tweet]:
         """
         Read the last N tweets from a user's profile.
 
         This implementation:
-        1. Navigates to the user's profile
-        2. Waits for tweets to appear
-        3. Scrolls to load more if needed
-        4. Extracts tweet data from the DOM
+        1. Listens for UserTweets GraphQL responses (network capture mode)
+        2. Navigates to the user's profile
+        3. Waits for tweets to appear
+        4. Reads tweets from the captured JSON, scrolling to fetch more pages
+        5. Falls back to harvesting the DOM when no payload was captured
         """
         logger.info(f"Reading last {count} tweets from @{username}")
 
-        page = self.browser_manager.get_page()
+        with BROWSER_STAGE_SECONDS.time("read_last_tweets", "acquire_page"):
+            page = await self._acquire_page()
         url = f"{config.TWITTER_BASE_URL}/{username}"
+        capture = self._attach_capture(page, PROFILE_TIMELINE_OPERATIONS)
 
         try:
             # Navigate to user profile
             logger.debug(f"Navigating to {url}")
-            await page.goto(url, wait_until="domcontentloaded", timeout=self._timeout)
+            with BROWSER_STAGE_SECONDS.time("read_last_tweets", "goto"):
+                await page.goto(url, wait_until="domcontentloaded", timeout=self._timeout)
 
             # Wait for tweets container to appear
             # Twitter's timeline uses this selector
             try:
-                await page.wait_for_selector('article[data-testid="tweet"]', timeout=10000)
+                with BROWSER_STAGE_SECONDS.time("read_last_tweets", "wait_for_tweets"):
+                    await page.wait_for_selector('article[data-testid="tweet"]', timeout=10000)
                 logger.debug("Tweet container found")
             except PlaywrightTimeoutError:
                 logger.warning("No tweets found on page - user may have no tweets or page structure changed")
                 return []
 
-            # Give additional time for initial tweets to render
-            await asyncio.sleep(3)
-
-            # Scroll down a bit to trigger loading more tweets
-            for _ in range(2):
-                await page.evaluate("window.scrollBy(0, 500)")
-                await asyncio.sleep(1)
+            # Prefer the captured UserTweets payloads; fall back to the DOM
+            with BROWSER_STAGE_SECONDS.time("read_last_tweets", "capture"):
+                tweets = await self._collect_from_capture(page, capture, count)
+            if tweets is None:
+                # Wait for the initial tweets to finish rendering
+                with BROWSER_STAGE_SECONDS.time("read_last_tweets", "settle"):
+                    await wait_for_articles_stable(page, min_count=min(count, 3))
 
-            # Extract tweets from the page
-            tweets = await self._extract_tweets_from_page(page, count, username)
+                # Scroll and harvest until we have `count` tweets or the timeline ends
+                with BROWSER_STAGE_SECONDS.time("read_last_tweets", "harvest"):
+                    tweets = await self._harvest_timeline(page, count, username)
 
             logger.info(f"Successfully extracted {len(tweets)} tweets from @{username}")
             return tweets
@@ -80,7 +144,12 @@ class PlaywrightTwitterRepository(ITwitterRepository):
                 f"Failed to read tweets: {str(e)}",
                 error_code="READ_FAILED"
             )
+        finally:
+            if capture:
+                capture.detach()
+            await self.browser_manager.release_page(page)
 
+    @metrics.timed(BROWSER_OPERATION_SECONDS)
     async def reply_to_tweet(self, tweet_id: str, text: str) -> ReplyResult:
         """
         Reply to a tweet by navigating to it and using the reply button.
@@ -93,39 +162,39 @@ class PlaywrightTwitterRepository(ITwitterRepository):
         """
         logger.info(f"Replying to tweet {tweet_id}")
 
-        page = self.browser_manager.get_page()
+        with BROWSER_STAGE_SECONDS.time("reply_to_tweet", "acquire_page"):
+            page = await self._acquire_page()
         tweet_url = f"{config.TWITTER_BASE_URL}/i/status/{tweet_id}"
 
         try:
             # Navigate to tweet
             logger.debug(f"Navigating to tweet: {tweet_url}")
-            await page.goto(tweet_url, wait_until="domcontentloaded", timeout=self._timeout)
-            await asyncio.sleep(2)
+            with BROWSER_STAGE_SECONDS.time("reply_to_tweet", "goto"):
+                await page.goto(tweet_url, wait_until="domcontentloaded", timeout=self._timeout)
 
-            # Find and click reply button
+            # Find and click reply button (click auto-waits for it to render)
             # Twitter uses data-testid="reply" for reply buttons
             reply_button = page.locator('[data-testid="reply"]').first
-            await reply_button.click(timeout=5000)
+            await reply_button.click(timeout=self._action_timeout)
             logger.debug("Clicked reply button")
 
-            await asyncio.sleep(1)
-
             # Find the tweet composer and type the reply
             # Twitter uses data-testid="tweetTextarea_0" for the main composer
             composer = page.locator('[data-testid="tweetTextarea_0"]').first
-            await composer.fill(text)
+            await composer.fill(text, timeout=self._action_timeout)
             logger.debug("Filled reply text")
 
-            await asyncio.sleep(0.5)
-
-            # Click the reply submit button
+            # Click the reply submit button once the composer enables it
             # Twitter uses data-testid="tweetButton" or "tweetButtonInline"
-            send_button = page.locator('[data-testid="tweetButton"], [data-testid="tweetButtonInline"]').first
-            await send_button.click(timeout=5000)
-            logger.debug("Clicked send button")
+            await wait_for_enabled(page, SEND_BUTTON_SELECTOR)
+            send_button = page.locator(SEND_BUTTON_SELECTOR).first
+            async with expect_graphql_response(page, "CreateTweet") as waiter:
+                await send_button.click(timeout=self._action_timeout)
+                logger.debug("Clicked send button")
 
             # Wait for the reply to be posted
-            await asyncio.sleep(2)
+            with BROWSER_STAGE_SECONDS.time("reply_to_tweet", "confirm"):
+                reply_tweet_id = await self._confirm_posted(page, waiter, "REPLY_FAILED")
 
             logger.info(f"Successfully replied to tweet {tweet_id}")
 
@@ -133,6 +202,8 @@ class PlaywrightTwitterRepository(ITwitterRepository):
                 success=True,
                 message=f"Successfully replied to tweet {tweet_id}",
                 original_tweet_id=tweet_id,
+                reply_tweet_id=reply_tweet_id,
+                reply_url=self._status_url(reply_tweet_id),
                 data={"reply_text": text}
             )
 
@@ -142,13 +213,19 @@ class PlaywrightTwitterRepository(ITwitterRepository):
                 f"Timeout replying to tweet {tweet_id}",
                 error_code="TIMEOUT"
             )
+        except TwitterRepositoryError as e:
+            logger.error(f"Reply to tweet {tweet_id} failed: {e.message}")
+            raise
         except Exception as e:
             logger.error(f"Error replying to tweet {tweet_id}: {e}")
             raise TwitterRepositoryError(
                 f"Failed to reply: {str(e)}",
                 error_code="REPLY_FAILED"
             )
+        finally:
+            await self.browser_manager.release_page(page)
 
+    @metrics.timed(BROWSER_OPERATION_SECONDS)
     async def retweet(self, tweet_id: str) -> ActionResult:
         """
         Retweet a tweet.
@@ -160,30 +237,33 @@ class PlaywrightTwitterRepository(ITwitterRepository):
         """
         logger.info(f"Retweeting tweet {tweet_id}")
 
-        page = self.browser_manager.get_page()
+        with BROWSER_STAGE_SECONDS.time("retweet", "acquire_page"):
+            page = await self._acquire_page()
         tweet_url = f"{config.TWITTER_BASE_URL}/i/status/{tweet_id}"
 
         try:
             # Navigate to tweet
             logger.debug(f"Navigating to tweet: {tweet_url}")
-            await page.goto(tweet_url, wait_until="domcontentloaded", timeout=self._timeout)
-            await asyncio.sleep(2)
+            with BROWSER_STAGE_SECONDS.time("retweet", "goto"):
+                await page.goto(tweet_url, wait_until="domcontentloaded", timeout=self._timeout)
 
-            # Find and click retweet button
+            # Find and click retweet button (click auto-waits for it to render)
             # Twitter uses data-testid="retweet" for retweet buttons
             retweet_button = page.locator('[data-testid="retweet"]').first
-            await retweet_button.click(timeout=5000)
+            await retweet_button.click(timeout=self._action_timeout)
             logger.debug("Clicked retweet button")
 
-            await asyncio.sleep(0.5)
-
             # Confirm retweet in the popup menu
             # Twitter shows a menu with data-testid="retweetConfirm"
             confirm_button = page.locator('[data-testid="retweetConfirm"]').first
-            await confirm_button.click(timeout=5000)
-            logger.debug("Clicked confirm button")
+            async with expect_graphql_response(page, "CreateRetweet") as waiter:
+                await confirm_button.click(timeout=self._action_timeout)
+                logger.debug("Clicked confirm button")
 
-            await asyncio.sleep(1)
+            if not waiter.received:
+                # Fall back to the button flipping to its "unretweet" state
+                with BROWSER_STAGE_SECONDS.time("retweet", "confirm"):
+                    await wait_for_enabled(page, '[data-testid="unretweet"]')
 
             logger.info(f"Successfully retweeted tweet {tweet_id}")
 
@@ -205,7 +285,10 @@ class PlaywrightTwitterRepository(ITwitterRepository):
                 f"Failed to retweet: {str(e)}",
                 error_code="RETWEET_FAILED"
             )
+        finally:
+            await self.browser_manager.release_page(page)
 
+    @metrics.timed(BROWSER_OPERATION_SECONDS)
     async def post_tweet(self, text: str) -> TweetPostResult:
         """
         Post a new tweet.
@@ -218,37 +301,41 @@ class PlaywrightTwitterRepository(ITwitterRepository):
         """
         logger.info("Posting new tweet")
 
-        page = self.browser_manager.get_page()
+        with BROWSER_STAGE_SECONDS.time("post_tweet", "acquire_page"):
+            page = await self._acquire_page()
 
         try:
             # Navigate to home to ensure we're in the right place
             logger.debug(f"Navigating to {config.TWITTER_BASE_URL}/home")
-            await page.goto(f"{config.TWITTER_BASE_URL}/home", wait_until="domcontentloaded", timeout=self._timeout)
-            await asyncio.sleep(2)
+            with BROWSER_STAGE_SECONDS.time("post_tweet", "goto"):
+                await page.goto(f"{config.TWITTER_BASE_URL}/home", wait_until="domcontentloaded", timeout=self._timeout)
 
             # Find the tweet composer (main one on the home page)
             # Twitter uses data-testid="tweetTextarea_0" for the main composer
             composer = page.locator('[data-testid="tweetTextarea_0"]').first
-            await composer.click(timeout=5000)
-            await composer.fill(text)
+            await composer.click(timeout=self._action_timeout)
+            await composer.fill(text, timeout=self._action_timeout)
             logger.debug("Filled tweet text")
 
-            await asyncio.sleep(0.5)
-
-            # Click the post button
+            # Click the post button once the composer enables it
             # Twitter uses data-testid="tweetButtonInline" or "tweetButton"
-            post_button = page.locator('[data-testid="tweetButton"], [data-testid="tweetButtonInline"]').first
-            await post_button.click(timeout=5000)
-            logger.debug("Clicked post button")
+            await wait_for_enabled(page, SEND_BUTTON_SELECTOR)
+            post_button = page.locator(SEND_BUTTON_SELECTOR).first
+            async with expect_graphql_response(page, "CreateTweet") as waiter:
+                await post_button.click(timeout=self._action_timeout)
+                logger.debug("Clicked post button")
 
             # Wait for tweet to be posted
-            await asyncio.sleep(2)
+            with BROWSER_STAGE_SECONDS.time("post_tweet", "confirm"):
+                new_tweet_id = await self._confirm_posted(page, waiter, "POST_FAILED")
 
             logger.info("Successfully posted tweet")
 
             return TweetPostResult(
                 success=True,
                 message="Successfully posted tweet",
+                tweet_id=new_tweet_id,
+                tweet_url=self._status_url(new_tweet_id),
                 data={"tweet_text": text}
             )
 
@@ -258,13 +345,19 @@ class PlaywrightTwitterRepository(ITwitterRepository):
                 "Timeout posting tweet",
                 error_code="TIMEOUT"
             )
+        except TwitterRepositoryError as e:
+            logger.error(f"Posting tweet failed: {e.message}")
+            raise
         except Exception as e:
             logger.error(f"Error posting tweet: {e}")
             raise TwitterRepositoryError(
                 f"Failed to post tweet: {str(e)}",
                 error_code="POST_FAILED"
             )
+        finally:
+            await self.browser_manager.release_page(page)
 
+    @metrics.timed(BROWSER_OPERATION_SECONDS)
     async def quote_tweet(self, tweet_id: str, text: str) -> ReplyResult:
         """
         Quote tweet (retweet with comment).
@@ -278,47 +371,45 @@ class PlaywrightTwitterRepository(ITwitterRepository):
         """
         logger.info(f"Quote tweeting {tweet_id}")
 
-        page = self.browser_manager.get_page()
+        with BROWSER_STAGE_SECONDS.time("quote_tweet", "acquire_page"):
+            page = await self._acquire_page()
 
         try:
             # Navigate to the tweet
             tweet_url = f"{config.TWITTER_BASE_URL}/i/status/{tweet_id}"
             logger.debug(f"Navigating to {tweet_url}")
-            await page.goto(tweet_url, wait_until="domcontentloaded", timeout=self._timeout)
-            await asyncio.sleep(2)
+            with BROWSER_STAGE_SECONDS.time("quote_tweet", "goto"):
+                await page.goto(tweet_url, wait_until="domcontentloaded", timeout=self._timeout)
 
-            # Find and click the retweet button
+            # Find and click the retweet button (click auto-waits for it to render)
             # Twitter uses data-testid="retweet" for the retweet button
             retweet_button = page.locator('[data-testid="retweet"]').first
-            await retweet_button.click(timeout=5000)
+            await retweet_button.click(timeout=self._action_timeout)
             logger.debug("Clicked retweet button")
 
-            await asyncio.sleep(0.5)
-
             # Click the "Quote" option from the menu
             # Twitter shows a menu with "Retweet" and "Quote" options
             quote_option = page.locator('[data-testid="Dropdown"] [role="menuitem"]').filter(has_text="Quote").first
-            await quote_option.click(timeout=5000)
+            await quote_option.click(timeout=self._action_timeout)
             logger.debug("Clicked quote option")
 
-            await asyncio.sleep(1)
-
             # Find the quote tweet composer
             # After clicking quote, a compose dialog appears with the quoted tweet embedded
             composer = page.locator('[data-testid="tweetTextarea_0"]').first
-            await composer.click(timeout=5000)
-            await composer.fill(text)
+            await composer.click(timeout=self._action_timeout)
+            await composer.fill(text, timeout=self._action_timeout)
             logger.debug("Filled quote text")
 
-            await asyncio.sleep(0.5)
-
-            # Click the post button
+            # Click the post button once the composer enables it
+            await wait_for_enabled(page, '[data-testid="tweetButton"]')
             post_button = page.locator('[data-testid="tweetButton"]').first
-            await post_button.click(timeout=5000)
-            logger.debug("Clicked post button")
+            async with expect_graphql_response(page, "CreateTweet") as waiter:
+                await post_button.click(timeout=self._action_timeout)
+                logger.debug("Clicked post button")
 
             # Wait for quote tweet to be posted
-            await asyncio.sleep(2)
+            with BROWSER_STAGE_SECONDS.time("quote_tweet", "confirm"):
+                quote_tweet_id = await self._confirm_posted(page, waiter, "QUOTE_FAILED")
 
             logger.info(f"Successfully quote tweeted {tweet_id}")
 
@@ -326,6 +417,8 @@ class PlaywrightTwitterRepository(ITwitterRepository):
                 success=True,
                 message=f"Successfully quote tweeted {tweet_id}",
                 original_tweet_id=tweet_id,
+                reply_tweet_id=quote_tweet_id,
+                reply_url=self._status_url(quote_tweet_id),
                 data={"quote_text": text}
             )
 
@@ -335,58 +428,74 @@ class PlaywrightTwitterRepository(ITwitterRepository):
                 f"Timeout quote tweeting {tweet_id}",
                 error_code="TIMEOUT"
             )
+        except TwitterRepositoryError as e:
+            logger.error(f"Quote of tweet {tweet_id} failed: {e.message}")
+            raise
         except Exception as e:
             logger.error(f"Error quote tweeting {tweet_id}: {e}")
             raise TwitterRepositoryError(
                 f"Failed to quote tweet {tweet_id}: {str(e)}",
                 error_code="QUOTE_FAILED"
             )
+        finally:
+            await self.browser_manager.release_page(page)
 
-    async def read_last_mentions(self, count: int) -> List[Tweet]:
+    @metrics.timed(BROWSER_OPERATION_SECONDS)
+    async def read_last_mentions(self, count: int, since_id: Optional[str] = None) -> List[Tweet]:
         """
         Read the last N mentions of the authenticated account.
 
         This implementation:
-        1. Navigates to notifications/mentions
-        2. Waits for mentions to load
-        3. Extracts mention data from the DOM
-        4. Parses mentioned users from tweet text
+        1. Listens for mentions timeline responses (network capture mode)
+        2. Navigates to notifications/mentions
+        3. Waits for mentions to load
+        4. Reads mentions from the captured JSON, or harvests them from the
+           DOM when no payload was captured, stopping at `since_id`
 
         Args:
             count: Number of mentions to retrieve
+            since_id: Only return mentions newer than this status ID
 
         Returns:
             List of Tweet objects representing mentions
         """
-        logger.info(f"Reading last {count} mentions")
+        if since_id:
+            logger.info(f"Reading up to {count} mentions newer than {since_id}")
+        else:
+            logger.info(f"Reading last {count} mentions")
 
-        page = self.browser_manager.get_page()
+        with BROWSER_STAGE_SECONDS.time("read_last_mentions", "acquire_page"):
+            page = await self._acquire_page()
         url = f"{config.TWITTER_BASE_URL}/notifications/mentions"
+        capture = self._attach_capture(page, MENTIONS_TIMELINE_OPERATIONS, include_legacy_mentions=True)
 
         try:
             # Navigate to mentions
             logger.debug(f"Navigating to {url}")
-            await page.goto(url, wait_until="domcontentloaded", timeout=self._timeout)
+            with BROWSER_STAGE_SECONDS.time("read_last_mentions", "goto"):
+                await page.goto(url, wait_until="domcontentloaded", timeout=self._timeout)
 
             # Wait for tweet elements to appear
             try:
-                await page.wait_for_selector('article[data-testid="tweet"]', timeout=10000)
+                with BROWSER_STAGE_SECONDS.time("read_last_mentions", "wait_for_tweets"):
+                    await page.wait_for_selector('article[data-testid="tweet"]', timeout=10000)
                 logger.debug("Mention tweets found")
             except PlaywrightTimeoutError:
                 logger.warning("No mentions found on page")
                 return []
 
-            # Give time for rendering
-            await asyncio.sleep(3)
+            # Prefer the captured mentions payloads; fall back to the DOM
+            with BROWSER_STAGE_SECONDS.time("read_last_mentions", "capture"):
+                mentions = await self._collect_from_capture(page, capture, count, since_id)
+            if mentions is None:
+                # Wait for the initial mentions to finish rendering
+                with BROWSER_STAGE_SECONDS.time("read_last_mentions", "settle"):
+                    await wait_for_articles_stable(page, min_count=min(count, 3))
 
-            # Scroll to trigger loading
-            for _ in range(2):
-                await page.evaluate("window.scrollBy(0, 500)")
-                await asyncio.sleep(1)
-
-            # Extract mentions from the page
-            # Note: username is not used for mentions, we extract from tweet
-            mentions = await self._extract_tweets_from_page(page, count, "")
+                # Scroll and harvest until we have `count` mentions or the timeline ends
+                # Note: username is not used for mentions, we extract from tweet
+                with BROWSER_STAGE_SECONDS.time("read_last_mentions", "harvest"):
+                    mentions = await self._harvest_timeline(page, count, "", since_id)
 
             logger.info(f"Successfully extracted {len(mentions)} mentions")
             return mentions
@@ -403,106 +512,194 @@ class PlaywrightTwitterRepository(ITwitterRepository):
                 f"Failed to read mentions: {str(e)}",
                 error_code="READ_FAILED"
             )
+        finally:
+            if capture:
+                capture.detach()
+            await self.browser_manager.release_page(page)
 
-    async def _extract_tweets_from_page(self, page: Page, count: int, username: str) -> List[Tweet]:
+    async def _acquire_page(self) -> Page:
         """
-        Extract tweet data from the loaded page.
+        Check a page out of the browser pool for the duration of one operation.
 
-        This implementation:
-        - Finds all tweet article elements
-        - Extracts text content and metadata
-        - Handles various tweet formats
-        - Returns structured Tweet objects
+        Raises:
+            TwitterRepositoryError: If every pooled page stays busy past the timeout
         """
-        tweets = []
-
         try:
-            # Twitter uses article[data-testid="tweet"] for tweet containers
-            tweet_elements = await page.locator('article[data-testid="tweet"]').all()
-
-            logger.debug(f"Found {len(tweet_elements)} tweet elements on page")
-
-            if len(tweet_elements) == 0:
-                logger.warning("No tweet elements found - page structure may have changed")
-                # Save screenshot for debugging if needed
-                try:
-                    await page.screenshot(path="debug_no_tweets.png")
-                    logger.debug("Screenshot saved to debug_no_tweets.png")
-                except:
-                    pass
-
-            for i, element in enumerate(tweet_elements[:count]):
-                try:
-                    # Extract tweet text - Twitter uses div[data-testid="tweetText"] or [lang] attribute
-                    text = ""
-
-                    # Try multiple selectors for tweet text
-                    text_selectors = [
-                        '[data-testid="tweetText"]',
-                        'div[lang]',  # Tweet text often has lang attribute
-                        'div[dir="auto"][lang]'
-                    ]
-
-                    for selector in text_selectors:
-                        text_element = element.locator(selector).first
-                        if await text_element.count() > 0:
-                            text = await text_element.inner_text()
-                            if text:
-                                break
-
-                    if not text:
-                        logger.debug(f"Tweet {i}: No text found, trying alternative extraction")
-                        # Fallback: get all text content
-                        text = await element.inner_text()
-                        # Clean up the text (remove timestamps, etc.)
-                        text = text.split('\n')[0] if text else ""
-
-                    # Extract tweet link to get ID and author
-                    # Links in tweets have format /username/status/TWEET_ID
-                    tweet_id = ""
-                    tweet_username = username  # Use provided username or extract
-                    href = ""
-
-                    # Try to find the status link
-                    link_elements = await element.locator('a[href*="/status/"]').all()
-
-                    for link in link_elements:
-                        href = await link.get_attribute("href")
-                        if href:
-                            # Extract both username and tweet ID from URL
-                            match = re.search(r'/([^/]+)/status/(\d+)', href)
-                            if match:
-                                extracted_username = match.group(1)
-                                tweet_id = match.group(2)
-
-                                # Use extracted username if none was provided
-                                if not username:
-                                    tweet_username = extracted_username
-                                break
-
-                    # Log what we found
-                    logger.debug(f"Tweet {i}: text_length={len(text)}, id={tweet_id}, username={tweet_username}, href={href}")
-
-                    # Only add tweet if we have both text and ID
-                    if text and tweet_id and tweet_username:
-                        tweet = Tweet(
-                            id=tweet_id,
-                            text=text.strip(),
-                            author_username=tweet_username,
-                            url=f"{config.TWITTER_BASE_URL}/{tweet_username}/status/{tweet_id}",
-                            created_at=datetime.now()  # Placeholder - would need proper parsing
-                        )
-                        tweets.append(tweet)
-                        logger.info(f"Extracted tweet {tweet_id} from @{tweet_username}: {text[:80]}...")
-                    else:
-                        logger.warning(f"Tweet {i}: Skipping - missing text={not text} or id={not tweet_id} or username={not tweet_username}")
-
-                except Exception as e:
-                    logger.warning(f"Failed to extract tweet {i}: {e}", exc_info=True)
-                    continue
+            return await self.browser_manager.acquire_page(self.account)
+        except PagePoolTimeoutError as e:
+            logger.error(f"No browser page available: {e}")
+            raise TwitterRepositoryError(
+                "Browser is busy, no page available",
+                error_code="BROWSER_BUSY"
+            )
 
-        except Exception as e:
-            logger.error(f"Error extracting tweets from page: {e}", exc_info=True)
+    async def _confirm_posted(self, page: Page, waiter: GraphQLResponseWaiter, error_code: str) -> Optional[str]:
+        """
+        Confirm a tweet was created and return its ID when X reports one.
+
+        Prefers the CreateTweet mutation response; falls back to the toast
+        when the response was not observed within the readiness cap.
+
+        Raises:
+            TwitterRepositoryError: With `error_code` if X answered with an
+                error (duplicate, rate limit, suspension, ...) or neither the
+                response nor the toast confirmed the tweet
+        """
+        if waiter.received:
+            payload = waiter.payload if isinstance(waiter.payload, dict) else {}
+            errors = payload.get("errors")
+            if errors or not waiter.response.ok:
+                first = errors[0] if errors else {}
+                message = first.get("message") if isinstance(first, dict) else str(first)
+                raise TwitterRepositoryError(
+                    f"X rejected the tweet: {message or f'HTTP {waiter.response.status}'}",
+                    error_code=error_code
+                )
+            return extract_created_tweet_id(payload)
+
+        if not await wait_for_toast(page):
+            raise TwitterRepositoryError(
+                "X did not confirm the tweet (no CreateTweet response or toast); it may still have been posted",
+                error_code=error_code
+            )
+        return None
+
+    def _status_url(self, tweet_id: Optional[str]) -> Optional[str]:
+        """Build a status URL for a tweet ID, if one is known."""
+        if not tweet_id:
+            return None
+        return f"{config.TWITTER_BASE_URL}/i/status/{tweet_id}"
+
+    def _attach_capture(
+        self,
+        page: Page,
+        operations: tuple,
+        include_legacy_mentions: bool = False
+    ) -> Optional[TimelineCapture]:
+        """Start capturing timeline responses when TWITTER_CAPTURE_MODE is "network"."""
+        if config.TWITTER_CAPTURE_MODE != "network":
+            return None
+        capture = TimelineCapture(page, operations, include_legacy_mentions)
+        capture.attach()
+        return capture
+
+    async def _collect_from_capture(
+        self,
+        page: Page,
+        capture: Optional[TimelineCapture],
+        count: int,
+        since_id: Optional[str] = None
+    ) -> Optional[List[Tweet]]:
+        """
+        Collect tweets from captured timeline payloads.
 
-        logger.info(f"Successfully extracted {len(tweets)} out of requested {count} tweets")
+        Scrolls to make X request the next page of the timeline and reads
+        the JSON instead of the DOM, which gives real timestamps, IDs and
+        engagement counts. With `since_id`, stops once a captured page
+        reaches that status and drops everything not newer than it.
+
+        Returns:
+            Up to `count` tweets, or None if no payload was captured (the
+            caller then falls back to DOM harvesting)
+        """
+        if capture is None:
+            return None
+
+        if not await capture.wait_for_payload():
+            logger.info("No timeline payload captured, falling back to DOM extraction")
+            return None
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.TIMELINE_TIME_BUDGET_SECONDS
+        idle_rounds = 0
+
+        while len(capture.tweets) < count:
+            if self._reached_known(capture.tweets, since_id):
+                logger.debug(f"Reached known status {since_id}, not scrolling further")
+                break
+            if loop.time() >= deadline:
+                logger.warning(
+                    f"Timeline time budget exhausted with {len(capture.tweets)}/{count} tweets"
+                )
+                break
+
+            payloads_before = capture.payload_count
+            tweets_before = len(capture.tweets)
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await capture.wait_for_payload(after=payloads_before)
+
+            idle_rounds = 0 if len(capture.tweets) > tweets_before else idle_rounds + 1
+            if idle_rounds >= config.TIMELINE_MAX_IDLE_SCROLLS:
+                break
+
+        tweets = [tweet for tweet in capture.tweets if is_newer_status(tweet.id, since_id)][:count]
+        logger.info(
+            f"Collected {len(tweets)} out of requested {count} tweets "
+            f"from {capture.payload_count} timeline payloads"
+        )
+        return tweets
+
+    async def _harvest_timeline(
+        self,
+        page: Page,
+        count: int,
+        username: str,
+        since_id: Optional[str] = None
+    ) -> List[Tweet]:
+        """
+        Incrementally collect tweets from a virtualized timeline.
+
+        Each round harvests only articles not seen before (one evaluate per
+        round), keys them by status ID, then scrolls a viewport and waits for
+        X to render the next batch. Stops when `count` unique tweets are
+        collected, when a round reaches `since_id` (everything below it is
+        already stored), after TIMELINE_MAX_IDLE_SCROLLS rounds without new
+        tweets, or when TIMELINE_TIME_BUDGET_SECONDS is spent.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.TIMELINE_TIME_BUDGET_SECONDS
+        collected: Dict[str, Tweet] = {}
+        idle_rounds = 0
+        rounds = 0
+
+        while True:
+            rounds += 1
+            with EXTRACTION_SECONDS.time("harvest_round"):
+                raw_articles = await page.evaluate(HARVEST_ARTICLES_JS, TWEET_ARTICLE_SELECTOR)
+                round_tweets = build_tweets(raw_articles, len(raw_articles), username)
+
+            new_tweets = 0
+            reached_known = False
+            for tweet in round_tweets:
+                if not is_newer_status(tweet.id, since_id):
+                    reached_known = True
+                elif tweet.id not in collected:
+                    collected[tweet.id] = tweet
+                    new_tweets += 1
+
+            if len(collected) >= count:
+                break
+            if reached_known:
+                logger.debug(f"Reached known status {since_id} after {rounds} rounds")
+                break
+
+            idle_rounds = 0 if new_tweets else idle_rounds + 1
+            if idle_rounds >= config.TIMELINE_MAX_IDLE_SCROLLS:
+                logger.debug(f"Timeline stopped growing after {rounds} rounds")
+                break
+            if loop.time() >= deadline:
+                logger.warning(
+                    f"Timeline time budget exhausted with {len(collected)}/{count} tweets"
+                )
+                break
+
+            await page.evaluate("window.scrollBy(0, window.innerHeight)")
+            await wait_for_new_articles(page)
+
+        tweets = list(collected.values())[:count]
+        logger.info(f"Harvested {len(tweets)} out of requested {count} tweets in {rounds} rounds")
         return tweets
+
+    def _reached_known(self, tweets: List[Tweet], since_id: Optional[str]) -> bool:
+        """Check whether the timeline read so far already includes a status at or below `since_id`."""
+        return bool(since_id) and any(not is_newer_status(tweet.id, since_id) for tweet in tweets)
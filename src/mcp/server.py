@@ -1,19 +1,25 @@
 """MCP server implementation using fastmcp."""
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from fastmcp import FastMCP
 from src.config import config
 from src.infrastructure.logging_config import setup_logging
 from src.infrastructure.browser_manager import BrowserManager
 from src.infrastructure.twitter_repository import PlaywrightTwitterRepository
+from src.infrastructure.remote_twitter_repository import RemoteTwitterRepository
+from src.infrastructure.in_memory_twitter_repository import InMemoryTwitterRepository
+from src.infrastructure.single_flight import SingleFlight
+from src.infrastructure.action_scheduler import ScheduledTwitterRepository, create_action_scheduler
+from src.infrastructure.timeline_cache import CachingTwitterRepository, create_timeline_store
+from src.infrastructure.metrics import metrics, runtime_gauges_collector, start_metrics_server
 from src.domain.use_cases import (
     ReadLastTweetsUseCase,
     ReplyToTweetUseCase,
     RetweetUseCase,
     PostTweetUseCase
 )
-from src.domain.interfaces import TwitterRepositoryError
+from src.domain.interfaces import ITwitterRepository, TwitterRepositoryError
 
 logger = logging.getLogger(__name__)
 
@@ -22,21 +28,26 @@ mcp = FastMCP(config.MCP_SERVER_NAME)
 
 # Global instances (will be initialized in lifespan)
 browser_manager: BrowserManager = None
-twitter_repo: PlaywrightTwitterRepository = None
+twitter_repo: ITwitterRepository = None
 read_tweets_uc: ReadLastTweetsUseCase = None
 reply_uc: ReplyToTweetUseCase = None
 retweet_uc: RetweetUseCase = None
 post_tweet_uc: PostTweetUseCase = None
+metrics_server = None  # Serves /metrics on METRICS_MCP_PORT when enabled
+
+MCP_TOOL_SECONDS = metrics.histogram("mcp_tool_seconds", "Duration of MCP tool calls", ("tool",))
 
 
 @mcp.tool()
-async def read_last_tweets(username: str, count: int = 5) -> List[Dict[str, Any]]:
+@metrics.timed(MCP_TOOL_SECONDS)
+async def read_last_tweets(username: str, count: int = 5, account: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Read the last N tweets from a user's profile.
 
     Args:
         username: Twitter username (without @)
         count: Number of tweets to retrieve (default: 5, max: 100)
+        account: Bot account to act as (default account if omitted)
 
     Returns:
         List of tweet dictionaries with id, text, author, url, etc.
@@ -47,7 +58,7 @@ async def read_last_tweets(username: str, count: int = 5) -> List[Dict[str, Any]
     logger.info(f"MCP tool called: read_last_tweets(@{username}, count={count})")
 
     try:
-        tweets = await read_tweets_uc.execute(username.lstrip('@'), count)
+        tweets = await read_tweets_uc.execute(username.lstrip('@'), count, account=account)
         result = [tweet.to_dict() for tweet in tweets]
         logger.info(f"MCP tool completed: read_last_tweets returned {len(result)} tweets")
         return result
@@ -64,13 +75,15 @@ async def read_last_tweets(username: str, count: int = 5) -> List[Dict[str, Any]
 
 
 @mcp.tool()
-async def reply_to_tweet(tweet_id: str, text: str) -> Dict[str, Any]:
+@metrics.timed(MCP_TOOL_SECONDS)
+async def reply_to_tweet(tweet_id: str, text: str, account: Optional[str] = None) -> Dict[str, Any]:
     """
     Reply to a tweet.
 
     Args:
         tweet_id: The ID of the tweet to reply to
         text: The reply text (max 280 characters)
+        account: Bot account to act as (default account if omitted)
 
     Returns:
         Dictionary with success status and reply metadata
@@ -81,7 +94,7 @@ async def reply_to_tweet(tweet_id: str, text: str) -> Dict[str, Any]:
     logger.info(f"MCP tool called: reply_to_tweet({tweet_id})")
 
     try:
-        result = await reply_uc.execute(tweet_id, text)
+        result = await reply_uc.execute(tweet_id, text, account=account)
         response = result.to_dict()
         logger.info(f"MCP tool completed: reply_to_tweet success={result.success}")
         return response
@@ -98,12 +111,14 @@ async def reply_to_tweet(tweet_id: str, text: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-async def retweet(tweet_id: str) -> Dict[str, Any]:
+@metrics.timed(MCP_TOOL_SECONDS)
+async def retweet(tweet_id: str, account: Optional[str] = None) -> Dict[str, Any]:
     """
     Retweet (repost) a tweet.
 
     Args:
         tweet_id: The ID of the tweet to retweet
+        account: Bot account to act as (default account if omitted)
 
     Returns:
         Dictionary with success status
@@ -114,7 +129,7 @@ async def retweet(tweet_id: str) -> Dict[str, Any]:
     logger.info(f"MCP tool called: retweet({tweet_id})")
 
     try:
-        result = await retweet_uc.execute(tweet_id)
+        result = await retweet_uc.execute(tweet_id, account=account)
         response = result.to_dict()
         logger.info(f"MCP tool completed: retweet success={result.success}")
         return response
@@ -122,18 +137,23 @@ async def retweet(tweet_id: str) -> Dict[str, Any]:
     except TwitterRepositoryError as e:
         logger.error(f"Twitter error in retweet: {e.message}")
         raise Exception(f"Twitter error: {e.message}")
+    except ValueError as e:
+        logger.error(f"Validation error in retweet: {e}")
+        raise Exception(f"Validation error: {str(e)}")
     except Exception as e:
         logger.exception(f"Unexpected error in retweet: {e}")
         raise
 
 
 @mcp.tool()
-async def post_tweet(text: str) -> Dict[str, Any]:
+@metrics.timed(MCP_TOOL_SECONDS)
+async def post_tweet(text: str, account: Optional[str] = None) -> Dict[str, Any]:
     """
     Post a new tweet.
 
     Args:
         text: The tweet text (max 280 characters)
+        account: Bot account to act as (default account if omitted)
 
     Returns:
         Dictionary with success status and tweet metadata
@@ -144,7 +164,7 @@ async def post_tweet(text: str) -> Dict[str, Any]:
     logger.info("MCP tool called: post_tweet")
 
     try:
-        result = await post_tweet_uc.execute(text)
+        result = await post_tweet_uc.execute(text, account=account)
         response = result.to_dict()
         logger.info(f"MCP tool completed: post_tweet success={result.success}")
         return response
@@ -162,7 +182,7 @@ async def post_tweet(text: str) -> Dict[str, Any]:
 
 async def initialize_mcp_server():
     """Initialize MCP server with dependencies."""
-    global browser_manager, twitter_repo
+    global browser_manager, twitter_repo, metrics_server
     global read_tweets_uc, reply_uc, retweet_uc, post_tweet_uc
 
     logger.info("Initializing MCP server")
@@ -170,35 +190,84 @@ async def initialize_mcp_server():
     # Setup logging
     setup_logging()
 
-    # Initialize browser manager
-    browser_manager = BrowserManager()
-    await browser_manager.start()
-    logger.info("Browser manager started")
-
-    # Initialize Twitter repository
-    twitter_repo = PlaywrightTwitterRepository(browser_manager)
+    # Initialize Twitter repository (synthetic data, own browser, or the shared worker)
+    if config.TWITTER_BACKEND == "memory":
+        twitter_repo = InMemoryTwitterRepository()
+        logger.info("Using in-memory Twitter backend (no browser)")
+    elif config.BROWSER_SERVICE_ENABLED:
+        twitter_repo = RemoteTwitterRepository()
+        await twitter_repo.check_health()
+        logger.info("Using shared browser worker")
+    else:
+        browser_manager = BrowserManager()
+        await browser_manager.start()
+        logger.info("Browser manager started")
+        twitter_repo = PlaywrightTwitterRepository(browser_manager)
+
+    # Admit browser calls through priority lanes (before the cache, so cache hits skip the queue)
+    action_scheduler = None
+    if config.SCHEDULER_ENABLED:
+        action_scheduler = create_action_scheduler()
+        twitter_repo = ScheduledTwitterRepository(twitter_repo, action_scheduler)
+        logger.info("Action scheduler enabled")
+
+    # Cache profile timelines in front of whichever repository is in use
+    if config.TIMELINE_CACHE_ENABLED:
+        twitter_repo = CachingTwitterRepository(
+            twitter_repo,
+            create_timeline_store(
+                config.TIMELINE_CACHE_BACKEND,
+                config.TIMELINE_CACHE_MAX_BYTES,
+                config.TIMELINE_CACHE_REDIS_URL
+            ),
+            ttl_seconds=config.TIMELINE_CACHE_TTL_SECONDS,
+            stale_seconds=config.TIMELINE_CACHE_STALE_SECONDS
+        )
+        logger.info(f"Timeline cache enabled ({config.TIMELINE_CACHE_BACKEND})")
     logger.info("Twitter repository initialized")
 
     # Initialize use cases
-    read_tweets_uc = ReadLastTweetsUseCase(twitter_repo)
+    single_flight = SingleFlight() if config.SINGLE_FLIGHT_ENABLED else None
+    read_tweets_uc = ReadLastTweetsUseCase(twitter_repo, single_flight)
     reply_uc = ReplyToTweetUseCase(twitter_repo)
     retweet_uc = RetweetUseCase(twitter_repo)
     post_tweet_uc = PostTweetUseCase(twitter_repo)
     logger.info("Use cases initialized")
 
+    # stdio carries the MCP protocol, so metrics get their own port
+    if metrics.enabled and config.METRICS_MCP_PORT:
+        metrics.add_collector(runtime_gauges_collector(browser_manager, action_scheduler, single_flight))
+        metrics_server = await start_metrics_server(config.METRICS_MCP_PORT)
+
     logger.info("MCP server initialization complete")
 
 
 async def cleanup_mcp_server():
     """Cleanup MCP server resources."""
-    global browser_manager
+    global browser_manager, twitter_repo, metrics_server
 
     logger.info("Cleaning up MCP server")
 
+    if metrics_server:
+        metrics_server.close()
+        await metrics_server.wait_closed()
+        metrics_server = None
+
     if browser_manager:
         await browser_manager.stop()
         logger.info("Browser manager stopped")
 
+    if isinstance(twitter_repo, CachingTwitterRepository):
+        await twitter_repo.close()
+        # Unwrap so the worker proxy below is closed too
+        twitter_repo = twitter_repo.inner
+
+    if isinstance(twitter_repo, ScheduledTwitterRepository):
+        twitter_repo = twitter_repo.inner
+
+    if isinstance(twitter_repo, RemoteTwitterRepository):
+        await twitter_repo.close()
+
     logger.info("MCP server cleanup complete")
 
 
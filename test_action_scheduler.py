@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Test script for the ActionScheduler priority lanes.
+
+Covers priority, the fairness override, QUEUE_FULL backpressure and the
+per-account write serialization of ScheduledTwitterRepository. Runs
+offline - no browser, API server or MongoDB needed.
+
+Usage:
+    python test_action_scheduler.py
+"""
+
+import asyncio
+import copy
+import sys
+from typing import List, Optional
+from src.config import config
+from src.domain.interfaces import ITwitterRepository
+from src.domain.models import ActionResult, Tweet
+from src.infrastructure.action_scheduler import (
+    BACKGROUND_LANE,
+    INTERACTIVE_LANE,
+    ActionScheduler,
+    LaneLimits,
+    QueueFullError,
+    ScheduledTwitterRepository
+)
+
+
+def print_test(name):
+    """Print test name header"""
+    print(f"\n{'='*70}")
+    print(f"TEST: {name}")
+    print(f"{'='*70}")
+
+
+def make_scheduler(total=1, concurrency=1, max_depth=10, fairness=4):
+    return ActionScheduler(
+        lanes={
+            INTERACTIVE_LANE: LaneLimits(concurrency=concurrency, max_depth=max_depth),
+            BACKGROUND_LANE: LaneLimits(concurrency=concurrency, max_depth=max_depth)
+        },
+        total_concurrency=total,
+        fairness=fairness
+    )
+
+
+async def settle():
+    """Let queued tasks run until they block."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class FakeWriteRepo(ITwitterRepository):
+    """Retweets wait on a gate and are recorded in order."""
+
+    def __init__(self):
+        self.started = []
+        self.gate = asyncio.Event()
+
+    def for_account(self, account: Optional[str]) -> 'FakeWriteRepo':
+        # Like RemoteTwitterRepository: a proxy per name, sharing the recorder and gate
+        return self if account is None else copy.copy(self)
+
+    async def retweet(self, tweet_id: str) -> ActionResult:
+        self.started.append(tweet_id)
+        await self.gate.wait()
+        return ActionResult(success=True, message=f"Retweeted {tweet_id}")
+
+    async def read_last_tweets(self, username: str, count: int) -> List[Tweet]:
+        raise NotImplementedError
+
+    async def read_last_mentions(self, count: int, since_id: Optional[str] = None) -> List[Tweet]:
+        raise NotImplementedError
+
+    async def reply_to_tweet(self, tweet_id, text):
+        raise NotImplementedError
+
+    async def post_tweet(self, text):
+        raise NotImplementedError
+
+    async def quote_tweet(self, tweet_id, text):
+        raise NotImplementedError
+
+
+def test_priority_order():
+    """A free slot goes to the interactive lane before the background one"""
+    print_test("Interactive lane served first")
+
+    async def run():
+        scheduler = make_scheduler(total=1)
+        order = []
+        release = asyncio.Event()
+
+        async def call(lane, name):
+            async with scheduler.slot(lane):
+                order.append(name)
+                await release.wait()
+
+        blocker = asyncio.ensure_future(call(INTERACTIVE_LANE, "blocker"))
+        await settle()
+        waiting = [
+            asyncio.ensure_future(call(BACKGROUND_LANE, "background")),
+            asyncio.ensure_future(call(INTERACTIVE_LANE, "interactive"))
+        ]
+        await settle()
+        release.set()
+        await asyncio.gather(blocker, *waiting)
+        return order
+
+    order = asyncio.run(run())
+    print(f"Order: {order}")
+
+    assert order == ["blocker", "interactive", "background"], f"unexpected order {order}"
+
+    print("✅ PASSED: interactive call overtook the earlier background call")
+    return True
+
+
+def test_fairness_override():
+    """A background call passed over `fairness` times gets the next slot"""
+    print_test("Fairness override")
+
+    async def run():
+        scheduler = make_scheduler(total=1, fairness=2)
+        order = []
+        release = asyncio.Event()
+
+        async def call(lane, name):
+            async with scheduler.slot(lane):
+                order.append(name)
+                if name == "blocker":
+                    await release.wait()
+
+        tasks = [asyncio.ensure_future(call(INTERACTIVE_LANE, "blocker"))]
+        await settle()
+        tasks.append(asyncio.ensure_future(call(BACKGROUND_LANE, "bg")))
+        tasks += [asyncio.ensure_future(call(INTERACTIVE_LANE, f"i{n}")) for n in range(5)]
+        await settle()
+        release.set()
+        await asyncio.gather(*tasks)
+        return order
+
+    order = asyncio.run(run())
+    print(f"Order: {order}")
+
+    # Passed over for i0 and i1, then served ahead of the remaining interactive calls
+    assert order == ["blocker", "i0", "i1", "bg", "i2", "i3", "i4"], f"unexpected order {order}"
+
+    print("✅ PASSED: background call served under constant interactive load")
+    return True
+
+
+def test_queue_full():
+    """A lane at max depth rejects new calls with QUEUE_FULL"""
+    print_test("QUEUE_FULL at max depth")
+
+    async def run():
+        scheduler = make_scheduler(total=1, max_depth=2)
+        release = asyncio.Event()
+
+        async def call():
+            async with scheduler.slot(INTERACTIVE_LANE):
+                await release.wait()
+
+        tasks = [asyncio.ensure_future(call()) for _ in range(3)]  # 1 running + 2 waiting
+        await settle()
+        try:
+            await call()
+            rejected = None
+        except QueueFullError as e:
+            rejected = e
+        background_ok = scheduler.stats()[BACKGROUND_LANE]["rejected"] == 0
+        release.set()
+        await asyncio.gather(*tasks)
+        return rejected, background_ok, scheduler.stats()
+
+    rejected, background_ok, stats = asyncio.run(run())
+    print(f"Rejected: {rejected}, stats: {stats[INTERACTIVE_LANE]}")
+
+    assert rejected is not None and rejected.error_code == "QUEUE_FULL"
+    assert background_ok
+    assert stats[INTERACTIVE_LANE]["rejected"] == 1 and stats[INTERACTIVE_LANE]["granted"] == 3
+
+    print("✅ PASSED: fourth call rejected, queued ones still completed")
+    return True
+
+
+def test_writes_serialized_and_bounded():
+    """One account's writes run one at a time, and writes waiting for the lock count toward depth"""
+    print_test("Per-account writes serialized and counted toward depth")
+
+    async def run():
+        scheduler = make_scheduler(total=3, concurrency=3, max_depth=2)
+        inner = FakeWriteRepo()
+        repo = ScheduledTwitterRepository(inner, scheduler)
+
+        writes = [asyncio.ensure_future(repo.retweet(str(n))) for n in range(3)]  # 1 running + 2 on the lock
+        await settle()
+        started_while_blocked = list(inner.started)
+        depth = scheduler.stats()[INTERACTIVE_LANE]["waiting"]
+
+        try:
+            await repo.retweet("overflow")
+            rejected = None
+        except QueueFullError as e:
+            rejected = e
+
+        inner.gate.set()
+        await asyncio.gather(*writes)
+        return started_while_blocked, depth, rejected, inner.started
+
+    started_while_blocked, depth, rejected, started = asyncio.run(run())
+    print(f"Started while blocked: {started_while_blocked}, depth: {depth}, order: {started}")
+
+    assert started_while_blocked == ["0"], "only one write per account runs at a time"
+    assert depth == 2, f"writes waiting on the lock should count toward depth, got {depth}"
+    assert rejected is not None and rejected.error_code == "QUEUE_FULL"
+    assert started == ["0", "1", "2"], "writes run in arrival order"
+
+    print("✅ PASSED: writes serialized in order, overflow rejected with QUEUE_FULL")
+    return True
+
+
+def test_default_account_shares_write_lock():
+    """Writes as None and as the default account's name are serialized together"""
+    print_test("Default account shares the write lock with None")
+
+    async def run():
+        scheduler = make_scheduler(total=3, concurrency=3)
+        inner = FakeWriteRepo()
+        repo = ScheduledTwitterRepository(inner, scheduler)
+        writes = [
+            asyncio.ensure_future(repo.retweet("implicit")),
+            asyncio.ensure_future(repo.for_account(config.resolve_account(None)).retweet("named")),
+            asyncio.ensure_future(repo.for_account("other_bot").retweet("other"))
+        ]
+        await settle()
+        started_while_blocked = list(inner.started)
+        inner.gate.set()
+        await asyncio.gather(*writes)
+        return started_while_blocked
+
+    started_while_blocked = asyncio.run(run())
+    print(f"Started while blocked: {started_while_blocked}")
+
+    assert started_while_blocked == ["implicit", "other"], f"unexpected writes in flight {started_while_blocked}"
+
+    print("✅ PASSED: the named default account waited for the implicit one; other_bot ran")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("Action Scheduler Tests")
+
+    tests = [
+        ("Interactive lane served first", test_priority_order),
+        ("Fairness override", test_fairness_override),
+        ("QUEUE_FULL at max depth", test_queue_full),
+        ("Per-account writes serialized and counted toward depth", test_writes_serialized_and_bounded),
+        ("Default account shares the write lock with None", test_default_account_shares_write_lock),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((test_name, passed))
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            results.append((test_name, False))
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            results.append((test_name, False))
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+
+    passed_count = sum(1 for _, passed in results if passed)
+    total_count = len(results)
+
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {test_name}")
+
+    print("-" * 60)
+    print(f"Results: {passed_count}/{total_count} tests passed")
+
+    sys.exit(0 if passed_count == total_count else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test script for rebuild_author_stats() racing live counter updates.
+
+Uses a throwaway database (dropped at the end) on the MongoDB from the
+MONGO_* settings; no browser, API server or Twitter account needed.
+
+Usage:
+    python test_author_stats.py
+"""
+
+import asyncio
+import sys
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from src.config import config
+from src.infrastructure.mongo_repository import MongoRepository
+
+TEST_DB = f"{config.MONGO_DB}_author_stats_test"
+
+
+def print_test(name):
+    """Print test name header"""
+    print(f"\n{'='*70}")
+    print(f"TEST: {name}")
+    print(f"{'='*70}")
+
+
+def mention_doc(author: str, ignored: bool = False) -> dict:
+    """A stored mention shaped like Mention.to_dict()."""
+    now = datetime.utcnow()
+    tweet_id = str(uuid.uuid4().int % 10 ** 18)
+    return {
+        "idTweet": str(uuid.uuid4()),
+        "tweetId": tweet_id,
+        "text": "@bot hello",
+        "authorUsername": author,
+        "createdAt": now,
+        "url": f"https://x.com/{author}/status/{tweet_id}",
+        "type": "mention",
+        "repliedTo": False,
+        "ignored": ignored,
+        "firstSeenAt": now,
+        "lastUpdatedAt": now,
+        "mentionedUsers": ["@bot"],
+        "account": "default"
+    }
+
+
+class IncrementDuringMerge:
+    """Mentions collection whose aggregate() runs `during` once the $merge has run, before the cleanup."""
+
+    def __init__(self, collection, during):
+        self._collection = collection
+        self._during = during
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    async def aggregate(self, pipeline, **kwargs):
+        async for doc in self._collection.aggregate(pipeline, **kwargs):
+            yield doc
+        await self._during()
+
+
+async def with_repo(check):
+    """Run `check(repo)` against a fresh test database, then drop it."""
+    client = AsyncIOMotorClient(config.get_mongo_uri())
+    config.MONGO_DB = TEST_DB
+    await client.drop_database(TEST_DB)
+    repo = MongoRepository(client)
+    try:
+        return await check(repo)
+    finally:
+        await client.drop_database(TEST_DB)
+        client.close()
+
+
+def test_counters_written_during_rebuild_survive():
+    """A new author's counter upserted while the $merge runs is kept"""
+    print_test("Counter upserted during the rebuild survives")
+
+    async def check(repo):
+        await repo.mentions.insert_many([mention_doc("regular"), mention_doc("regular")])
+
+        # The mention and its counter land after the $group has read the collection
+        async def new_author_mention():
+            await repo._inc_author_stats({"newcomer": Counter(totalMentions=1, ignoredMentions=1)})
+
+        repo.mentions = IncrementDuringMerge(repo.mentions, new_author_mention)
+        rebuilt = await repo.rebuild_author_stats()
+        return rebuilt, await repo.get_author_stats("regular"), await repo.get_author_stats("newcomer")
+
+    rebuilt, regular, newcomer = asyncio.run(with_repo(check))
+    print(f"Rebuilt: {rebuilt}, regular: {regular}, newcomer: {newcomer}")
+
+    assert rebuilt == 1
+    assert regular is not None and regular.total_mentions == 2
+    assert newcomer is not None, "the counter written during the rebuild was deleted"
+    assert newcomer.ignored_mentions == 1
+
+    print("✅ PASSED: concurrent counter kept, rebuilt counter correct")
+    return True
+
+
+def test_stale_counters_removed():
+    """Counters of authors without mentions and no recent update are removed"""
+    print_test("Stale counters removed")
+
+    async def check(repo):
+        await repo.mentions.insert_one(mention_doc("active", ignored=True))
+        last_year = datetime.utcnow() - timedelta(days=365)
+        await repo.author_stats.insert_one({
+            "username": "gone",
+            "totalMentions": 7,
+            "ignoredMentions": 0,
+            "firstSeenAt": last_year,
+            "lastActivityAt": last_year
+        })
+        await repo.rebuild_author_stats()
+        return await repo.get_author_stats("active"), await repo.get_author_stats("gone")
+
+    active, gone = asyncio.run(with_repo(check))
+    print(f"Active: {active}, gone: {gone}")
+
+    assert active is not None and active.total_mentions == 1 and active.ignored_mentions == 1
+    assert gone is None, "an author with no mentions keeps a stale counter"
+
+    print("✅ PASSED: stale counter deleted")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("Author Stats Rebuild Tests")
+
+    tests = [
+        ("Counter upserted during the rebuild survives", test_counters_written_during_rebuild_survive),
+        ("Stale counters removed", test_stale_counters_removed),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((test_name, passed))
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            results.append((test_name, False))
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            results.append((test_name, False))
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+
+    passed_count = sum(1 for _, passed in results if passed)
+    total_count = len(results)
+
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {test_name}")
+
+    print("-" * 60)
+    print(f"Results: {passed_count}/{total_count} tests passed")
+
+    sys.exit(0 if passed_count == total_count else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Test script for GraphQL timeline capture.
+
+Replays JSON fixtures shaped like X's timeline responses through the
+parser and the TimelineCapture listener. Runs offline - no browser, API
+server or Twitter account needed.
+
+Usage:
+    python test_graphql_capture.py
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from src.infrastructure.graphql_timeline import (
+    MENTIONS_TIMELINE_OPERATIONS,
+    PROFILE_TIMELINE_OPERATIONS,
+    TimelineCapture,
+    parse_timeline_payload
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "graphql"
+
+
+def load_fixture(name):
+    """Load a recorded response body from fixtures/graphql."""
+    with open(FIXTURES_DIR / name) as f:
+        return json.load(f)
+
+
+def print_test(name):
+    """Print test name header"""
+    print(f"\n{'='*70}")
+    print(f"TEST: {name}")
+    print(f"{'='*70}")
+
+
+class FakeResponse:
+    """Minimal stand-in for a Playwright Response."""
+
+    def __init__(self, url, payload, ok=True):
+        self.url = url
+        self.ok = ok
+        self._payload = payload
+
+    async def json(self):
+        return self._payload
+
+
+class FakePage:
+    """Minimal stand-in for a Playwright Page that can emit responses."""
+
+    def __init__(self):
+        self.listeners = []
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove(handler)
+
+    def emit(self, response):
+        for handler in list(self.listeners):
+            handler(response)
+
+
+def test_user_tweets_parsing():
+    """UserTweets payload: order, pinned entry, wrappers, quotes, real timestamps"""
+    print_test("Parse UserTweets payload")
+
+    tweets = parse_timeline_payload(load_fixture("user_tweets.json"))
+    ids = [t.id for t in tweets]
+    print(f"Parsed IDs: {ids}")
+
+    assert ids == [
+        "1700000000000000001",
+        "1800000000000000003",
+        "1800000000000000002",
+        "1800000000000000001",
+    ], "Unexpected tweet order or quoted tweet leaked into timeline"
+
+    newest = tweets[1]
+    assert newest.author_username == "bench_user"
+    assert newest.created_at == datetime(2024, 1, 2, 12, 30), f"Bad timestamp: {newest.created_at}"
+    assert (newest.retweet_count, newest.like_count, newest.reply_count) == (1, 10, 0)
+    assert tweets[2].author_username == "bench_user", "New user core shape not handled"
+    assert tweets[3].text == "Oldest tweet with visibility wrapper"
+
+    print("✅ PASSED: 4 tweets with real timestamps and engagement counts")
+    return True
+
+
+def test_legacy_mentions_parsing():
+    """Legacy REST mentions payload is parsed in timeline order"""
+    print_test("Parse legacy mentions payload")
+
+    tweets = parse_timeline_payload(load_fixture("mentions_legacy.json"))
+    authors = [t.author_username for t in tweets]
+    print(f"Parsed authors: {authors}")
+
+    assert authors == ["alice", "bob"], "Mentions not in timeline order"
+    assert tweets[0].created_at == datetime(2024, 1, 3, 10, 0)
+
+    print("✅ PASSED: mentions parsed in timeline order")
+    return True
+
+
+def test_capture_replay():
+    """TimelineCapture only consumes matching endpoints and dedupes across pages"""
+    print_test("Replay responses through TimelineCapture")
+
+    async def run():
+        page = FakePage()
+        capture = TimelineCapture(page, PROFILE_TIMELINE_OPERATIONS)
+        capture.attach()
+        payload = load_fixture("user_tweets.json")
+
+        page.emit(FakeResponse("https://x.com/i/api/graphql/abc123/UserByScreenName?variables=%7B%7D", {"data": {}}))
+        page.emit(FakeResponse("https://x.com/i/api/graphql/abc123/UserTweets?variables=%7B%7D", payload))
+        assert await capture.wait_for_payload(max_wait_ms=1000), "Payload not captured"
+
+        # Same page replayed (e.g. refetch) must not duplicate tweets
+        page.emit(FakeResponse("https://x.com/i/api/graphql/abc123/UserTweets?variables=%7B%7D", payload))
+        assert await capture.wait_for_payload(after=1, max_wait_ms=1000)
+
+        capture.detach()
+        assert not page.listeners, "Listener not removed on detach"
+        return capture
+
+    capture = asyncio.run(run())
+    print(f"Payloads: {capture.payload_count}, tweets: {len(capture.tweets)}")
+
+    assert capture.payload_count == 2
+    assert len(capture.tweets) == 4
+
+    mentions_capture = TimelineCapture(FakePage(), MENTIONS_TIMELINE_OPERATIONS, include_legacy_mentions=True)
+    assert mentions_capture.matches("https://x.com/i/api/2/notifications/mentions.json?count=20")
+    assert not mentions_capture.matches("https://x.com/i/api/graphql/abc/UserTweets")
+
+    print("✅ PASSED: capture filters endpoints and dedupes tweets")
+    return True
+
+
+def test_capture_timeout():
+    """wait_for_payload gives up after the cap when nothing is captured"""
+    print_test("Capture times out without payloads")
+
+    async def run():
+        capture = TimelineCapture(FakePage(), PROFILE_TIMELINE_OPERATIONS)
+        return await capture.wait_for_payload(max_wait_ms=100)
+
+    assert asyncio.run(run()) is False
+    print("✅ PASSED: no payload -> caller falls back to DOM")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("GraphQL Timeline Capture Tests")
+
+    tests = [
+        ("Parse UserTweets payload", test_user_tweets_parsing),
+        ("Parse legacy mentions payload", test_legacy_mentions_parsing),
+        ("Replay through TimelineCapture", test_capture_replay),
+        ("Capture timeout fallback", test_capture_timeout),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((test_name, passed))
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            results.append((test_name, False))
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            results.append((test_name, False))
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+
+    passed_count = sum(1 for _, passed in results if passed)
+    total_count = len(results)
+
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {test_name}")
+
+    print("-" * 60)
+    print(f"Results: {passed_count}/{total_count} tests passed")
+
+    sys.exit(0 if passed_count == total_count else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script for the post-scroll readiness wait and the timeline harvester.
+
+Loads static article markup into a headless Chromium page, so it needs
+Playwright's Chromium (playwright install chromium) but no network, API
+server or Twitter account.
+
+Usage:
+    python test_page_readiness.py
+"""
+
+import asyncio
+import sys
+from playwright.async_api import async_playwright
+from src.infrastructure.page_readiness import wait_for_new_articles
+from src.infrastructure.tweet_extraction import HARVEST_ARTICLES_JS, TWEET_ARTICLE_SELECTOR
+
+# Short cap: a wait that should not resolve fails fast
+MAX_WAIT_MS = 500
+
+
+def print_test(name):
+    """Print test name header"""
+    print(f"\n{'='*70}")
+    print(f"TEST: {name}")
+    print(f"{'='*70}")
+
+
+def article_html(tweet_id, text="Hello"):
+    """A tweet article as X renders it (text plus timestamp permalink)."""
+    return (
+        f'<article data-testid="tweet"><div data-testid="tweetText">{text} {tweet_id}</div>'
+        f'<a href="/alice/status/{tweet_id}"><time datetime="2024-01-01T00:00:00Z"></time></a></article>'
+    )
+
+
+# An "unavailable post" placeholder: an article with no permalink
+PLACEHOLDER_HTML = '<article data-testid="tweet"><div>This post is unavailable.</div></article>'
+
+
+async def with_page(html, check):
+    """Run `check(page)` against a page showing `html`."""
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        try:
+            page = await browser.new_page()
+            await page.set_content(f'<main id="timeline">{html}</main>')
+            return await check(page)
+        finally:
+            await browser.close()
+
+
+async def harvest(page):
+    return await page.evaluate(HARVEST_ARTICLES_JS, TWEET_ARTICLE_SELECTOR)
+
+
+def test_placeholder_does_not_satisfy_wait():
+    """An article without a permalink is tagged once and never counts as new"""
+    print_test("Permalink-less article does not end the wait")
+
+    async def check(page):
+        first = await harvest(page)
+        new_articles = await wait_for_new_articles(page, max_wait_ms=MAX_WAIT_MS)
+        second = await harvest(page)
+        return first, new_articles, second
+
+    first, new_articles, second = asyncio.run(with_page(article_html("1") + PLACEHOLDER_HTML, check))
+    print(f"First harvest: {len(first)} records, wait resolved: {new_articles}, second harvest: {len(second)}")
+
+    assert len(first) == 2, "both articles are visited once"
+    assert new_articles is False, "a harvested placeholder must not count as a new article"
+    assert second == [], "nothing is re-parsed"
+
+    print("✅ PASSED: placeholder tagged, wait ran to its cap")
+    return True
+
+
+def test_new_article_satisfies_wait():
+    """An article appended after a harvest ends the wait"""
+    print_test("Appended article ends the wait")
+
+    async def check(page):
+        await harvest(page)
+        await page.evaluate(
+            "(html) => document.getElementById('timeline').insertAdjacentHTML('beforeend', html)",
+            article_html("2")
+        )
+        new_articles = await wait_for_new_articles(page, max_wait_ms=MAX_WAIT_MS)
+        return new_articles, await harvest(page)
+
+    new_articles, fresh = asyncio.run(with_page(article_html("1"), check))
+    print(f"Wait resolved: {new_articles}, records: {[r['href'] for r in fresh]}")
+
+    assert new_articles is True
+    assert [r["href"] for r in fresh] == ["/alice/status/2"]
+
+    print("✅ PASSED: new article detected and harvested once")
+    return True
+
+
+def test_recycled_node_satisfies_wait():
+    """A tagged node reused for another tweet counts as new"""
+    print_test("Recycled article node ends the wait")
+
+    async def check(page):
+        await harvest(page)
+        # X's virtualized list swaps the node's content in place; the old tag stays
+        await page.evaluate(
+            "(html) => { document.querySelector('article').innerHTML = "
+            "new DOMParser().parseFromString(html, 'text/html').querySelector('article').innerHTML; }",
+            article_html("3")
+        )
+        new_articles = await wait_for_new_articles(page, max_wait_ms=MAX_WAIT_MS)
+        return new_articles, await harvest(page)
+
+    new_articles, fresh = asyncio.run(with_page(article_html("1"), check))
+    print(f"Wait resolved: {new_articles}, records: {[r['href'] for r in fresh]}")
+
+    assert new_articles is True, "a stale tag must not hide new content"
+    assert [r["href"] for r in fresh] == ["/alice/status/3"]
+
+    print("✅ PASSED: recycled node detected by its permalink")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("Page Readiness Tests")
+
+    tests = [
+        ("Permalink-less article does not end the wait", test_placeholder_does_not_satisfy_wait),
+        ("Appended article ends the wait", test_new_article_satisfies_wait),
+        ("Recycled article node ends the wait", test_recycled_node_satisfies_wait),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((test_name, passed))
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            results.append((test_name, False))
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            results.append((test_name, False))
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+
+    passed_count = sum(1 for _, passed in results if passed)
+    total_count = len(results)
+
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {test_name}")
+
+    print("-" * 60)
+    print(f"Results: {passed_count}/{total_count} tests passed")
+
+    sys.exit(0 if passed_count == total_count else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Query-plan regression test for MongoRepository.
+
+Seeds a synthetic dataset (200k mentions and 50k tweets by default) into a
+separate database, creates the indexes through MongoRepository.initialize(),
+then calls the repository's query methods while a pymongo CommandListener
+records every command they send. Each recorded command is re-run as
+explain("executionStats") and checked for:
+
+1. Index use: no COLLSCAN (except FULL_SCANS_BY_DESIGN)
+2. Selectivity: reads examine at most MAX_EXAMINED_RATIO documents per
+   document they return (finds and aggregations) or match (count, distinct)
+
+Because the commands are captured from the real methods, a changed query
+shape or a dropped index fails here without this script having to mirror
+the queries. Writes (update/findAndModify) are checked for index use only;
+explain never applies them. rebuild_author_stats() is a full-collection
+maintenance job and is only used to seed author_stats.
+
+Requires a running mongod (MONGO_* settings); exits with status 1 if any
+check fails.
+
+Usage:
+    python test_query_plans.py [--mentions 200000] [--tweets 50000]
+    python test_query_plans.py --skip-seed     # reuse the seeded data
+    python test_query_plans.py --drop          # remove the test database
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+from src.config import config
+from src.domain.models import BlockedReason, BlockedUser, IgnoredReason, Job, JobStatus
+from src.infrastructure.mongo_monitoring import EXPLAINABLE_COMMANDS, explainable_command, summarize_plan
+from src.infrastructure.mongo_repository import MongoRepository
+
+BATCH_SIZE = 10_000
+# Bot accounts the seeded mentions are spread over; scenarios read the first
+ACCOUNTS = ("default", "second_bot")
+
+# Documents a read may examine per document it returns; reads examining
+# fewer than MIN_EXAMINED_BUDGET documents always pass ($in lookups with a
+# residual filter, e.g. author_stats candidates over the block threshold)
+MAX_EXAMINED_RATIO = 3.0
+MIN_EXAMINED_BUDGET = 50
+
+# Reads that examine far more than they return on purpose, and why. Keyed by
+# (command, collection, shape), the shape being an aggregation's stages, so
+# an exemption never covers another query on the same collection.
+FULL_SCANS_BY_DESIGN: Dict[Tuple[str, str, str], str] = {
+    ("find", "blocked_users", ""):
+        "the blocked-user cache loads the whole (small) collection",
+    ("aggregate", "mentions", "$match > $sort > $group > $sort > $limit"):
+        "get_unanswered_mentions groups every unanswered mention by author to "
+        "find the newest per author; ignoring duplicates keeps that set near "
+        "one mention per pending author",
+    ("aggregate", "mentions", "$match > $group"):
+        "blocking counts the blocked users' pending mentions for author_stats; "
+        "the update_many that follows ignores the same documents",
+}
+
+READ_COMMANDS = {"find", "aggregate", "count", "distinct"}
+
+
+class CommandRecorder(monitoring.CommandListener):
+    """Collects explainable commands sent to one database while recording is on."""
+
+    def __init__(self, database: str):
+        self.database = database
+        self.recording = False
+        self.commands: List[Tuple[str, Dict[str, Any]]] = []
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if self.recording and event.database_name == self.database and event.command_name in EXPLAINABLE_COMMANDS:
+            self.commands.append((event.command_name, dict(event.command)))
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+async def seed(db, mentions: int, tweets: int, authors: int) -> None:
+    """Insert tweets, mentions, blocked users, jobs and sync state shaped like the models' to_dict()."""
+    for name in ("tweets", "mentions", "blocked_users", "author_stats", "sync_state", "jobs", "actions"):
+        await db[name].drop()
+
+    start = datetime.utcnow() - timedelta(days=365)
+    print(f"Seeding {mentions:,} mentions and {tweets:,} tweets from {authors:,} authors into {db.name} ...")
+
+    for collection, total, doc_type in (("mentions", mentions, "mention"), ("tweets", tweets, "regular")):
+        step = timedelta(days=365) / total
+        for batch_start in range(0, total, BATCH_SIZE):
+            batch = []
+            for i in range(batch_start, min(batch_start + BATCH_SIZE, total)):
+                # Zipf-like authors: a few very active, a long tail of occasional ones
+                author = f"user_{int(random.paretovariate(1.2) * 10) % authors}"
+                tweet_id = str(1_800_000_000_000_000_000 + i + (0 if doc_type == "mention" else 10 ** 12))
+                seen_at = start + step * i
+                doc = {
+                    "idTweet": str(uuid.uuid4()),
+                    "tweetId": tweet_id,
+                    "text": f"synthetic {doc_type} {i}",
+                    "authorUsername": author,
+                    "createdAt": seen_at,
+                    "url": f"https://x.com/{author}/status/{tweet_id}",
+                    "type": doc_type,
+                    "repliedTo": random.random() < 0.25,
+                    "repostedByUs": False,
+                    "ignored": random.random() < 0.1,
+                    "firstSeenAt": seen_at,
+                    "lastUpdatedAt": seen_at
+                }
+                if doc_type == "mention":
+                    doc["mentionedUsers"] = ["@bot"]
+                    doc["account"] = ACCOUNTS[i % len(ACCOUNTS)]
+                batch.append(doc)
+            await db[collection].insert_many(batch, ordered=False)
+
+    await db.blocked_users.insert_many([
+        BlockedUser(
+            username=f"blocked_{i}",
+            blocked_at=start,
+            blocked_reason=BlockedReason.EXCESSIVE_MENTIONS
+        ).to_dict()
+        for i in range(200)
+    ])
+
+    jobs = [Job(action="post_tweet", params={"text": f"job {i}"}) for i in range(2_000)]
+    for job in jobs:
+        job.status = JobStatus.SUCCEEDED
+    await db.jobs.insert_many([job.to_dict() for job in jobs])
+
+    await db.sync_state.insert_one({"source": "mentions:default", "highWaterId": 1_800_000_000_000_000_000})
+    print("Seeded")
+
+
+async def sample(db) -> Dict[str, Any]:
+    """Pick real IDs and authors from the seeded data for the scenarios."""
+    mention = await db.mentions.find_one({"account": ACCOUNTS[0], "repliedTo": False, "ignored": False})
+    tweet = await db.tweets.find_one({})
+    busy_authors = [row async for row in db.mentions.aggregate([
+        {"$match": {"repliedTo": False, "ignored": False}},
+        {"$group": {"_id": "$authorUsername", "n": {"$sum": 1}}},
+        {"$sort": {"n": -1}},
+        {"$limit": 6}
+    ])]
+    pending = [doc["idTweet"] async for doc in db.mentions.find(
+        {"repliedTo": False, "ignored": False}, {"idTweet": 1}
+    ).limit(50)]
+    job = await db.jobs.find_one({})
+    return {
+        "mention": mention,
+        "tweet": tweet,
+        "busy_authors": [row["_id"] for row in busy_authors],
+        "pending_ids": pending,
+        "job_id": job["jobId"]
+    }
+
+
+def scenarios(repo: MongoRepository, data: Dict[str, Any]) -> List[Tuple[str, Callable[[], Awaitable[Any]]]]:
+    """Repository calls to record, in order (later ones may see earlier writes)."""
+    mention, tweet, authors = data["mention"], data["tweet"], data["busy_authors"]
+    author = authors[0]
+    account = ACCOUNTS[0]
+    return [
+        ("get_tweet_by_id_tweet", lambda: repo.get_tweet_by_id_tweet(tweet["idTweet"])),
+        ("get_tweet_by_twitter_id", lambda: repo.get_tweet_by_twitter_id(tweet["tweetId"])),
+        ("get_unanswered_tweets_from_user", lambda: repo.get_unanswered_tweets_from_user(tweet["authorUsername"], 20)),
+        ("get_mention_by_id_tweet", lambda: repo.get_mention_by_id_tweet(mention["idTweet"])),
+        ("get_mention_by_twitter_id", lambda: repo.get_mention_by_twitter_id(mention["tweetId"], account)),
+        ("get_unanswered_mentions (abuse filter)", lambda: repo.get_unanswered_mentions(20, account=account)),
+        ("get_unanswered_mentions (username)", lambda: repo.get_unanswered_mentions(20, username=author, account=account)),
+        ("get_unanswered_mentions (no filter)", lambda: repo.get_unanswered_mentions(20, apply_abuse_filter=False, account=account)),
+        ("mark_mentions_as_ignored", lambda: repo.mark_mentions_as_ignored(data["pending_ids"][:20], IgnoredReason.MANUAL)),
+        ("mark_mention_as_replied", lambda: repo.mark_mention_as_replied(mention["idTweet"], "1")),
+        ("get_author_stats", lambda: repo.get_author_stats(author)),
+        ("check_and_block_user", lambda: repo.check_and_block_user(author)),
+        ("block_users_over_threshold", lambda: repo.block_users_over_threshold(authors)),
+        ("get_high_water_mark", lambda: repo.get_high_water_mark("mentions:default")),
+        ("advance_high_water_mark", lambda: repo.advance_high_water_mark("mentions:default", "1900000000000000000")),
+        ("get_job", lambda: repo.get_job(data["job_id"])),
+        ("fail_interrupted_jobs", lambda: repo.fail_interrupted_jobs()),
+    ]
+
+
+def command_shape(command_name: str, command: Dict[str, Any]) -> str:
+    """An aggregation's stage names ("$match > $group"); empty for other commands."""
+    if command_name != "aggregate":
+        return ""
+    return " > ".join(next(iter(stage)) for stage in command.get("pipeline") or [])
+
+
+async def useful_count(db, command_name: str, command: Dict[str, Any]) -> int:
+    """
+    Documents a read is for, to compare with docs examined.
+
+    Aggregations are re-run and their results counted, so a top-N pipeline
+    is measured against N rather than against its leading $match. count and
+    distinct are measured against the documents they match.
+    """
+    collection = db[command[command_name]]
+    if command_name == "aggregate":
+        return len([doc async for doc in collection.aggregate(command.get("pipeline") or [], allowDiskUse=True)])
+    return await collection.count_documents(command.get("filter") or command.get("query") or {})
+
+
+async def check_command(db, command_name: str, command: Dict[str, Any]) -> Tuple[bool, str]:
+    """Explain one recorded command and check its plan."""
+    collection = command.get(command_name)
+    explain = await db.command("explain", explainable_command(command_name, command), verbosity="executionStats")
+    plan = summarize_plan(explain)
+    shape = command_shape(command_name, command)
+    detail = f"{command_name} {collection}{f' [{shape}]' if shape else ''}: {plan['plan']} {','.join(plan['indexes']) or '-'}"
+    exemption = FULL_SCANS_BY_DESIGN.get((command_name, collection, shape))
+
+    if plan["plan"] == "COLLSCAN" and not exemption:
+        return False, f"{detail} (collection scan)"
+
+    if command_name in READ_COMMANDS and plan.get("docs_examined") is not None:
+        examined = plan["docs_examined"]
+        if command_name == "find":
+            # Limited finds stop early; what they return is what they needed
+            returned = plan.get("n_returned") or 0
+        else:
+            returned = await useful_count(db, command_name, command)
+        detail += f" examined={examined} returned={returned}"
+        budget = max(MAX_EXAMINED_RATIO * returned, MIN_EXAMINED_BUDGET)
+        if examined > budget:
+            if not exemption:
+                return False, f"{detail} (ratio above {MAX_EXAMINED_RATIO})"
+            detail += f" (by design: {exemption})"
+
+    return True, detail
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mentions", type=int, default=200_000)
+    parser.add_argument("--tweets", type=int, default=50_000)
+    parser.add_argument("--authors", type=int, default=20_000)
+    parser.add_argument("--db", default=f"{config.MONGO_DB}_query_plans")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--drop", action="store_true")
+    args = parser.parse_args()
+
+    recorder = CommandRecorder(args.db)
+    client = AsyncIOMotorClient(config.get_mongo_uri(), event_listeners=[recorder])
+    db = client[args.db]
+    repo = None
+
+    try:
+        if args.drop:
+            await client.drop_database(args.db)
+            print(f"Dropped {args.db}")
+            return 0
+
+        if not args.skip_seed:
+            await seed(db, args.mentions, args.tweets, args.authors)
+
+        # MongoRepository picks its database from config
+        config.MONGO_DB = args.db
+        repo = MongoRepository(client)
+        await repo.initialize()
+        if not args.skip_seed:
+            await repo.rebuild_author_stats()
+        data = await sample(db)
+
+        failures = 0
+        print("\n" + "=" * 70)
+        print("Query plans")
+        print("=" * 70)
+        for name, call in scenarios(repo, data):
+            recorder.commands.clear()
+            recorder.recording = True
+            try:
+                await call()
+            finally:
+                recorder.recording = False
+
+            print(f"\n{name}")
+            if not recorder.commands:
+                print("   (no explainable commands)")
+            for command_name, command in recorder.commands:
+                ok, detail = await check_command(db, command_name, command)
+                print(f"   {'✓' if ok else '✗'} {detail}")
+                failures += 0 if ok else 1
+
+        print("\n" + "=" * 70)
+        if failures:
+            print(f"❌ {failures} command(s) failed the plan checks")
+            return 1
+        print("✅ All repository queries use an index")
+        return 0
+    finally:
+        if repo:
+            await repo.close()  # Also closes the client
+        else:
+            client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
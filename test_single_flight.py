@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test script for SingleFlight read coalescing.
+
+Runs offline - no browser, API server or MongoDB needed.
+
+Usage:
+    python test_single_flight.py
+"""
+
+import asyncio
+import sys
+from src.domain.interfaces import TwitterRepositoryError
+from src.infrastructure.single_flight import SingleFlight
+
+
+def print_test(name):
+    """Print test name header"""
+    print(f"\n{'='*70}")
+    print(f"TEST: {name}")
+    print(f"{'='*70}")
+
+
+class CountingRead:
+    """Read that records its calls and returns items 0..count-1 after a gate opens."""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.gate = asyncio.Event()
+        self.error = error
+
+    async def __call__(self, count):
+        self.calls.append(count)
+        await self.gate.wait()
+        if self.error:
+            raise self.error
+        return list(range(count))
+
+
+def test_join_covering_call():
+    """A caller joins an in-flight call started with a count >= its own"""
+    print_test("Join an in-flight call")
+
+    async def run():
+        flight = SingleFlight()
+        read = CountingRead()
+        first = asyncio.ensure_future(flight.do(("read", "alice"), 10, read))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.do(("read", "alice"), 5, read))
+        await asyncio.sleep(0)
+        assert flight.in_flight == 1, f"expected 1 call in flight, got {flight.in_flight}"
+        read.gate.set()
+        return await first, await second, read.calls, flight
+
+    first, second, calls, flight = asyncio.run(run())
+    print(f"Calls: {calls}, shared: {flight.shared_count}")
+
+    assert calls == [10], f"expected one read of 10, got {calls}"
+    assert first == list(range(10))
+    assert second == list(range(5)), "joined caller gets the first `count` items"
+    assert flight.shared_count == 1
+    assert flight.in_flight == 0, "finished calls are forgotten"
+
+    print("✅ PASSED: second caller served by the first call, trimmed to its count")
+    return True
+
+
+def test_no_join():
+    """Larger counts and other keys start their own call"""
+    print_test("Do not join a smaller call or another key")
+
+    async def run():
+        flight = SingleFlight()
+        read = CountingRead()
+        small = asyncio.ensure_future(flight.do(("read", "alice"), 5, read))
+        await asyncio.sleep(0)
+        large = asyncio.ensure_future(flight.do(("read", "alice"), 10, read))
+        other = asyncio.ensure_future(flight.do(("read", "bob"), 5, read))
+        await asyncio.sleep(0)
+        in_flight = flight.in_flight
+        read.gate.set()
+        return await small, await large, await other, read.calls, in_flight, flight
+
+    small, large, other, calls, in_flight, flight = asyncio.run(run())
+    print(f"Calls: {calls}, in flight at peak: {in_flight}")
+
+    assert sorted(calls) == [5, 5, 10], f"expected three reads, got {calls}"
+    assert in_flight == 3
+    assert len(small) == 5 and len(large) == 10 and len(other) == 5
+    assert flight.shared_count == 0
+
+    # Once a call finished, the same key starts a new one
+    async def again():
+        read = CountingRead()
+        read.gate.set()
+        await flight.do(("read", "alice"), 5, read)
+        return read.calls
+
+    assert asyncio.run(again()) == [5], "a finished call is not reused"
+
+    print("✅ PASSED: only covering in-flight calls are joined")
+    return True
+
+
+def test_error_delivered_to_all():
+    """An error reaches every caller that joined the call"""
+    print_test("Errors reach every joined caller")
+
+    async def run():
+        flight = SingleFlight()
+        read = CountingRead(error=TwitterRepositoryError("Timeout", "TIMEOUT"))
+        callers = [asyncio.ensure_future(flight.do("key", 5, read)) for _ in range(3)]
+        await asyncio.sleep(0)
+        read.gate.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        return results, read.calls, flight
+
+    results, calls, flight = asyncio.run(run())
+    print(f"Results: {[type(r).__name__ for r in results]}")
+
+    assert calls == [5]
+    assert all(isinstance(r, TwitterRepositoryError) and r.error_code == "TIMEOUT" for r in results)
+    assert flight.in_flight == 0, "a failed call is forgotten"
+
+    print("✅ PASSED: one failure, raised to all three callers")
+    return True
+
+
+def test_cancelled_caller_does_not_cancel_call():
+    """Cancelling one caller leaves the shared call running for the others"""
+    print_test("Cancelled caller does not cancel the shared call")
+
+    async def run():
+        flight = SingleFlight()
+        read = CountingRead()
+        leaving = asyncio.ensure_future(flight.do("key", 5, read))
+        await asyncio.sleep(0)
+        staying = asyncio.ensure_future(flight.do("key", 5, read))
+        await asyncio.sleep(0)
+        leaving.cancel()
+        await asyncio.sleep(0)
+        read.gate.set()
+        return await staying, leaving.cancelled(), read.calls
+
+    result, cancelled, calls = asyncio.run(run())
+    print(f"Result: {result}, first caller cancelled: {cancelled}")
+
+    assert cancelled
+    assert result == list(range(5))
+    assert calls == [5]
+
+    print("✅ PASSED: shielded call completed for the remaining caller")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("SingleFlight Tests")
+
+    tests = [
+        ("Join an in-flight call", test_join_covering_call),
+        ("Do not join a smaller call or another key", test_no_join),
+        ("Errors reach every joined caller", test_error_delivered_to_all),
+        ("Cancelled caller does not cancel the shared call", test_cancelled_caller_does_not_cancel_call),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((test_name, passed))
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            results.append((test_name, False))
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            results.append((test_name, False))
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+
+    passed_count = sum(1 for _, passed in results if passed)
+    total_count = len(results)
+
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {test_name}")
+
+    print("-" * 60)
+    print(f"Results: {passed_count}/{total_count} tests passed")
+
+    sys.exit(0 if passed_count == total_count else 1)
+
+
+if __name__ == "__main__":
+    main()
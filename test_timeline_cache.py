@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Test script for the timeline cache (TTL, stale-while-revalidate, LRU by bytes).
+
+Entries are aged by seeding the in-memory store with an old `stored_at`,
+so nothing sleeps. Runs offline - no browser, API server or Redis needed.
+
+Usage:
+    python test_timeline_cache.py
+"""
+
+import asyncio
+import copy
+import sys
+import time
+from typing import List, Optional
+from src.config import config
+from src.domain.interfaces import ITwitterRepository
+from src.domain.models import Tweet
+from src.infrastructure.timeline_cache import CachedTimeline, CachingTwitterRepository, InMemoryTimelineStore
+
+TTL = 60
+STALE = 300
+
+
+def print_test(name):
+    """Print test name header"""
+    print(f"\n{'='*70}")
+    print(f"TEST: {name}")
+    print(f"{'='*70}")
+
+
+def make_tweets(username: str, count: int, marker: str = "live") -> List[Tweet]:
+    return [
+        Tweet(id=str(1800000000000000000 - i), text=f"{marker} {i}", author_username=username)
+        for i in range(count)
+    ]
+
+
+class FakeTimelineRepo(ITwitterRepository):
+    """Profile reads only; records every read that reaches it."""
+
+    def __init__(self):
+        self.reads = []
+
+    def for_account(self, account: Optional[str]) -> 'FakeTimelineRepo':
+        # Like RemoteTwitterRepository: a proxy per name, recording into the same list
+        return self if account is None else copy.copy(self)
+
+    async def read_last_tweets(self, username: str, count: int) -> List[Tweet]:
+        self.reads.append((username, count))
+        await asyncio.sleep(0)
+        return make_tweets(username, count)
+
+    async def read_last_mentions(self, count: int, since_id: Optional[str] = None) -> List[Tweet]:
+        raise NotImplementedError
+
+    async def reply_to_tweet(self, tweet_id, text):
+        raise NotImplementedError
+
+    async def retweet(self, tweet_id):
+        raise NotImplementedError
+
+    async def post_tweet(self, text):
+        raise NotImplementedError
+
+    async def quote_tweet(self, tweet_id, text):
+        raise NotImplementedError
+
+
+async def seed(store: InMemoryTimelineStore, username: str, count: int, age: float) -> None:
+    """Put an entry of the given age in the store, as a read `age` seconds ago would have."""
+    entry = CachedTimeline(tweets=make_tweets(username, count, "cached"), count=count, stored_at=time.time() - age)
+    await store.set(f"{config.resolve_account(None)}:{username.lower()}", entry.to_bytes(), TTL + STALE)
+
+
+def test_fresh_hit_and_miss():
+    """A fresh entry is served without a read; a larger count reads through"""
+    print_test("Fresh hit, then a miss for a larger count")
+
+    async def run():
+        inner = FakeTimelineRepo()
+        cache = CachingTwitterRepository(inner, InMemoryTimelineStore(1_000_000), TTL, STALE)
+        miss = await cache.read_last_tweets("alice", 5)
+        hit = await cache.read_last_tweets("alice", 3)
+        larger = await cache.read_last_tweets("alice", 10)
+        return miss, hit, larger, inner.reads, cache.stats()
+
+    miss, hit, larger, reads, stats = asyncio.run(run())
+    print(f"Reads: {reads}, stats: {stats}")
+
+    assert reads == [("alice", 5), ("alice", 10)], f"unexpected reads {reads}"
+    assert miss.cache_age_seconds == 0.0
+    assert len(hit) == 3 and hit.cache_age_seconds < TTL
+    assert [t.id for t in hit] == [t.id for t in miss[:3]], "a hit is a prefix of the cached read"
+    assert len(larger) == 10
+    assert stats["hits"] == 1 and stats["misses"] == 2
+
+    print("✅ PASSED: hit served from the store, larger count read through")
+    return True
+
+
+def test_stale_while_revalidate():
+    """A stale entry is served at once and refreshed by one background read"""
+    print_test("Stale entry served while one refresh runs")
+
+    async def run():
+        inner = FakeTimelineRepo()
+        store = InMemoryTimelineStore(1_000_000)
+        cache = CachingTwitterRepository(inner, store, TTL, STALE)
+        await seed(store, "alice", 5, age=TTL + 10)
+
+        first, second = await asyncio.gather(
+            cache.read_last_tweets("alice", 5),
+            cache.read_last_tweets("alice", 5)
+        )
+        while cache.stats()["refreshing"]:
+            await asyncio.sleep(0)
+        refreshed = CachedTimeline.from_bytes(await store.get(f"{config.resolve_account(None)}:alice"))
+        return first, second, inner.reads, refreshed, cache.stats()
+
+    first, second, reads, refreshed, stats = asyncio.run(run())
+    print(f"Reads: {reads}, stats: {stats}")
+
+    assert first[0].text.startswith("cached") and second[0].text.startswith("cached")
+    assert first.cache_age_seconds >= TTL, "stale reads report their age"
+    assert reads == [("alice", 5)], f"expected a single refresh, got {reads}"
+    assert refreshed.tweets[0].text.startswith("live"), "the refresh replaced the entry"
+    assert stats["stale_hits"] == 2 and stats["misses"] == 0
+
+    print("✅ PASSED: two stale hits, one background refresh")
+    return True
+
+
+def test_expired_entry_reads_through():
+    """Past TTL + stale window, the entry is ignored"""
+    print_test("Expired entry reads through")
+
+    async def run():
+        inner = FakeTimelineRepo()
+        store = InMemoryTimelineStore(1_000_000)
+        cache = CachingTwitterRepository(inner, store, TTL, STALE)
+        await seed(store, "alice", 5, age=TTL + STALE + 1)
+        tweets = await cache.read_last_tweets("alice", 5)
+        return tweets, inner.reads, cache.stats()
+
+    tweets, reads, stats = asyncio.run(run())
+    print(f"Reads: {reads}, stats: {stats}")
+
+    assert reads == [("alice", 5)]
+    assert tweets[0].text.startswith("live") and tweets.cache_age_seconds == 0.0
+    assert stats["misses"] == 1 and stats["stale_hits"] == 0
+
+    print("✅ PASSED: expired entry treated as a miss")
+    return True
+
+
+def test_default_account_shares_entries():
+    """None and the default account's name read the same entry"""
+    print_test("Default account shares entries with None")
+
+    async def run():
+        inner = FakeTimelineRepo()
+        cache = CachingTwitterRepository(inner, InMemoryTimelineStore(1_000_000), TTL, STALE)
+        await cache.read_last_tweets("alice", 5)
+        await cache.for_account(config.resolve_account(None)).read_last_tweets("alice", 5)
+        await cache.for_account("other_bot").read_last_tweets("alice", 5)
+        return inner.reads, cache.stats()
+
+    reads, stats = asyncio.run(run())
+    print(f"Reads: {reads}, stats: {stats}")
+
+    assert reads == [("alice", 5), ("alice", 5)], "the default account's name must hit the entry read with None"
+    assert stats["hits"] == 1 and stats["misses"] == 2
+
+    print("✅ PASSED: one entry for the default account, another for other_bot")
+    return True
+
+
+def test_lru_eviction_by_bytes():
+    """The store evicts least recently used entries past max_bytes"""
+    print_test("LRU eviction by bytes")
+
+    async def run():
+        entry = CachedTimeline(tweets=make_tweets("x", 5), count=5, stored_at=time.time()).to_bytes()
+        store = InMemoryTimelineStore(max_bytes=len(entry) * 2)
+        await store.set("a", entry, TTL)
+        await store.set("b", entry, TTL)
+        await store.get("a")  # "b" is now the least recently used
+        await store.set("c", entry, TTL)
+        await store.set("huge", entry * 3, TTL)  # Larger than the store, never kept
+        return [await store.get(key) is not None for key in ("a", "b", "c", "huge")], store.stats()
+
+    present, stats = asyncio.run(run())
+    print(f"Present a/b/c/huge: {present}, stats: {stats}")
+
+    assert present == [True, False, True, False], f"unexpected entries {present}"
+    assert stats["entries"] == 2 and stats["bytes"] <= stats["max_bytes"]
+
+    print("✅ PASSED: least recently used entry evicted, oversized entry skipped")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("Timeline Cache Tests")
+
+    tests = [
+        ("Fresh hit, then a miss for a larger count", test_fresh_hit_and_miss),
+        ("Stale entry served while one refresh runs", test_stale_while_revalidate),
+        ("Expired entry reads through", test_expired_entry_reads_through),
+        ("Default account shares entries with None", test_default_account_shares_entries),
+        ("LRU eviction by bytes", test_lru_eviction_by_bytes),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((test_name, passed))
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            results.append((test_name, False))
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            results.append((test_name, False))
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+
+    passed_count = sum(1 for _, passed in results if passed)
+    total_count = len(results)
+
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status} - {test_name}")
+
+    print("-" * 60)
+    print(f"Results: {passed_count}/{total_count} tests passed")
+
+    sys.exit(0 if passed_count == total_count else 1)
+
+
+if __name__ == "__main__":
+    main()
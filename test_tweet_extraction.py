@@ -85,7 +85,7 @@ async def test_tweet_extraction(username: str = "elonmusk", count: int = 5):
             print("⚠ No tweets extracted!")
             print()
             print("Debugging steps:")
-            print("1. Check if 'debug_no_tweets.png' was created")
+            print("1. Run with LOG_LEVEL=DEBUG and check how many rounds were harvested")
             print("2. Look at the browser window - do you see tweets?")
             print("3. Check the logs above for errors")
             print("4. Try a different username (e.g., 'twitter' or 'X')")